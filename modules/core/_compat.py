@@ -0,0 +1,83 @@
+"""Compatibility helpers for the Python versions and optional packages the simulator supports."""
+
+import json
+import sys
+from datetime import date
+from typing import Any, Callable, Optional, Union
+
+# ``dataclass(slots=True)`` is only available from Python 3.10; older
+# interpreters keep the regular per-instance ``__dict__``.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def json_default(obj: Any) -> Any:
+    """Fallback encoder matching orjson's output for dates, ``str()`` otherwise.
+
+    orjson writes datetimes natively as ISO 8601 and never calls this for
+    them; the standard library does, so both backends produce the same text.
+    """
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+
+def json_dumps(data: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed.
+
+    Args:
+        data: Data to serialize
+        indent: Whether to pretty-print with two-space indentation
+        default: Fallback for objects JSON cannot represent natively; by
+            default such objects raise TypeError
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return json_dumps_bytes(data, indent, default).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, default=default)
+
+
+def json_dumps_bytes(data: Any, indent: bool = False,
+                     default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Takes the same arguments as json_dumps, for writing to binary files
+    without an intermediate str.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=default)
+    return json.dumps(data, indent=2 if indent else None, default=default).encode('utf-8')
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
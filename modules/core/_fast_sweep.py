@@ -0,0 +1,52 @@
+"""Batched round arithmetic for Monte-Carlo and sensitivity sweeps.
+
+Evaluates the decision-driven part of a round (pricing and marketing
+impacts on revenue and profit) for many simulations at once, without
+events or company state.
+"""
+
+import numpy as np
+from ._compat import HAS_NUMBA, njit, prange
+from .round_manager import (BASE_COSTS, BASE_REVENUE, RoundManager, _marketing_impact,
+                            _pricing_impact, marketing_impacts, pricing_impacts)
+
+
+@njit(parallel=True, cache=True)
+def _sweep_kernel(prices, budgets, base_revenue, base_costs, out_profit):
+    for i in prange(prices.shape[0]):
+        for r in range(prices.shape[1]):
+            revenue = base_revenue * _pricing_impact(prices[i, r])
+            revenue *= 1.0 + _marketing_impact(budgets[i, r])
+            out_profit[i, r] = revenue - base_costs
+
+
+def sweep(prices: np.ndarray, budgets: np.ndarray, base_revenue: float = BASE_REVENUE,
+          base_costs: float = BASE_COSTS) -> np.ndarray:
+    """Calculate per-round profit for a grid of pricing and marketing decisions.
+
+    Args:
+        prices: Prices with shape (num_sims, num_rounds)
+        budgets: Marketing budgets with the same shape as prices
+        base_revenue: Revenue before decision impacts
+        base_costs: Costs per round
+
+    Returns:
+        Profit array with shape (num_sims, num_rounds)
+
+    Raises:
+        ValueError: If the inputs are not matching 2-D arrays
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    budgets = np.ascontiguousarray(budgets, dtype=np.float64)
+    if prices.ndim != 2 or prices.shape != budgets.shape:
+        raise ValueError("prices and budgets must be 2-D arrays of the same shape")
+
+    if not HAS_NUMBA:
+        results = RoundManager().calculate_round_results_batch(
+            pricing_impacts(prices), marketing_impacts(budgets),
+            base_revenue, base_costs)
+        return results['profit']
+
+    out_profit = np.empty_like(prices)
+    _sweep_kernel(prices, budgets, base_revenue, base_costs, out_profit)
+    return out_profit
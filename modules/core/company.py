@@ -2,9 +2,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import copy
+from ._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FinancialData:
     """Financial attributes of the company."""
     revenue: float = 0.0
@@ -16,7 +17,7 @@ class FinancialData:
     cash: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OperationsData:
     """Operational attributes of the company."""
     capacity: float = 1000.0
@@ -26,7 +27,7 @@ class OperationsData:
     utilization: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResourceData:
     """Resource attributes of the company."""
     employees: int = 100
@@ -34,7 +35,7 @@ class ResourceData:
     inventory: float = 50000.0   # Value of inventory
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketData:
     """Market position attributes of the company."""
     market_share: float = 0.15
@@ -131,7 +132,7 @@ class DecisionManager:
         decision_record = {
             'type': decision_type,
             'params': params,
-            'timestamp': datetime.now(),
+            'timestamp': datetime.now().isoformat(),
             'round': params.get('round', 0)
         }
         self.decision_history.append(decision_record)
@@ -281,7 +282,7 @@ class Company:
     def _record_performance(self):
         """Record current performance metrics."""
         current_metrics = {
-            'timestamp': datetime.now(),
+            'timestamp': datetime.now().isoformat(),
             'revenue': self.financial_data.revenue,
             'profit': self.financial_data.profit,
             'market_share': self.market_data.market_share,
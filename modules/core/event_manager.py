@@ -1,8 +1,38 @@
 import random
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+import numpy as np
+from ._compat import DATACLASS_SLOTS
+
+# Round result metrics events can affect, in impact-vector order. The first
+# three take percentage impacts, the rest are shares clamped to [0, 1].
+IMPACT_METRICS = ('revenue', 'costs', 'profit', 'market_share', 'customer_satisfaction')
+NUM_MULTIPLICATIVE_METRICS = 3
+_IMPACT_METRIC_INDEX = {metric: i for i, metric in enumerate(IMPACT_METRICS)}
+
+# How each metric takes an impact: percentage, additive share, or generic
+# percentage for metrics outside IMPACT_METRICS
+IMPACT_PERCENTAGE, IMPACT_ADDITIVE, IMPACT_GENERIC = 0, 1, 2
+IMPACT_KIND = {
+    metric: IMPACT_PERCENTAGE if i < NUM_MULTIPLICATIVE_METRICS else IMPACT_ADDITIVE
+    for i, metric in enumerate(IMPACT_METRICS)
+}
+
+
+def impact_vector(impacts: Dict[str, float]) -> np.ndarray:
+    """Convert a metric -> impact mapping into an IMPACT_METRICS-ordered vector.
+
+    Metrics outside IMPACT_METRICS are ignored.
+    """
+    vector = np.zeros(len(IMPACT_METRICS))
+    for metric, impact in impacts.items():
+        index = _IMPACT_METRIC_INDEX.get(metric)
+        if index is not None:
+            vector[index] += impact
+    return vector
 
 
 class EventType(Enum):
@@ -11,7 +41,7 @@ class EventType(Enum):
     DECISION = "decision"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Event:
     """Represents a simulation event with its properties and effects."""
     id: str
@@ -51,6 +81,41 @@ class EventManager:
         self.active_events: List[Dict[str, Any]] = []
         self.event_history: List[Dict[str, Any]] = []
         self.event_definitions: Dict[str, Event] = self._load_default_events()
+        self._event_counter = 0
+        self._reset_clock()
+        self._reset_impact_vector()
+
+    def _reset_impact_vector(self):
+        """Start the running impact total over for the current active events list."""
+        # Plain floats: per-event updates on five metrics are cheaper than numpy
+        self._impact_totals = [0.0] * len(IMPACT_METRICS)
+        self._impact_events = self.active_events
+        self._impact_count = 0
+
+    def _track_impact(self, impacts: Dict[str, float], sign: int):
+        """Add (sign=1) or remove (sign=-1) one event's impacts from the running total.
+
+        If active_events was changed from outside since the last update, the
+        total is marked stale instead and rebuilt on the next read.
+        """
+        if self._impact_events is self.active_events and self._impact_count + sign == len(self.active_events):
+            self._add_impacts(impacts, sign)
+            self._impact_count += sign
+        else:
+            self._impact_count = -1
+
+    def _add_impacts(self, impacts: Dict[str, float], sign: int = 1):
+        """Add one event's IMPACT_METRICS impacts to the running total."""
+        totals = self._impact_totals
+        for metric, impact in impacts.items():
+            index = _IMPACT_METRIC_INDEX.get(metric)
+            if index is not None:
+                totals[index] += sign * impact
+
+    def _reset_clock(self):
+        """Anchor the monotonic clock to wall time so history stamps can be derived on export."""
+        self._epoch_wall = datetime.now()
+        self._epoch_ns = time.perf_counter_ns()
 
     def _load_default_events(self) -> Dict[str, Event]:
         """Load default event definitions."""
@@ -132,10 +197,13 @@ class EventManager:
         }
 
         self.active_events.append(event_data)
+        self._track_impact(event.impact, 1)
+        self._event_counter += 1
         self.event_history.append({
             'event_id': event.id,
             'triggered_round': round_number,
-            'timestamp': datetime.now().isoformat()
+            'seq': self._event_counter,
+            'clock_ns': time.perf_counter_ns()
         })
 
         return event_data
@@ -143,14 +211,19 @@ class EventManager:
     def process_active_events(self) -> List[Dict[str, Any]]:
         """Process active events and apply their effects. Returns expired events."""
         expired_events = []
+        active_events = self.active_events
 
-        for event_data in self.active_events[:]:  # Copy to avoid modification during iteration
+        # Walk backwards so deleting an expired entry never shifts one still to be visited
+        for i in range(len(active_events) - 1, -1, -1):
+            event_data = active_events[i]
             event_data['remaining_duration'] -= 1
 
             if event_data['remaining_duration'] <= 0:
                 expired_events.append(event_data)
-                self.active_events.remove(event_data)
+                del active_events[i]
+                self._track_impact(event_data['event'].get('impact', {}), -1)
 
+        expired_events.reverse()  # Report expirations in trigger order
         return expired_events
 
     def get_active_event_impacts(self) -> Dict[str, float]:
@@ -168,9 +241,46 @@ class EventManager:
 
         return total_impacts
 
-    def get_event_history(self) -> List[Dict[str, Any]]:
-        """Get the history of triggered events."""
-        return self.event_history.copy()
+    def get_active_impact_vector(self) -> Tuple[float, ...]:
+        """Get the combined active event impacts as an IMPACT_METRICS-ordered vector.
+
+        The total is kept up to date as events trigger and expire, so this is
+        constant time unless active_events was replaced or edited directly.
+        Batch consumers can pass the result to np.asarray.
+        """
+        if self._impact_events is not self.active_events or self._impact_count != len(self.active_events):
+            self._reset_impact_vector()
+            for event_data in self.active_events:
+                self._add_impacts(event_data['event'].get('impact', {}))
+            self._impact_count = len(self.active_events)
+        elif not self._impact_count:
+            self._reset_impact_vector()  # Drop rounding residue once nothing is active
+
+        return tuple(self._impact_totals)
+
+    def get_event_history(self, include_timestamps: bool = False) -> List[Dict[str, Any]]:
+        """Get the history of triggered events.
+
+        Args:
+            include_timestamps: Convert the monotonic clock readings into ISO
+                timestamps, for saving or display
+
+        Returns:
+            List of event history entries
+        """
+        if not include_timestamps:
+            return self.event_history.copy()
+        return [self._stamp_history_entry(entry) for entry in self.event_history]
+
+    def _stamp_history_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace an entry's monotonic clock reading with a wall-clock ISO timestamp."""
+        if 'clock_ns' not in entry:
+            return dict(entry)  # Restored entries already carry their timestamp
+
+        stamped = {key: value for key, value in entry.items() if key != 'clock_ns'}
+        elapsed = timedelta(microseconds=(entry['clock_ns'] - self._epoch_ns) // 1000)
+        stamped['timestamp'] = (self._epoch_wall + elapsed).isoformat()
+        return stamped
 
     def get_active_events(self) -> List[Dict[str, Any]]:
         """Get currently active events."""
@@ -180,6 +290,23 @@ class EventManager:
         """Reset the event manager to initial state."""
         self.active_events.clear()
         self.event_history.clear()
+        self._event_counter = 0
+        self._reset_clock()
+        self._reset_impact_vector()
+
+    def reset_to(self, active_events: List[Dict[str, Any]], event_history: List[Dict[str, Any]]):
+        """Restore saved events in place, keeping the existing lists and definitions.
+
+        Args:
+            active_events: Active event records to resume with
+            event_history: Event history entries to resume with
+        """
+        self.reset()
+        self.active_events.extend(active_events)
+        self.event_history.extend(event_history)
+        # Continue numbering after the restored entries
+        self._event_counter = max([len(self.event_history)] +
+                                  [entry.get('seq', 0) for entry in self.event_history])
 
     def _check_conditions(self, conditions: Dict[str, Any], round_number: int) -> bool:
         """Check if event conditions are met."""
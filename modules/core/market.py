@@ -1,27 +1,67 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, InitVar
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Union
 from datetime import datetime
 import random
 import math
+import numpy as np
+from ._compat import DATACLASS_SLOTS
 
 
-@dataclass
+ECONOMIC_INDICATORS = ('gdp_growth', 'inflation', 'interest_rate')
+TREND_FACTORS = ('seasonal', 'trend', 'cyclical')
+
+
+def _field_group_view(names):
+    """Build a mapping-valued property over a group of flat MarketState fields.
+
+    Reading returns a read-only mapping, so item assignment raises TypeError
+    instead of being silently lost. Assigning a mapping sets every field in
+    the group, falling back to the field default for names it lacks (so
+    assigning ``{}`` resets the group), and ignores any other keys.
+    """
+    def getter(self) -> Mapping[str, float]:
+        return MappingProxyType({name: getattr(self, name) for name in names})
+
+    def setter(self, values: Mapping[str, float]):
+        fields = self.__dataclass_fields__
+        for name in names:
+            setattr(self, name, values.get(name, fields[name].default))
+
+    return property(getter, setter)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MarketState:
-    """Represents the current state of the market."""
+    """Represents the current state of the market.
+
+    Economic indicators and trend factors are stored as flat float fields.
+    The ``economic_indicators`` and ``trend_factors`` mapping views are kept
+    for serialization and for callers that still pass or assign those dicts.
+    """
     demand_level: float = 1000.0
     price_index: float = 1.0
     competition_intensity: float = 0.5
-    economic_indicators: Dict[str, float] = field(default_factory=lambda: {
-        'gdp_growth': 0.02,
-        'inflation': 0.03,
-        'interest_rate': 0.05
-    })
+    gdp_growth: float = 0.02
+    inflation: float = 0.03
+    interest_rate: float = 0.05
+    seasonal: float = 0.0
+    trend: float = 0.0
+    cyclical: float = 0.0
     active_events: List[Dict[str, Any]] = field(default_factory=list)
-    trend_factors: Dict[str, float] = field(default_factory=lambda: {
-        'seasonal': 0.0,
-        'trend': 0.0,
-        'cyclical': 0.0
-    })
+    # Init-only arguments whose class attributes are the views; an omitted
+    # argument therefore reaches __post_init__ as the view, not None
+    economic_indicators: InitVar[Optional[Mapping[str, float]]] = (
+        _field_group_view(ECONOMIC_INDICATORS))
+    trend_factors: InitVar[Optional[Mapping[str, float]]] = (
+        _field_group_view(TREND_FACTORS))
+
+    def __post_init__(self, economic_indicators: Optional[Mapping[str, float]],
+                      trend_factors: Optional[Mapping[str, float]]):
+        if isinstance(economic_indicators, Mapping):
+            self.economic_indicators = economic_indicators
+        if isinstance(trend_factors, Mapping):
+            self.trend_factors = trend_factors
 
 
 class DemandCalculator:
@@ -57,8 +97,8 @@ class DemandCalculator:
         company_effect = self._calculate_company_effect(company_factors)
 
         # Seasonal and cyclical effects
-        seasonal_effect = 1.0 + market_state.trend_factors['seasonal']
-        cyclical_effect = 1.0 + market_state.trend_factors['cyclical']
+        seasonal_effect = 1.0 + market_state.seasonal
+        cyclical_effect = 1.0 + market_state.cyclical
 
         # Calculate final demand
         demand = (self.base_demand * economic_multiplier * price_effect *
@@ -73,15 +113,15 @@ class DemandCalculator:
 
     def _calculate_economic_multiplier(self, market_state: MarketState) -> float:
         """Calculate multiplier based on economic indicators."""
-        gdp_effect = 1.0 + market_state.economic_indicators['gdp_growth']
-        inflation_effect = 1.0 - (market_state.economic_indicators['inflation'] * 0.5)
-        interest_effect = 1.0 - (market_state.economic_indicators['interest_rate'] * 0.3)
+        gdp_effect = 1.0 + market_state.gdp_growth
+        inflation_effect = 1.0 - (market_state.inflation * 0.5)
+        interest_effect = 1.0 - (market_state.interest_rate * 0.3)
 
         return gdp_effect * inflation_effect * interest_effect
 
     def _calculate_trend_effect(self, market_state: MarketState) -> float:
         """Calculate trend-based demand multiplier."""
-        return 1.0 + market_state.trend_factors['trend']
+        return 1.0 + market_state.trend
 
     def _calculate_company_effect(self, company_factors: Dict[str, Any]) -> float:
         """Calculate company-specific demand effects."""
@@ -100,13 +140,13 @@ class PricingEngine:
         self.price_history: List[float] = []
 
     def calculate_optimal_price(self, market_state: MarketState,
-                               competitor_prices: List[float],
+                               competitor_prices: Union[Sequence[float], np.ndarray],
                                company_costs: float) -> float:
         """Calculate optimal price considering market conditions and competitors.
 
         Args:
             market_state: Current market state
-            competitor_prices: List of competitor prices
+            competitor_prices: Competitor prices, as a list or a NumPy array
             company_costs: Company's cost structure
 
         Returns:
@@ -116,14 +156,15 @@ class PricingEngine:
         cost_plus_price = company_costs * 1.3  # 30% margin
 
         # Market-based pricing
-        avg_competitor_price = sum(competitor_prices) / len(competitor_prices) if competitor_prices else self.base_price
+        prices = np.asarray(competitor_prices, dtype=float)
+        avg_competitor_price = float(prices.mean()) if prices.size > 0 else self.base_price
         market_price = avg_competitor_price * (1.0 + market_state.competition_intensity * 0.1)
 
         # Demand-responsive pricing
         demand_multiplier = 1.0 + (market_state.demand_level / 1000.0 - 1.0) * 0.2
 
         # Economic condition adjustment
-        economic_adjustment = 1.0 + market_state.economic_indicators['inflation']
+        economic_adjustment = 1.0 + market_state.inflation
 
         # Calculate optimal price
         optimal_price = (cost_plus_price * 0.4 + market_price * 0.4 + self.base_price * demand_multiplier * 0.2) * economic_adjustment
@@ -250,23 +291,39 @@ class CompetitorAI:
 
     def _apply_competitor_actions(self, actions: Dict[str, Dict[str, Any]]):
         """Apply decided actions to competitor states."""
-        for comp_id, action in actions.items():
-            competitor = next(c for c in self.competitors if c['id'] == comp_id)
-
-            # Update price
-            competitor['price'] += action.get('price_change', 0.0)
-
-            # Update quality
-            competitor['quality'] = min(1.0, competitor['quality'] + action.get('quality_change', 0.0))
-
-            # Update market share based on actions
-            share_change = action.get('aggressive_move', 0.0) * 0.02  # Small share changes
-            competitor['market_share'] = max(0.01, min(0.5, competitor['market_share'] + share_change))
+        competitors = [c for c in self.competitors if c['id'] in actions]
+        if not competitors:
+            return
+        count = len(competitors)
+        decided = [actions[c['id']] for c in competitors]
+
+        price_change = np.fromiter((a.get('price_change', 0.0) for a in decided), float, count)
+        quality_change = np.fromiter((a.get('quality_change', 0.0) for a in decided), float, count)
+        aggressive_move = np.fromiter((a.get('aggressive_move', 0.0) for a in decided), float, count)
+
+        prices = np.fromiter((c['price'] for c in competitors), float, count)
+        quality = np.fromiter((c['quality'] for c in competitors), float, count)
+        market_share = np.fromiter((c['market_share'] for c in competitors), float, count)
+
+        # Clamp all competitors at once instead of branching per competitor
+        prices += price_change
+        np.clip(quality + quality_change, 0.0, 1.0, out=quality)
+        np.clip(market_share + aggressive_move * 0.02, 0.01, 0.5, out=market_share)  # Small share changes
+
+        for competitor, price, qual, share in zip(competitors, prices.tolist(),
+                                                  quality.tolist(), market_share.tolist()):
+            competitor['price'] = price
+            competitor['quality'] = qual
+            competitor['market_share'] = share
 
     def get_competitor_prices(self) -> List[float]:
         """Get current competitor prices."""
         return [comp['price'] for comp in self.competitors]
 
+    def get_competitor_prices_array(self) -> np.ndarray:
+        """Get current competitor prices as a NumPy array."""
+        return np.fromiter((comp['price'] for comp in self.competitors), float, len(self.competitors))
+
     def get_competitor_summary(self) -> List[Dict[str, Any]]:
         """Get summary of competitor states."""
         return [{
@@ -308,9 +365,9 @@ class TrendAnalyzer:
         cyclical = self._calculate_cyclical_component(round_number)
 
         # Update market state
-        market_state.trend_factors['seasonal'] = seasonal
-        market_state.trend_factors['trend'] = trend
-        market_state.trend_factors['cyclical'] = cyclical
+        market_state.seasonal = seasonal
+        market_state.trend = trend
+        market_state.cyclical = cyclical
 
         # Record in history
         self.trend_history.append({
@@ -431,9 +488,9 @@ class Market:
                 self.state.competition_intensity + impacts['competition_change']))
 
         # Apply economic indicator changes
-        for indicator, change in impacts.items():
-            if indicator in self.state.economic_indicators:
-                self.state.economic_indicators[indicator] += change
+        for indicator in ECONOMIC_INDICATORS:
+            if indicator in impacts:
+                setattr(self.state, indicator, getattr(self.state, indicator) + impacts[indicator])
 
         # Add to active events
         self.state.active_events.append(event)
@@ -461,14 +518,18 @@ class Market:
         """Get current competitor prices."""
         return self.competitor_ai.get_competitor_prices()
 
+    def get_competitor_prices_array(self) -> np.ndarray:
+        """Get current competitor prices as a NumPy array."""
+        return self.competitor_ai.get_competitor_prices_array()
+
     def get_market_summary(self) -> Dict[str, Any]:
         """Get a comprehensive market summary."""
         return {
             'demand_level': self.state.demand_level,
             'price_index': self.state.price_index,
             'competition_intensity': self.state.competition_intensity,
-            'economic_indicators': self.state.economic_indicators,
-            'trend_factors': self.state.trend_factors,
+            'economic_indicators': dict(self.state.economic_indicators),
+            'trend_factors': dict(self.state.trend_factors),
             'active_events': self.state.active_events,
             'competitors': self.competitor_ai.get_competitor_summary(),
             'trend_analysis': self.trend_analyzer.get_trend_summary(),
@@ -483,9 +544,9 @@ class Market:
                 'demand_level': self.state.demand_level,
                 'price_index': self.state.price_index,
                 'competition_intensity': self.state.competition_intensity,
-                'economic_indicators': self.state.economic_indicators,
+                'economic_indicators': dict(self.state.economic_indicators),
                 'active_events': self.state.active_events,
-                'trend_factors': self.state.trend_factors
+                'trend_factors': dict(self.state.trend_factors)
             },
             'round_number': self.round_number,
             'competitors': self.competitor_ai.competitors,
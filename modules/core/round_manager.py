@@ -1,5 +1,40 @@
 from typing import Dict, Any, Optional
+import numpy as np
 from .simulation_state import SimulationState
+from ._compat import njit
+
+# Baseline figures used until the round results use real business logic.
+BASE_REVENUE = 100000.0
+BASE_COSTS = 80000.0
+
+# Shared read-only stand-in for missing decision results; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+
+# Scalar impact kernels, compiled by Numba when it is installed.
+@njit('f8(f8)', cache=True)
+def _pricing_impact(price):
+    return max(0.5, min(1.5, price / 100.0))
+
+
+@njit('f8(f8)', cache=True)
+def _investment_impact(amount):
+    return amount * 0.1  # 10% efficiency improvement per unit invested
+
+
+@njit('f8(f8)', cache=True)
+def _marketing_impact(budget):
+    return min(0.5, budget / 10000.0)  # Max 50% revenue increase
+
+
+def pricing_impacts(prices: np.ndarray) -> np.ndarray:
+    """Apply the pricing impact of _pricing_impact to every element of prices."""
+    return np.clip(np.asarray(prices, dtype=np.float64) / 100.0, 0.5, 1.5)
+
+
+def marketing_impacts(budgets: np.ndarray) -> np.ndarray:
+    """Apply the marketing impact of _marketing_impact to every element of budgets."""
+    return np.minimum(0.5, np.asarray(budgets, dtype=np.float64) / 10000.0)
 
 
 class RoundManager:
@@ -8,6 +43,11 @@ class RoundManager:
     def __init__(self, max_rounds: int = 10):
         self.max_rounds = max_rounds
         self.current_round = 0
+        self._decision_handlers = {
+            'pricing': self._process_pricing_decision,
+            'investment': self._process_investment_decision,
+            'marketing': self._process_marketing_decision
+        }
 
     def advance_round(self) -> int:
         """Advance to the next round. Returns the new round number."""
@@ -24,25 +64,18 @@ class RoundManager:
         Returns:
             Processed decision results
         """
-        # Placeholder for decision processing logic
-        processed_results = {
-            'decisions_processed': len(decisions),
-            'round': self.current_round,
-            'results': {}
-        }
+        results = {}
+        handlers = self._decision_handlers
 
-        # Basic validation and processing
         for decision_type, params in decisions.items():
-            if decision_type == 'pricing':
-                processed_results['results']['pricing'] = self._process_pricing_decision(params)
-            elif decision_type == 'investment':
-                processed_results['results']['investment'] = self._process_investment_decision(params)
-            elif decision_type == 'marketing':
-                processed_results['results']['marketing'] = self._process_marketing_decision(params)
-            else:
-                processed_results['results'][decision_type] = {'status': 'unknown_decision_type'}
+            handler = handlers.get(decision_type)
+            results[decision_type] = handler(params) if handler else {'status': 'unknown_decision_type'}
 
-        return processed_results
+        return {
+            'decisions_processed': len(decisions),
+            'round': self.current_round,
+            'results': results
+        }
 
     def calculate_round_results(self, simulation_state: SimulationState, decisions: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate results for the current round based on decisions and market conditions.
@@ -65,17 +98,19 @@ class RoundManager:
         }
 
         # Placeholder calculations - will be enhanced with actual business logic
-        base_revenue = 100000.0
-        base_costs = 80000.0
+        base_revenue = BASE_REVENUE
+        base_costs = BASE_COSTS
 
         # Apply decision impacts (simplified)
-        if 'pricing' in decisions.get('results', {}):
-            price_multiplier = decisions['results']['pricing'].get('impact', 1.0)
-            results['revenue'] = base_revenue * price_multiplier
+        decision_results = decisions.get('results') or _EMPTY
+
+        pricing = decision_results.get('pricing')
+        if pricing is not None:
+            results['revenue'] = base_revenue * pricing.get('impact', 1.0)
 
-        if 'marketing' in decisions.get('results', {}):
-            marketing_impact = decisions['results']['marketing'].get('impact', 0.0)
-            results['revenue'] *= (1.0 + marketing_impact)
+        marketing = decision_results.get('marketing')
+        if marketing is not None:
+            results['revenue'] *= (1.0 + marketing.get('impact', 0.0))
 
         results['costs'] = base_costs
         results['profit'] = results['revenue'] - results['costs']
@@ -84,6 +119,42 @@ class RoundManager:
 
         return results
 
+    def calculate_round_results_batch(self, price_mult: np.ndarray,
+                                      marketing_impact: np.ndarray,
+                                      base_revenue: float = BASE_REVENUE,
+                                      base_costs: float = BASE_COSTS
+                                      ) -> Dict[str, np.ndarray]:
+        """Calculate round results for many decision sets at once.
+
+        Vectorized counterpart of calculate_round_results for parameter sweeps,
+        where each element is one pricing/marketing combination.
+
+        Args:
+            price_mult: Pricing impacts, one per decision set (see pricing_impacts)
+            marketing_impact: Marketing impacts, one per decision set (see
+                marketing_impacts)
+            base_revenue: Revenue before decision impacts
+            base_costs: Costs per round
+
+        Returns:
+            Dictionary of revenue, costs and profit arrays
+        """
+        price_mult, marketing_impact = np.broadcast_arrays(
+            np.asarray(price_mult, dtype=np.float64),
+            np.asarray(marketing_impact, dtype=np.float64)
+        )
+
+        revenue = base_revenue * price_mult
+        revenue *= 1.0 + marketing_impact
+        costs = np.full_like(revenue, base_costs)
+
+        return {
+            'round': self.current_round,
+            'revenue': revenue,
+            'costs': costs,
+            'profit': revenue - costs
+        }
+
     def is_simulation_over(self) -> bool:
         """Check if the simulation has reached its maximum rounds."""
         return self.current_round >= self.max_rounds
@@ -96,14 +167,23 @@ class RoundManager:
         """Reset the round manager to initial state."""
         self.current_round = 0
 
+    def reset_to(self, current_round: int, max_rounds: Optional[int] = None):
+        """Restore the round manager to a saved position without replacing it.
+
+        Args:
+            current_round: Round number to resume from
+            max_rounds: New round limit, or None to keep the current one
+        """
+        if max_rounds is not None:
+            self.max_rounds = max_rounds
+        self.current_round = current_round
+
     def _process_pricing_decision(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Process pricing decision."""
         price = params.get('price', 100.0)
-        # Simple impact calculation
-        impact = max(0.5, min(1.5, price / 100.0))
         return {
             'price': price,
-            'impact': impact,
+            'impact': _pricing_impact(float(price)),
             'description': f"Pricing set to ${price:.2f}"
         }
 
@@ -112,7 +192,7 @@ class RoundManager:
         amount = params.get('amount', 0.0)
         return {
             'amount': amount,
-            'impact': amount * 0.1,  # 10% efficiency improvement per unit invested
+            'impact': _investment_impact(float(amount)),
             'description': f"Invested ${amount:.2f} in operations"
         }
 
@@ -121,6 +201,6 @@ class RoundManager:
         budget = params.get('budget', 0.0)
         return {
             'budget': budget,
-            'impact': min(0.5, budget / 10000.0),  # Max 50% revenue increase
+            'impact': _marketing_impact(float(budget)),
             'description': f"Marketing budget: ${budget:.2f}"
         }
\ No newline at end of file
@@ -1,33 +1,67 @@
-import json
 import os
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, Iterator, Optional, Sequence, Union
 from dataclasses import dataclass
+import numpy as np
 from .simulation_state import SimulationState
 from .round_manager import RoundManager
-from .event_manager import EventManager, Event
+from .event_manager import (
+    EventManager, Event, IMPACT_GENERIC, IMPACT_KIND, IMPACT_METRICS,
+    NUM_MULTIPLICATIVE_METRICS
+)
 from .company import Company, FinancialData, OperationsData, ResourceData, MarketData
 from .market import Market, MarketState
+from ._compat import DATACLASS_SLOTS, json_dumps, json_loads
+from ._fast_sweep import sweep
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SimulationConfig:
-    """Configuration for the simulation engine."""
+    """Configuration for the simulation engine.
+
+    Immutable; build a new config (or use dataclasses.replace) to change it.
+    """
     max_rounds: int = 10
     num_competitors: int = 3
     initial_market_demand: float = 1000.0
     market_volatility: float = 0.1
     event_frequency: float = 0.3
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the configuration to a dictionary for serialization."""
+        return {
+            'max_rounds': self.max_rounds,
+            'num_competitors': self.num_competitors,
+            'initial_market_demand': self.initial_market_demand,
+            'market_volatility': self.market_volatility,
+            'event_frequency': self.event_frequency
+        }
+
 
 class SimulationEngine:
     """Main simulation engine that orchestrates the simulation flow."""
 
-    def __init__(self, config: SimulationConfig = None):
+    def __init__(self, config: SimulationConfig = None, history_path: Optional[str] = None,
+                 history_window: int = 0):
+        """Create a simulation engine.
+
+        Args:
+            config: Simulation configuration
+            history_path: Optional JSON Lines file that receives every round's state
+            history_window: Number of recent states kept in simulation_history (0 keeps all)
+        """
         self.config = config or SimulationConfig()
         self.round_manager = RoundManager(self.config.max_rounds)
         self.event_manager = EventManager()
         self.current_state: Optional[SimulationState] = None
-        self.simulation_history: list = []
+        self.history_path = history_path
+        self.history_window = history_window
+        self._history_fp = None
+        self._history_count = 0
+        # Byte length of the loaded save's history prefix while the next round
+        # still has to fork the history file; None when appending directly
+        self._history_fork_offset: Optional[int] = None
+        self.simulation_history = self._new_history()
 
     def initialize_simulation(self, scenario: str = "default") -> SimulationState:
         """Initialize a new simulation with the given scenario.
@@ -41,7 +75,13 @@ class SimulationEngine:
         # Reset managers
         self.round_manager.reset()
         self.event_manager.reset()
-        self.simulation_history.clear()
+        self.simulation_history = self._new_history()
+        self._history_count = 0
+        self._history_fork_offset = None
+        self.close_history()
+        if self.history_path:
+            # Saves of an earlier game may still reference the current file
+            self.history_path, self._history_fp = self._create_history_file('x')
 
         # Create initial simulation state
         player_company = self._create_initial_company()
@@ -55,70 +95,70 @@ class SimulationEngine:
         )
 
         self.current_state = initial_state
-        self.simulation_history.append(initial_state.to_dict())
+        self._record_history(initial_state.to_dict())
 
         return initial_state
 
     def run_round(self, player_decisions: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a complete round with player decisions.
 
+        The managers and their methods are bound to locals once per call, so
+        the round itself avoids repeated attribute lookups.
+
         Args:
             player_decisions: Dictionary of player decisions for the round
 
         Returns:
             Round results including updated state and KPIs
         """
-        if not self.current_state:
+        state = self.current_state
+        if not state:
             raise ValueError("Simulation not initialized. Call initialize_simulation() first.")
 
+        round_manager = self.round_manager
+        event_manager = self.event_manager
+        trigger_event = event_manager.trigger_event
+
         # Advance to next round
-        new_round = self.round_manager.advance_round()
+        new_round = round_manager.advance_round()
 
         # Process player decisions
-        processed_decisions = self.round_manager.process_decisions(player_decisions)
+        processed_decisions = round_manager.process_decisions(player_decisions)
 
         # Generate and trigger events
-        random_events = self.event_manager.generate_random_events(new_round)
-        scheduled_events = self.event_manager.process_scheduled_events(new_round)
-
-        triggered_events = []
-        for event in random_events + scheduled_events:
-            event_data = self.event_manager.trigger_event(event, new_round)
-            triggered_events.append(event_data)
+        triggered_events = [
+            trigger_event(event, new_round)
+            for event in (event_manager.generate_random_events(new_round)
+                          + event_manager.process_scheduled_events(new_round))
+        ]
 
         # Process active events and get their impacts
-        expired_events = self.event_manager.process_active_events()
-        event_impacts = self.event_manager.get_active_event_impacts()
+        expired_events = event_manager.process_active_events()
+        event_impacts = event_manager.get_active_impact_vector()
 
         # Advance market to new round
-        self.current_state.market.advance_round(new_round)
+        market = state.market
+        market.advance_round(new_round)
 
-        # Calculate round results
-        round_results = self.round_manager.calculate_round_results(
-            self.current_state, processed_decisions
-        )
-
-        # Apply event impacts to results
+        # Calculate round results and apply event impacts
+        round_results = round_manager.calculate_round_results(state,
+                                                              processed_decisions)
         self._apply_event_impacts(round_results, event_impacts)
 
         # Apply market events to market
         for event in triggered_events:
             if event.get('type') == 'market_event':
-                self.current_state.market.apply_market_event(event)
+                market.apply_market_event(event)
 
         # Update simulation state
         self._update_simulation_state(round_results, triggered_events)
 
-        # Store in history
-        self.simulation_history.append(self.current_state.to_dict())
-
-        # Create a clean game state dict for return
-        game_state_dict = self.current_state.to_dict()
-        # Ensure market is properly serialized
-        if isinstance(self.current_state.market, dict):
-            game_state_dict['market'] = self.current_state.market
-        else:
-            game_state_dict['market'] = self.current_state.market.to_dict()
+        # Serialize once for history and the caller. The caller gets a shallow
+        # copy: replacing its top-level entries leaves history intact, but the
+        # nested data is shared and must be treated as read-only.
+        game_state_dict = state.to_dict()
+        self._record_history(game_state_dict)
+        game_state_dict = dict(game_state_dict)
 
         return {
             'round_number': new_round,
@@ -126,9 +166,26 @@ class SimulationEngine:
             'triggered_events': triggered_events,
             'expired_events': expired_events,
             'game_state': game_state_dict,
-            'is_simulation_over': self.round_manager.is_simulation_over()
+            'is_simulation_over': round_manager.is_simulation_over()
         }
 
+    def run_sweep(self, prices: np.ndarray, budgets: np.ndarray) -> np.ndarray:
+        """Evaluate many decision sequences at once for sensitivity analysis.
+
+        Only the deterministic pricing/marketing arithmetic is swept; events,
+        market dynamics and company state are not simulated.
+
+        Args:
+            prices: Prices with shape (num_sims, num_rounds)
+            budgets: Marketing budgets with the same shape as prices
+
+        Returns:
+            Profit array with shape (num_sims, num_rounds)
+        """
+        if np.shape(prices)[-1] > self.config.max_rounds:
+            raise ValueError(f"Sweep covers more than {self.config.max_rounds} rounds")
+        return sweep(prices, budgets)
+
     def get_current_state(self) -> Optional[SimulationState]:
         """Get the current simulation state."""
         return self.current_state
@@ -147,13 +204,7 @@ class SimulationEngine:
 
         try:
             save_data = {
-                'config': {
-                    'max_rounds': self.config.max_rounds,
-                    'num_competitors': self.config.num_competitors,
-                    'initial_market_demand': self.config.initial_market_demand,
-                    'market_volatility': self.config.market_volatility,
-                    'event_frequency': self.config.event_frequency
-                },
+                'config': self.config.to_dict(),
                 'current_state': self.current_state.to_dict(),
                 'round_manager': {
                     'current_round': self.round_manager.current_round,
@@ -161,17 +212,17 @@ class SimulationEngine:
                 },
                 'event_manager': {
                     'active_events': self.event_manager.get_active_events(),
-                    'event_history': self.event_manager.get_event_history()
+                    'event_history': self.event_manager.get_event_history(include_timestamps=True)
                 },
                 'market': self.current_state.market.to_dict(),
-                'simulation_history': self.simulation_history
+                **self.history_save_data()
             }
 
             # Ensure data directory exists
             os.makedirs('data/saves', exist_ok=True)
 
             with open(f'data/saves/{filename}.json', 'w') as f:
-                json.dump(save_data, f, indent=2, default=str)
+                f.write(json_dumps(save_data, indent=True))
 
             return True
         except Exception as e:
@@ -189,24 +240,18 @@ class SimulationEngine:
         """
         try:
             with open(f'data/saves/{filename}.json', 'r') as f:
-                save_data = json.load(f)
+                save_data = json_loads(f.read())
 
             # Restore configuration
             config_data = save_data.get('config', {})
             self.config = SimulationConfig(**config_data)
 
-            # Restore managers
+            # Restore managers in place
             round_data = save_data.get('round_manager', {})
-            self.round_manager = RoundManager(round_data.get('max_rounds', 10))
-            self.round_manager.current_round = round_data.get('current_round', 0)
+            self.round_manager.reset_to(round_data.get('current_round', 0), round_data.get('max_rounds', 10))
 
-            self.event_manager = EventManager()
-            # Restore active events
-            for event_data in save_data.get('event_manager', {}).get('active_events', []):
-                self.event_manager.active_events.append(event_data)
-            # Restore event history
-            for history_item in save_data.get('event_manager', {}).get('event_history', []):
-                self.event_manager.event_history.append(history_item)
+            event_data = save_data.get('event_manager', {})
+            self.event_manager.reset_to(event_data.get('active_events', []), event_data.get('event_history', []))
 
             # Restore simulation state
             state_data = save_data.get('state_data', save_data.get('current_state'))
@@ -217,7 +262,7 @@ class SimulationEngine:
                 self.current_state.market = Market.from_dict(save_data['market'])
 
             # Restore history
-            self.simulation_history = save_data.get('simulation_history', save_data.get('game_history', []))
+            self.restore_history(save_data)
 
             return self.current_state
         except Exception as e:
@@ -236,9 +281,155 @@ class SimulationEngine:
             'total_events': len(self.event_manager.get_event_history()),
             'active_events': len(self.event_manager.get_active_events()),
             'kpis': self.current_state.kpis,
-            'simulation_history_length': len(self.simulation_history)
+            'simulation_history_length': self._history_count
         }
 
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every recorded state, oldest first.
+
+        Reads the history file when one is configured, so rounds that have
+        dropped out of the in-memory window are still included. Only this
+        simulation's entries are read; after a load the file may hold further
+        rounds that belong to later saves.
+        """
+        if not (self.history_path and os.path.exists(self.history_path)):
+            yield from list(self.simulation_history)
+            return
+
+        if self._history_fp is not None:
+            self._history_fp.flush()
+        remaining = self._history_count
+        with open(self.history_path, 'r') as f:
+            for line in f:
+                if remaining <= 0:
+                    break
+                if line.strip():
+                    remaining -= 1
+                    yield json_loads(line)
+
+    def history_save_data(self) -> Dict[str, Any]:
+        """Get the history fields to store in a save file.
+
+        Returns:
+            The embedded history, or a reference to the history file when
+            history is being streamed to disk
+        """
+        if not self.history_path:
+            return {'simulation_history': list(self.simulation_history)}
+
+        if self._history_fp is not None:
+            self._history_fp.flush()
+        return {'history_path': self.history_path, 'history_entries': self._history_count}
+
+    def restore_history(self, save_data: Dict[str, Any]):
+        """Restore simulation history from loaded save data.
+
+        A streamed history file is only read, never modified, because later
+        saves in the same file still need the rounds recorded after this one.
+        If the file continues past this save, the next recorded round forks the
+        history into a new file holding this save's prefix.
+
+        Args:
+            save_data: Save file contents produced with history_save_data()
+        """
+        self.close_history()
+        self._history_fork_offset = None
+
+        if 'history_path' not in save_data:
+            entries = save_data.get('simulation_history', save_data.get('game_history', []))
+            self.simulation_history = self._new_history(entries)
+            self._history_count = len(entries)
+            return
+
+        self.history_path = save_data['history_path']
+        self._history_count = 0
+        self.simulation_history = self._new_history()
+        entries = save_data.get('history_entries')
+
+        try:
+            with open(self.history_path, 'rb') as f:
+                while entries is None or self._history_count < entries:
+                    line = f.readline()
+                    if not line:
+                        break
+                    if line.strip():
+                        self.simulation_history.append(json_loads(line))
+                        self._history_count += 1
+                prefix_length = f.tell()
+                has_later_rounds = bool(f.read(1))
+        except FileNotFoundError:
+            has_later_rounds = False
+
+        if has_later_rounds:
+            self._history_fork_offset = prefix_length
+        else:
+            self._open_history_sink('a')
+
+    def close_history(self):
+        """Close the history file if one is open."""
+        if self._history_fp is not None:
+            self._history_fp.close()
+            self._history_fp = None
+
+    def _new_history(self, entries=()):
+        """Create the in-memory history buffer, bounded when a window is set."""
+        if self.history_window > 0:
+            return deque(entries, maxlen=self.history_window)
+        return list(entries)
+
+    def _open_history_sink(self, mode: str):
+        """(Re)open the history file in the given mode if history is streamed."""
+        self.close_history()
+        if self.history_path:
+            os.makedirs(os.path.dirname(self.history_path) or '.', exist_ok=True)
+            self._history_fp = open(self.history_path, mode)
+
+    def _create_history_file(self, mode: str):
+        """Create a history file without replacing one a save may reference.
+
+        Args:
+            mode: Exclusive-creation file mode ('x' or 'xb')
+
+        Returns:
+            Path and file object of history_path if it does not exist yet,
+            otherwise of the first free numbered file next to it
+        """
+        os.makedirs(os.path.dirname(self.history_path) or '.', exist_ok=True)
+        root, ext = os.path.splitext(self.history_path)
+        target = self.history_path
+        n = 0
+        while True:
+            try:
+                return target, open(target, mode)
+            except FileExistsError:
+                n += 1
+                target = f"{root}.{n}{ext}"
+
+    def _fork_history(self):
+        """Continue the history in a new file starting with the loaded save's prefix."""
+        target, dst = self._create_history_file('xb')
+        with dst, open(self.history_path, 'rb') as src:
+            remaining = self._history_fork_offset
+            while remaining > 0:
+                chunk = src.read(min(remaining, 1 << 20))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                remaining -= len(chunk)
+
+        self.history_path = target
+        self._history_fork_offset = None
+        self._open_history_sink('a')
+
+    def _record_history(self, state_dict: Dict[str, Any]):
+        """Append a state to the in-memory window and the history file."""
+        self.simulation_history.append(state_dict)
+        self._history_count += 1
+        if self._history_fork_offset is not None:
+            self._fork_history()
+        if self._history_fp is not None:
+            self._history_fp.write(json_dumps(state_dict) + '\n')
+
     def _create_initial_company(self) -> Company:
         """Create initial player company object."""
         financial_data = FinancialData(
@@ -311,19 +502,35 @@ class SimulationEngine:
         """Calculate initial KPI values from company object."""
         return company.get_kpis()
 
-    def _apply_event_impacts(self, round_results: Dict[str, Any], event_impacts: Dict[str, float]):
-        """Apply event impacts to round results."""
-        for metric, impact in event_impacts.items():
-            if metric in round_results:
-                if metric in ['revenue', 'costs', 'profit']:
-                    # Percentage impact on financial metrics
-                    round_results[metric] *= (1.0 + impact)
-                elif metric in ['market_share', 'customer_satisfaction']:
-                    # Direct additive impact on percentages
-                    round_results[metric] = max(0.0, min(1.0, round_results[metric] + impact))
-                else:
-                    # Generic percentage impact
+    def _apply_event_impacts(self, round_results: Dict[str, Any],
+                             event_impacts: Union[Dict[str, float], Sequence[float]]):
+        """Apply event impacts to round results.
+
+        Args:
+            round_results: Round results, updated in place
+            event_impacts: Combined impacts keyed by metric, or an impact
+                vector ordered like IMPACT_METRICS
+        """
+        if isinstance(event_impacts, dict):
+            # Metrics outside the fixed schema get a generic percentage impact
+            for metric, impact in event_impacts.items():
+                if IMPACT_KIND.get(metric, IMPACT_GENERIC) == IMPACT_GENERIC and metric in round_results:
                     round_results[metric] *= (1.0 + impact)
+            event_impacts = [event_impacts.get(metric, 0.0)
+                             for metric in IMPACT_METRICS]
+        elif isinstance(event_impacts, np.ndarray):
+            event_impacts = event_impacts.tolist()
+
+        # Plain float arithmetic: the vector is too short for numpy to pay off.
+        # Percentage impact on financial metrics, direct additive impact on shares
+        for i, (metric, impact) in enumerate(zip(IMPACT_METRICS, event_impacts)):
+            if metric not in round_results:
+                continue
+            if i < NUM_MULTIPLICATIVE_METRICS:
+                round_results[metric] *= 1.0 + impact
+            else:
+                share = round_results[metric] + impact
+                round_results[metric] = min(max(share, 0.0), 1.0)
 
     def _apply_round_results_to_company(self, round_results: Dict[str, Any]):
         """Apply round results to company state."""
@@ -371,4 +578,4 @@ class SimulationEngine:
         self.current_state.events = [event['event'] for event in triggered_events]
 
         # Update KPIs from company
-        self.current_state.kpis = self.current_state.player_company.get_kpis()
\ No newline at end of file
+        self.current_state.kpis = self.current_state.player_company.get_kpis()
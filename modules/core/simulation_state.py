@@ -1,11 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import copy
 from .company import Company
 from .market import Market
+from ._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SimulationState:
     """Represents the current state of the business simulation."""
 
@@ -16,6 +18,10 @@ class SimulationState:
     events: List[Dict[str, Any]]  # Active events
     kpis: Dict[str, float]  # Key Performance Indicators
     timestamp: datetime = None
+    # Competitor snapshot shared by every serialization until the list is
+    # replaced; competitors are only ever replaced, never edited in place
+    _competitors_source: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+    _competitors_snapshot: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.timestamp is None:
@@ -27,12 +33,19 @@ class SimulationState:
             'round_number': self.round_number,
             'player_company': self.player_company.to_dict() if hasattr(self.player_company, 'to_dict') else self.player_company,
             'market': self.market.to_dict() if hasattr(self.market, 'to_dict') and callable(getattr(self.market, 'to_dict', None)) else self.market,
-            'competitors': self.competitors,
-            'events': self.events,
-            'kpis': self.kpis,
+            'competitors': self._competitors_dict(),
+            'events': list(self.events),
+            'kpis': dict(self.kpis),
             'timestamp': self.timestamp.isoformat()
         }
 
+    def _competitors_dict(self) -> List[Dict[str, Any]]:
+        """Snapshot competitors, reusing the previous copy while the list is unchanged."""
+        if self._competitors_source is not self.competitors:
+            self._competitors_snapshot = copy.deepcopy(self.competitors)
+            self._competitors_source = self.competitors
+        return self._competitors_snapshot
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SimulationState':
         """Create SimulationState from dictionary."""
@@ -43,4 +56,4 @@ class SimulationState:
         if 'market' in data_copy and isinstance(data_copy['market'], dict):
             from .market import Market
             data_copy['market'] = Market.from_dict(data_copy['market'])
-        return cls(**data_copy)
\ No newline at end of file
+        return cls(**data_copy)
@@ -1,10 +1,14 @@
+import csv
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+import re
 from pathlib import Path
 import os
-from .data_serializer import DataSerializer
+from .data_serializer import DataSerializer, CSV_EXPORT_HEADER, PRETTY_INDENT, WRITE_BUFFER_SIZE, epoch_millis
 from ..core.company import Company
 
+# Company id and round number of a company snapshot filename
+_SNAPSHOT_NAME = re.compile(r'company_(?P<id>.+?)_round_(?P<round>\d+)')
+
 
 class CompanyPersistence:
     """Handles saving and loading of company data."""
@@ -12,12 +16,15 @@ class CompanyPersistence:
     def __init__(self, serializer: Optional[DataSerializer] = None):
         self.serializer = serializer or DataSerializer()
 
-    def save_company(self, company: Company, filename: Optional[str] = None) -> str:
+    def save_company(self, company: Company, filename: Optional[str] = None, pretty: bool = False,
+                     compress: bool = False) -> str:
         """Save a company object to file.
 
         Args:
             company: Company object to save
             filename: Optional custom filename (defaults to company_id)
+            pretty: Indent the JSON for reading instead of writing it compactly
+            compress: Write a compressed save (see DataSerializer.serialize_to_json)
 
         Returns:
             Path to the saved file
@@ -30,12 +37,14 @@ class CompanyPersistence:
 
         # Add metadata
         company_data['_metadata'] = {
-            'saved_at': datetime.now(),
+            'saved_at': epoch_millis(),
             'version': '1.0',
             'type': 'company'
         }
 
-        return self.serializer.serialize_to_json(company_data, filename)
+        return self.serializer.serialize_to_json(company_data, filename,
+                                                 indent=PRETTY_INDENT if pretty else None,
+                                                 compress=compress)
 
     def load_company(self, filename: str) -> Company:
         """Load a company object from file.
@@ -61,27 +70,27 @@ class CompanyPersistence:
 
         return Company.from_dict(company_data)
 
-    def save_multiple_companies(self, companies: List[Company], filename: str) -> str:
+    def save_multiple_companies(self, companies: List[Company], filename: str, compress: bool = False) -> str:
         """Save multiple companies to a single file.
 
         Args:
             companies: List of Company objects
             filename: Output filename
+            compress: Write a compressed save (see DataSerializer.serialize_to_json)
 
         Returns:
             Path to the saved file
         """
-        companies_data = {
-            'companies': [company.to_dict() for company in companies],
-            '_metadata': {
-                'saved_at': datetime.now(),
-                'version': '1.0',
-                'type': 'companies',
-                'count': len(companies)
-            }
+        metadata = {
+            'saved_at': epoch_millis(),
+            'version': '1.0',
+            'type': 'companies',
+            'count': len(companies)
         }
 
-        return self.serializer.serialize_to_json(companies_data, filename)
+        return self.serializer.serialize_records_to_json(
+            'companies', (company.to_dict() for company in companies), {'_metadata': metadata}, filename,
+            compress=compress)
 
     def load_multiple_companies(self, filename: str) -> List[Company]:
         """Load multiple companies from a single file.
@@ -97,24 +106,59 @@ class CompanyPersistence:
         if 'companies' not in data:
             raise ValueError(f"Invalid companies data in file: {filename}")
 
+        # Consume the parsed list so each company dict is released once built
+        company_dicts = data.pop('companies')
+        company_dicts.reverse()
         companies = []
-        for company_data in data['companies']:
-            companies.append(Company.from_dict(company_data))
+        while company_dicts:
+            companies.append(Company.from_dict(company_dicts.pop()))
 
         return companies
 
-    def save_company_snapshot(self, company: Company, round_number: int) -> str:
+    def save_companies_bulk(self, companies: List[Company], base_filename: str) -> Dict[str, str]:
+        """Save each company to its own file in a single batched write.
+
+        The files match what save_company writes, so each one can be read
+        back with load_company.
+
+        Args:
+            companies: List of Company objects
+            base_filename: Prefix for the filenames, which are
+                ``<base_filename>_<company id>``
+
+        Returns:
+            Dictionary mapping company IDs to file paths
+        """
+        # Encoding only reads the metadata, so every company can share one dict
+        metadata = {
+            'saved_at': epoch_millis(),
+            'version': '1.0',
+            'type': 'company'
+        }
+        items = {}
+        for company in companies:
+            company_data = company.to_dict()
+            company_data['_metadata'] = metadata
+            items[f"{base_filename}_{company.id}"] = company_data
+
+        paths = self.serializer.serialize_many_to_json(items)
+        return {company.id: paths[f"{base_filename}_{company.id}"] for company in companies}
+
+    def save_company_snapshot(self, company: Company, round_number: int, pretty: bool = False,
+                              compress: bool = False) -> str:
         """Save a snapshot of company state at a specific round.
 
         Args:
             company: Company object
             round_number: Current round number
+            pretty: Indent the JSON for reading instead of writing it compactly
+            compress: Write a compressed save (see DataSerializer.serialize_to_json)
 
         Returns:
             Path to the saved snapshot
         """
         filename = f"company_{company.id}_round_{round_number}"
-        return self.save_company(company, filename)
+        return self.save_company(company, filename, pretty=pretty, compress=compress)
 
     def list_company_saves(self) -> List[Dict[str, Any]]:
         """List all saved company files with metadata.
@@ -122,26 +166,28 @@ class CompanyPersistence:
         Returns:
             List of dictionaries containing file information
         """
-        json_files = self.serializer.list_save_files('json')
+        return self._list_company_saves('company_')
+
+    def _list_company_saves(self, prefix: str) -> List[Dict[str, Any]]:
+        """List saved company files whose names start with prefix."""
         company_files = []
 
-        for filename in json_files:
-            if filename.startswith('company_'):
-                file_info = self.serializer.get_file_info(filename, 'json')
-                if file_info:
-                    # Try to get basic info from the file
-                    try:
-                        data = self.serializer.deserialize_from_json(filename)
-                        if self.serializer.validate_save_data(data, 'company'):
-                            file_info['company_id'] = data.get('id')
-                            file_info['company_name'] = data.get('name')
-                            file_info['has_metadata'] = '_metadata' in data
-                            if file_info['has_metadata']:
-                                file_info['saved_at'] = data['_metadata'].get('saved_at')
-                    except:
-                        pass  # Skip files that can't be read
-
-                    company_files.append(file_info)
+        entries = self.serializer.scan_save_files('json', prefix)
+        for entry, data in zip(entries, self.serializer.peek_headers(entries)):
+            file_info = self.serializer.get_file_info(entry, 'json')
+            if file_info:
+                # Try to get basic info from the file
+                try:
+                    if self.serializer.validate_save_data(data, 'company'):
+                        file_info['company_id'] = data.get('id')
+                        file_info['company_name'] = data.get('name')
+                        file_info['has_metadata'] = '_metadata' in data
+                        if file_info['has_metadata']:
+                            file_info['saved_at'] = self.serializer.parse_datetime(data['_metadata'].get('saved_at'))
+                except:
+                    pass  # Skip files that can't be read
+
+                company_files.append(file_info)
 
         return company_files
 
@@ -154,19 +200,13 @@ class CompanyPersistence:
         Returns:
             List of snapshot file information
         """
-        all_saves = self.list_company_saves()
         snapshots = []
 
-        for save_info in all_saves:
-            filename = save_info['filename']
-            if f"company_{company_id}_round_" in filename:
-                # Extract round number
-                try:
-                    round_part = filename.split('_round_')[-1]
-                    save_info['round_number'] = int(round_part)
-                    snapshots.append(save_info)
-                except (ValueError, IndexError):
-                    continue
+        for save_info in self._list_company_saves(f"company_{company_id}_round_"):
+            match = _SNAPSHOT_NAME.fullmatch(save_info['filename'])
+            if match and match['id'] == company_id:
+                save_info['round_number'] = int(match['round'])
+                snapshots.append(save_info)
 
         # Sort by round number
         snapshots.sort(key=lambda x: x.get('round_number', 0))
@@ -194,40 +234,39 @@ class CompanyPersistence:
         Returns:
             Path to the exported CSV file
         """
-        import csv
-
         filepath = Path(self.serializer.base_path) / f"{filename}.csv"
 
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header
-            writer.writerow(['Category', 'Metric', 'Value'])
-
-            # Write financial data
-            writer.writerow(['Financial', 'Revenue', company.financial_data.revenue])
-            writer.writerow(['Financial', 'Costs', company.financial_data.costs])
-            writer.writerow(['Financial', 'Profit', company.financial_data.profit])
-            writer.writerow(['Financial', 'Cash', company.financial_data.cash])
-            writer.writerow(['Financial', 'Assets', company.financial_data.assets])
-            writer.writerow(['Financial', 'Liabilities', company.financial_data.liabilities])
-
-            # Write operational data
-            writer.writerow(['Operational', 'Capacity', company.operations_data.capacity])
-            writer.writerow(['Operational', 'Efficiency', company.operations_data.efficiency])
-            writer.writerow(['Operational', 'Quality', company.operations_data.quality])
-            writer.writerow(['Operational', 'Utilization', company.operations_data.utilization])
-            writer.writerow(['Operational', 'Customer Satisfaction', company.operations_data.customer_satisfaction])
-
-            # Write resource data
-            writer.writerow(['Resources', 'Employees', company.resource_data.employees])
-            writer.writerow(['Resources', 'Equipment Value', company.resource_data.equipment])
-            writer.writerow(['Resources', 'Inventory Value', company.resource_data.inventory])
-
-            # Write market data
-            writer.writerow(['Market', 'Market Share', company.market_data.market_share])
-            writer.writerow(['Market', 'Brand Value', company.market_data.brand_value])
-            writer.writerow(['Market', 'Competitive Position', company.market_data.competitive_position])
+        financial = company.financial_data
+        operations = company.operations_data
+        resources = company.resource_data
+        market = company.market_data
+        rows = [
+            CSV_EXPORT_HEADER,
+            # Financial data
+            ('Financial', 'Revenue', financial.revenue),
+            ('Financial', 'Costs', financial.costs),
+            ('Financial', 'Profit', financial.profit),
+            ('Financial', 'Cash', financial.cash),
+            ('Financial', 'Assets', financial.assets),
+            ('Financial', 'Liabilities', financial.liabilities),
+            # Operational data
+            ('Operational', 'Capacity', operations.capacity),
+            ('Operational', 'Efficiency', operations.efficiency),
+            ('Operational', 'Quality', operations.quality),
+            ('Operational', 'Utilization', operations.utilization),
+            ('Operational', 'Customer Satisfaction', operations.customer_satisfaction),
+            # Resource data
+            ('Resources', 'Employees', resources.employees),
+            ('Resources', 'Equipment Value', resources.equipment),
+            ('Resources', 'Inventory Value', resources.inventory),
+            # Market data
+            ('Market', 'Market Share', market.market_share),
+            ('Market', 'Brand Value', market.brand_value),
+            ('Market', 'Competitive Position', market.competitive_position),
+        ]
+
+        with open(filepath, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            csv.writer(csvfile).writerows(rows)
 
         return str(filepath)
 
@@ -1,9 +1,84 @@
+import gzip
 import json
+import mmap
 import pickle
-from typing import Dict, Any, Optional, Union
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import (Callable, Dict, Any, Iterable, Iterator, List, Optional, Sequence,
+                    Set, Tuple, Union)
 from datetime import datetime
 from pathlib import Path
 import os
+from ..core._compat import json_loads, orjson, zstandard
+
+# Buffer size for save-file writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Separators for compact (non-indented) JSON output
+COMPACT_SEPARATORS = (',', ':')
+
+# Indentation used when a save is written for people to read
+PRETTY_INDENT = 2
+
+# Extension of the small metadata files written beside large saves
+METADATA_SIDECAR_EXTENSION = "meta"
+
+# Header row of the component CSV exports
+CSV_EXPORT_HEADER = ('Category', 'Metric', 'Value')
+
+# Compression level for compressed JSON saves; level 1 favours speed
+COMPRESSION_LEVEL = 1
+
+# Suffixes appended to ".json" by compressed saves, in lookup order
+COMPRESSED_SUFFIXES = ('.zst', '.gz')
+
+# Number of parsed saves kept by load_cached
+LOAD_CACHE_SIZE = 256
+
+# Plain JSON saves at least this large are parsed from a memory map when
+# orjson is available, instead of being copied into a bytes object first
+MMAP_READ_THRESHOLD = 1 << 20
+
+# Upper bound on threads used to read several saves at once
+MAX_READ_WORKERS = 8
+
+# Top-level fields each save type must contain
+REQUIRED_SAVE_FIELDS = {
+    'company': frozenset(['id', 'name', 'financial_data', 'operations_data']),
+    'market': frozenset(['state', 'round_number']),
+    'simulation': frozenset(['current_state', 'round_manager'])
+}
+
+# Metadata fields that hold datetimes when a save is loaded with parse_datetimes
+DATETIME_METADATA_KEYS = frozenset({'saved_at', 'modified_time', 'created_time'})
+
+# Cheap check that a string starts like an ISO datetime before trying to parse it
+_ISO_DATETIME_PREFIX = re.compile(r'\d{4}-\d{2}-\d{2}T')
+
+
+def epoch_millis(moment: Optional[datetime] = None) -> int:
+    """Return a time as integer milliseconds since the Unix epoch.
+
+    Save metadata stores timestamps this way so they load as plain integers.
+
+    Args:
+        moment: Time to convert, or None for now
+
+    Returns:
+        Milliseconds since the epoch
+    """
+    return int((moment or datetime.now()).timestamp() * 1000)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON types that appear in save data."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
 class DataSerializer:
@@ -12,36 +87,107 @@ class DataSerializer:
     def __init__(self, base_path: str = "data/saves"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
-
-    def serialize_to_json(self, data: Any, filename: str, indent: int = 2) -> str:
+        # filename -> (mtime_ns, size, header) for files read by peek_header;
+        # both caches are guarded by _cache_lock since reads run on worker threads
+        self._listing_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        # filename -> (mtime_ns, size, data), least recently used first
+        self._load_cache: 'OrderedDict[str, Tuple[int, int, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Files written without fsync since the last sync()
+        self._unsynced: Set[Path] = set()
+
+    def serialize_to_json(self, data: Any, filename: str, indent: Optional[int] = None,
+                          compress: bool = False) -> str:
         """Serialize data to JSON format.
 
         Args:
             data: Data to serialize
             filename: Output filename (without extension)
-            indent: JSON indentation level
+            indent: JSON indentation level, or None for compact output
+            compress: Write a compressed ``.json.zst`` file (``.json.gz`` when
+                zstandard is not installed) instead of plain JSON
 
         Returns:
             Path to the saved file
         """
-        filepath = self.base_path / f"{filename}.json"
+        # Encode in one pass and hand the file a single large write
+        payload = self._encode_json(data, indent)
+        with self._open_json_for_write(filename, compress) as (filepath, f):
+            f.write(payload)
+
+        return str(filepath)
+
+    def serialize_records_to_json(self, records_key: str, records: Iterable[Any],
+                                  extra: Dict[str, Any], filename: str,
+                                  compress: bool = False) -> str:
+        """Serialize a list of records to compact JSON, one record at a time.
+
+        The file holds a single object with the records under records_key
+        followed by the entries of extra. Each record is encoded as soon as
+        it is produced, so a generator of to_dict() results never has more
+        than one record dictionary alive. Plain saves stream the chunks
+        through the same fsynced temporary-file write as
+        serialize_many_to_json.
 
-        # Handle datetime objects
-        def json_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        Args:
+            records_key: Key the record list is stored under
+            records: Records to serialize
+            extra: Further top-level entries, such as ``_metadata``
+            filename: Output filename (without extension)
+            compress: Write a compressed file, as in serialize_to_json
+
+        Returns:
+            Path to the saved file
+        """
+        chunks = self._record_chunks(records_key, records, extra)
+        if not compress:
+            filepath = self.base_path / f"{filename}.json"
+            self._write_many([(filepath, chunks)])
+            self._evict(filename)
+            return str(filepath)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, default=json_serializer)
+        with self._open_json_for_write(filename, compress) as (filepath, f):
+            for chunk in chunks:
+                f.write(chunk)
 
         return str(filepath)
 
-    def deserialize_from_json(self, filename: str) -> Any:
+    def _record_chunks(self, records_key: str, records: Iterable[Any],
+                       extra: Dict[str, Any]) -> Iterator[bytes]:
+        """Yield the encoded pieces of a serialize_records_to_json payload."""
+        yield b'{' + self._encode_json(records_key, None) + b':['
+        for i, record in enumerate(records):
+            if i:
+                yield b','
+            yield self._encode_json(record, None)
+        yield b']'
+        for key, value in extra.items():
+            yield (b',' + self._encode_json(key, None) + b':'
+                   + self._encode_json(value, None))
+        yield b'}'
+
+    def json_round_trip(self, data: Any) -> Any:
+        """Return data as it reads back from a JSON save.
+
+        Tuples become lists and datetimes become ISO strings, so the result
+        compares equal to a later load of the same save.
+
+        Args:
+            data: Data to normalize
+
+        Returns:
+            A fresh copy of the data made of JSON types only
+        """
+        return json_loads(self._encode_json(data, None))
+
+    def deserialize_from_json(self, filename: str,
+                              parse_datetimes: bool = False) -> Any:
         """Deserialize data from JSON format.
 
         Args:
             filename: Filename to load (without extension)
+            parse_datetimes: Convert the ISO timestamps in the top-level
+                ``_metadata`` block back to datetime objects
 
         Returns:
             Deserialized data
@@ -50,32 +196,281 @@ class DataSerializer:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is invalid
         """
-        filepath = self.base_path / f"{filename}.json"
+        filepath = self._json_save_path(filename)
 
         if not filepath.exists():
             raise FileNotFoundError(f"Save file not found: {filepath}")
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Convert ISO datetime strings back to datetime objects
-        def convert_datetimes(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if isinstance(value, str) and self._is_iso_datetime(value):
-                        try:
-                            obj[key] = datetime.fromisoformat(value)
-                        except ValueError:
-                            pass  # Keep as string if not valid datetime
-                    elif isinstance(value, (dict, list)):
-                        convert_datetimes(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    convert_datetimes(item)
-
-        convert_datetimes(data)
+        data = self._parse_json_file(filepath)
+
+        if parse_datetimes and isinstance(data, dict):
+            metadata = data.get('_metadata')
+            if isinstance(metadata, dict):
+                for key in DATETIME_METADATA_KEYS.intersection(metadata):
+                    metadata[key] = self.parse_datetime(metadata[key])
+
+        return data
+
+    def parse_datetime(self, value: Any) -> Any:
+        """Convert a saved timestamp to a datetime object.
+
+        Args:
+            value: Value read from a save file: epoch milliseconds, or an ISO
+                datetime string as written by older saves
+
+        Returns:
+            The parsed datetime, or the value unchanged if it is not a
+            timestamp
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            return datetime.fromtimestamp(value / 1000)
+        if isinstance(value, str) and self._is_iso_datetime(value):
+            return datetime.fromisoformat(value)
+        return value
+
+    def load_cached(self, filename: str) -> Any:
+        """Load a JSON save, reusing the parsed data while the file is unchanged.
+
+        The returned data is shared between calls and must not be modified;
+        use deserialize_from_json for a private copy.
+
+        Args:
+            filename: Filename to load (without extension)
+
+        Returns:
+            Deserialized data
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If JSON is invalid
+        """
+        try:
+            _, filepath, stat = self._stat_save(filename, 'json')
+        except FileNotFoundError:
+            self._evict(filename)
+            filepath = self.base_path / f'{filename}.json'
+            raise FileNotFoundError(f"Save file not found: {filepath}")
+
+        with self._cache_lock:
+            cached = self._load_cache.get(filename)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._load_cache.move_to_end(filename)
+                return cached[2]
+
+        data = self.deserialize_from_json(filename)
+        with self._cache_lock:
+            self._load_cache[filename] = (stat.st_mtime_ns, stat.st_size, data)
+            self._load_cache.move_to_end(filename)
+            if len(self._load_cache) > LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
         return data
 
+    def load_many_cached(self, filenames: Sequence[str]) -> List[Optional[Any]]:
+        """Load several JSON saves through load_cached, reading them in parallel.
+
+        Args:
+            filenames: Filenames to load (without extension)
+
+        Returns:
+            Loaded data in the order of filenames, with None for files that
+            are missing or unreadable
+        """
+        return self._map_saves(self.load_cached, filenames)
+
+    def peek_headers(self, filenames: Sequence[Union[str, os.DirEntry]]
+                     ) -> List[Optional[Dict[str, Any]]]:
+        """Read the headers of several saves with peek_header, in parallel.
+
+        Args:
+            filenames: Filenames (without extension) or scanned entries
+
+        Returns:
+            Headers in the order of filenames, with None for files that are
+            missing or unreadable
+        """
+        return self._map_saves(self.peek_header, filenames)
+
+    def peek_header(self, filename: Union[str, os.DirEntry]) -> Dict[str, Any]:
+        """Read the top-level summary of a JSON save without keeping its payload.
+
+        The header has every top-level key of the save. Scalar values and the
+        ``_metadata`` block are kept; nested payloads are replaced with None, so
+        the header still passes validate_save_data. Headers are cached until the
+        file's modification time or size changes.
+
+        Args:
+            filename: Filename to read (without extension), or an entry from
+                scan_save_files whose cached stat is reused
+
+        Returns:
+            Dictionary with the save's top-level fields
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If JSON is invalid
+        """
+        try:
+            filename, filepath, stat = self._stat_save(filename, 'json')
+        except FileNotFoundError:
+            filename = self._save_name(filename, 'json')
+            self._evict(filename)
+            filepath = self.base_path / f'{filename}.json'
+            raise FileNotFoundError(f"Save file not found: {filepath}")
+
+        with self._cache_lock:
+            cached = self._listing_cache.get(filename)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return dict(cached[2])
+
+        data = self.load_cached(filename)
+        if isinstance(data, dict):
+            header = {key: (value if key == '_metadata'
+                            or not isinstance(value, (dict, list)) else None)
+                      for key, value in data.items()}
+        else:
+            header = {}
+        with self._cache_lock:
+            self._listing_cache[filename] = (stat.st_mtime_ns, stat.st_size, header)
+        return dict(header)
+
+    def serialize_many_to_json(self, items: Dict[str, Any]) -> Dict[str, str]:
+        """Serialize several saves at once and make them durable together.
+
+        Every payload is encoded and written before any file is synced, so
+        the kernel can coalesce the writeback instead of flushing file by
+        file.
+
+        Args:
+            items: Mapping of output filename (without extension) to data
+
+        Returns:
+            Mapping of each filename to the path it was saved at
+        """
+        pairs = [(self.base_path / f"{filename}.json", self._encode_json(data, None))
+                 for filename, data in items.items()]
+        self._write_many(pairs)
+        for filename in items:
+            self._evict(filename)
+
+        return {filename: str(filepath)
+                for filename, (filepath, _) in zip(items, pairs)}
+
+    def _write_many(self,
+                    pairs: List[Tuple[Path, Union[bytes, Iterable[bytes]]]]) -> None:
+        """Write each payload to a temporary file, fsync them all, then move them in.
+
+        A payload may be an iterable of byte chunks, which is written to the
+        temporary file as it is produced instead of being joined in memory.
+        """
+        temp_paths = [filepath.with_name(f".{filepath.name}.tmp")
+                      for filepath, _ in pairs]
+        descriptors = []
+        try:
+            for temp_path, (_, payload) in zip(temp_paths, pairs):
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                descriptors.append(fd)
+                for chunk in ((payload,) if isinstance(payload, bytes) else payload):
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(fd, view):]
+            for fd in descriptors:
+                os.fsync(fd)
+        except BaseException:
+            for temp_path in temp_paths:
+                if temp_path.exists():
+                    temp_path.unlink()
+            raise
+        finally:
+            for fd in descriptors:
+                os.close(fd)
+
+        for temp_path, (filepath, _) in zip(temp_paths, pairs):
+            os.replace(temp_path, filepath)
+        self._sync_directory()
+
+    def sync(self) -> int:
+        """Flush saves written since the last sync to stable storage.
+
+        Single saves are replaced atomically but not fsynced, keeping fsync
+        off the save path. Call this at checkpoints, such as the end of a
+        round, to make every save written since the last call durable with
+        one directory fsync.
+
+        Returns:
+            Number of files synced
+        """
+        pending, self._unsynced = self._unsynced, set()
+        synced = 0
+        for filepath in pending:
+            try:
+                fd = os.open(filepath, os.O_RDONLY)
+            except FileNotFoundError:
+                continue  # Replaced or deleted since it was written
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            synced += 1
+        if pending:
+            self._sync_directory()
+        return synced
+
+    def _sync_directory(self) -> None:
+        """Persist renames in the save directory where the platform allows it."""
+        try:
+            fd = os.open(self.base_path, os.O_RDONLY)
+        except OSError:
+            return  # Directories cannot be opened on Windows
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def save_metadata_sidecar(self, filename: str, metadata: Dict[str, Any]) -> str:
+        """Write a save's metadata block to a small file beside the save.
+
+        Listings can then read the metadata without parsing the full save.
+        Write the sidecar after the save itself; load_metadata_sidecar treats
+        a sidecar older than its save as stale.
+
+        Args:
+            filename: Save filename (without extension)
+            metadata: The save's ``_metadata`` block
+
+        Returns:
+            Path to the sidecar file
+        """
+        filepath = self.base_path / f"{filename}.{METADATA_SIDECAR_EXTENSION}"
+        with open(filepath, 'wb') as f:
+            f.write(self._encode_json(metadata, None))
+        self._unsynced.add(filepath)
+        return str(filepath)
+
+    def load_metadata_sidecar(self, filename: Union[str, os.DirEntry]
+                              ) -> Optional[Dict[str, Any]]:
+        """Read the metadata sidecar of a JSON save.
+
+        Args:
+            filename: Save filename (without extension), or an entry from
+                scan_save_files
+
+        Returns:
+            The metadata block, or None if the save has no sidecar, the
+            sidecar is older than the save, or either file is unreadable
+        """
+        try:
+            name, _, stat = self._stat_save(filename, 'json')
+            sidecar = self.base_path / f"{name}.{METADATA_SIDECAR_EXTENSION}"
+            if sidecar.stat().st_mtime_ns < stat.st_mtime_ns:
+                return None
+            with open(sidecar, 'rb') as f:
+                metadata = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
     def serialize_to_pickle(self, data: Any, filename: str) -> str:
         """Serialize data to pickle format (for complex Python objects).
 
@@ -88,8 +483,8 @@ class DataSerializer:
         """
         filepath = self.base_path / f"{filename}.pkl"
 
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         return str(filepath)
 
@@ -111,58 +506,94 @@ class DataSerializer:
         if not filepath.exists():
             raise FileNotFoundError(f"Save file not found: {filepath}")
 
-        with open(filepath, 'rb') as f:
+        with open(filepath, 'rb', buffering=WRITE_BUFFER_SIZE) as f:
             data = pickle.load(f)
 
         return data
 
-    def list_save_files(self, extension: str = "json") -> list[str]:
+    def list_save_files(self, extension: str = "json", prefix: str = "") -> list[str]:
         """List all save files with the specified extension.
 
         Args:
             extension: File extension to filter by (without dot)
+            prefix: Only list files whose names start with this prefix
 
         Returns:
             List of save file names (without extension)
         """
-        pattern = f"*.{extension}"
-        files = list(self.base_path.glob(pattern))
-        return [f.stem for f in files]
+        suffix_length = len(extension) + 1
+        return [entry.name[:-suffix_length]
+                for entry in self.scan_save_files(extension, prefix)]
+
+    def scan_save_files(self, extension: str = "json",
+                        prefix: Union[str, Tuple[str, ...]] = "") -> List[os.DirEntry]:
+        """Scan the save directory for files with the specified extension.
+
+        The returned entries cache their stat result, so passing them to
+        get_file_info or peek_header avoids a second stat per file.
+
+        Args:
+            extension: File extension to filter by (without dot)
+            prefix: Only list files whose names start with this prefix, or
+                with any prefix in a tuple
 
-    def delete_save_file(self, filename: str, extension: str = "json") -> bool:
+        Returns:
+            List of directory entries for the matching files
+        """
+        suffixes = (f".{extension}",)
+        if extension == "json":
+            suffixes += tuple(f".json{suffix}" for suffix in COMPRESSED_SUFFIXES)
+        with os.scandir(self.base_path) as entries:
+            return [entry for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffixes)
+                    and not entry.name.startswith('.') and entry.is_file()]
+
+    def delete_save_file(self, filename: Union[str, os.DirEntry],
+                         extension: str = "json") -> bool:
         """Delete a save file.
 
         Args:
-            filename: Filename to delete (without extension)
+            filename: Filename to delete (without extension), or an entry from
+                scan_save_files, which is unlinked without resolving its path
             extension: File extension
 
         Returns:
             True if file was deleted, False if it didn't exist
         """
-        filepath = self.base_path / f"{filename}.{extension}"
+        if isinstance(filename, os.DirEntry):
+            filepath = Path(filename.path)
+            filename = self._save_name(filename, extension)
+        else:
+            filepath = self.base_path / f"{filename}.{extension}"
+            if extension == "json":
+                filepath = self._json_save_path(filename)
+
+        if extension == "json":
+            self._evict(filename)
 
-        if filepath.exists():
+        try:
             filepath.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
 
-    def get_file_info(self, filename: str, extension: str = "json") -> Optional[Dict[str, Any]]:
+    def get_file_info(self, filename: Union[str, os.DirEntry],
+                      extension: str = "json") -> Optional[Dict[str, Any]]:
         """Get information about a save file.
 
         Args:
-            filename: Filename to check (without extension)
+            filename: Filename to check (without extension), or an entry from
+                scan_save_files whose cached stat is reused
             extension: File extension
 
         Returns:
             Dictionary with file information, or None if file doesn't exist
         """
-        filepath = self.base_path / f"{filename}.{extension}"
-
-        if not filepath.exists():
+        try:
+            filename, _, stat = self._stat_save(filename, extension)
+        except FileNotFoundError:
             return None
 
-        stat = filepath.stat()
-
         return {
             'filename': filename,
             'extension': extension,
@@ -181,26 +612,181 @@ class DataSerializer:
         Returns:
             True if data is valid, False otherwise
         """
-        if not isinstance(data, dict):
-            return False
+        required = REQUIRED_SAVE_FIELDS.get(data_type)
+        return (required is not None and isinstance(data, dict)
+                and required.issubset(data.keys()))
 
-        required_fields = {
-            'company': ['id', 'name', 'financial_data', 'operations_data'],
-            'market': ['state', 'round_number'],
-            'simulation': ['current_state', 'round_manager']
-        }
+    def _copy_file(self, source: Path, destination: Path) -> None:
+        """Copy a file and its metadata, letting the kernel share blocks where it can.
 
-        if data_type not in required_fields:
-            return False
+        os.copy_file_range keeps the copy inside the kernel and becomes a
+        reflink on copy-on-write filesystems such as btrfs and XFS. Platforms
+        or filesystems without it fall back to shutil.copy2.
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(),
+                                                    remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                shutil.copystat(source, destination)
+                return
+            except OSError:
+                pass  # e.g. cross-device or unsupported filesystem
+        shutil.copy2(source, destination)
+
+    def _map_saves(self, read: Callable[[Any], Any],
+                   filenames: Sequence[Any]) -> List[Optional[Any]]:
+        """Apply read to each save on a small thread pool, mapping failures to None."""
+        def read_or_none(filename):
+            try:
+                return read(filename)
+            except Exception:
+                return None
+
+        workers = min(MAX_READ_WORKERS, os.cpu_count() or 1, len(filenames))
+        if workers <= 1:
+            return [read_or_none(filename) for filename in filenames]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(read_or_none, filenames))
+
+    def _stat_save(self, filename: Union[str, os.DirEntry],
+                   extension: str) -> Tuple[str, Path, os.stat_result]:
+        """Resolve a save name or scanned entry to its name, path and stat."""
+        if isinstance(filename, os.DirEntry):
+            name = self._save_name(filename, extension)
+            return name, Path(filename.path), filename.stat()
+        filepath = self.base_path / f"{filename}.{extension}"
+        try:
+            return filename, filepath, filepath.stat()
+        except FileNotFoundError:
+            if extension != "json":
+                raise
+            filepath = self._json_save_path(filename)
+            return filename, filepath, filepath.stat()
+
+    def _save_name(self, filename: Union[str, os.DirEntry], extension: str) -> str:
+        """Return a save's filename without extension."""
+        if isinstance(filename, os.DirEntry):
+            name = filename.name
+            if extension == "json" and name.endswith(COMPRESSED_SUFFIXES):
+                name = os.path.splitext(name)[0]
+            return name[:-len(extension) - 1]
+        return filename
+
+    def _json_save_path(self, filename: str) -> Path:
+        """Return the path of a JSON save, preferring plain JSON to compressed ones."""
+        filepath = self.base_path / f"{filename}.json"
+        if not filepath.exists():
+            for suffix in COMPRESSED_SUFFIXES:
+                compressed = filepath.with_name(filepath.name + suffix)
+                if compressed.exists():
+                    return compressed
+        return filepath
+
+    @contextmanager
+    def _open_json_for_write(self, filename: str,
+                             compress: bool) -> Iterator[Tuple[Path, Any]]:
+        """Open a JSON save for writing, compressing it if requested.
+
+        Yields the final path and a binary file object. The data goes to a
+        hidden temporary file that atomically replaces the save once it is
+        complete, so readers never see a partial save. A compressed save also
+        removes any other copy of the same save so loads find it.
+        """
+        filepath = self.base_path / f"{filename}.json"
+        suffix = ''
+        if compress:
+            suffix = '.zst' if zstandard is not None else '.gz'
+            filepath = filepath.with_name(filepath.name + suffix)
+        temp_path = filepath.with_name(f".{filepath.name}.tmp")
 
-        for field in required_fields[data_type]:
-            if field not in data:
-                return False
+        try:
+            if not compress:
+                with open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    yield filepath, f
+            elif zstandard is not None:
+                raw = open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+                compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+                with compressor.stream_writer(raw) as f:
+                    yield filepath, f
+            else:
+                with gzip.open(temp_path, 'wb', compresslevel=COMPRESSION_LEVEL) as f:
+                    yield filepath, f
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+        self._unsynced.add(filepath)
+
+        if compress:
+            plain_path = self.base_path / f"{filename}.json"
+            for stale in [''] + [s for s in COMPRESSED_SUFFIXES if s != suffix]:
+                stale_path = plain_path.with_name(plain_path.name + stale)
+                if stale_path.exists():
+                    stale_path.unlink()
+        self._evict(filename)
+
+    def _parse_json_file(self, filepath: Path) -> Any:
+        """Parse a JSON save, mapping large plain files instead of reading them.
+
+        orjson parses straight from the mapped pages, so a large save is not
+        held twice (page cache plus a bytes copy). The standard library
+        parser only accepts bytes, so without orjson the file is read.
+        """
+        if orjson is not None and filepath.suffix == '.json':
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_READ_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as view:
+                            return orjson.loads(view)
+        return json_loads(self._read_json_bytes(filepath))
+
+    def _read_json_bytes(self, filepath: Path) -> bytes:
+        """Read a JSON save's bytes, decompressing compressed saves."""
+        if filepath.suffix == '.gz':
+            with gzip.open(filepath, 'rb') as f:
+                return f.read()
+        with open(filepath, 'rb') as f:
+            if filepath.suffix != '.zst':
+                return f.read()
+            if zstandard is None:
+                raise ImportError(
+                    f"zstandard is required to read compressed save: {filepath}")
+            with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                return reader.read()
+
+    def _evict(self, filename: str) -> None:
+        """Drop a JSON save from the header and load caches."""
+        with self._cache_lock:
+            self._listing_cache.pop(filename, None)
+            self._load_cache.pop(filename, None)
+
+    def _encode_json(self, data: Any, indent: Optional[int]) -> bytes:
+        """Encode data as UTF-8 JSON, using orjson when it is installed.
+
+        orjson encodes datetimes natively and only indents by two spaces, so
+        other indent widths go through the standard library encoder.
+        """
+        if orjson is not None and indent in (None, PRETTY_INDENT):
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent is not None:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option, default=_json_default)
 
-        return True
+        separators = COMPACT_SEPARATORS if indent is None else None
+        return json.dumps(data, indent=indent, separators=separators,
+                          default=_json_default).encode('utf-8')
 
     def _is_iso_datetime(self, string: str) -> bool:
         """Check if a string is in ISO datetime format."""
+        if not _ISO_DATETIME_PREFIX.match(string):
+            return False
         try:
             datetime.fromisoformat(string)
             return True
@@ -261,7 +847,6 @@ class DataSerializer:
         backup_path = self.base_path / backup_filename
 
         # Copy file
-        import shutil
-        shutil.copy2(original_path, backup_path)
+        self._copy_file(original_path, backup_path)
 
-        return str(backup_path)
\ No newline at end of file
+        return str(backup_path)
@@ -1,10 +1,17 @@
+import csv
+import logging
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+import re
 from pathlib import Path
 import os
-from .data_serializer import DataSerializer
+from .data_serializer import DataSerializer, CSV_EXPORT_HEADER, PRETTY_INDENT, WRITE_BUFFER_SIZE, epoch_millis
 from ..core.market import Market
 
+logger = logging.getLogger(__name__)
+
+# Round number at the end of a market snapshot filename
+_SNAPSHOT_ROUND = re.compile(r'round_(\d+)$')
+
 
 class MarketPersistence:
     """Handles saving and loading of market data."""
@@ -12,12 +19,15 @@ class MarketPersistence:
     def __init__(self, serializer: Optional[DataSerializer] = None):
         self.serializer = serializer or DataSerializer()
 
-    def save_market(self, market: Market, filename: Optional[str] = None) -> str:
+    def save_market(self, market: Market, filename: Optional[str] = None, pretty: bool = False,
+                    compress: bool = False) -> str:
         """Save a market object to file.
 
         Args:
             market: Market object to save
             filename: Optional custom filename (defaults to market_round_X)
+            pretty: Indent the JSON for reading instead of writing it compactly
+            compress: Write a compressed save (see DataSerializer.serialize_to_json)
 
         Returns:
             Path to the saved file
@@ -30,13 +40,15 @@ class MarketPersistence:
 
         # Add metadata
         market_data['_metadata'] = {
-            'saved_at': datetime.now(),
+            'saved_at': epoch_millis(),
             'version': '1.0',
             'type': 'market',
             'round_number': market.round_number
         }
 
-        return self.serializer.serialize_to_json(market_data, filename)
+        return self.serializer.serialize_to_json(market_data, filename,
+                                                 indent=PRETTY_INDENT if pretty else None,
+                                                 compress=compress)
 
     def load_market(self, filename: str) -> Market:
         """Load a market object from file.
@@ -62,17 +74,19 @@ class MarketPersistence:
 
         return Market.from_dict(market_data)
 
-    def save_market_snapshot(self, market: Market) -> str:
+    def save_market_snapshot(self, market: Market, pretty: bool = False, compress: bool = False) -> str:
         """Save a snapshot of current market state.
 
         Args:
             market: Market object
+            pretty: Indent the JSON for reading instead of writing it compactly
+            compress: Write a compressed save (see DataSerializer.serialize_to_json)
 
         Returns:
             Path to the saved snapshot
         """
         filename = f"market_snapshot_round_{market.round_number}"
-        return self.save_market(market, filename)
+        return self.save_market(market, filename, pretty=pretty, compress=compress)
 
     def list_market_saves(self) -> List[Dict[str, Any]]:
         """List all saved market files with metadata.
@@ -80,25 +94,23 @@ class MarketPersistence:
         Returns:
             List of dictionaries containing file information
         """
-        json_files = self.serializer.list_save_files('json')
         market_files = []
 
-        for filename in json_files:
-            if filename.startswith('market_'):
-                file_info = self.serializer.get_file_info(filename, 'json')
-                if file_info:
-                    # Try to get basic info from the file
-                    try:
-                        data = self.serializer.deserialize_from_json(filename)
-                        if self.serializer.validate_save_data(data, 'market'):
-                            file_info['round_number'] = data.get('round_number', 0)
-                            file_info['has_metadata'] = '_metadata' in data
-                            if file_info['has_metadata']:
-                                file_info['saved_at'] = data['_metadata'].get('saved_at')
-                    except:
-                        pass  # Skip files that can't be read
-
-                    market_files.append(file_info)
+        entries = self.serializer.scan_save_files('json', 'market_')
+        for entry, data in zip(entries, self.serializer.peek_headers(entries)):
+            file_info = self.serializer.get_file_info(entry, 'json')
+            if file_info:
+                # Try to get basic info from the file
+                try:
+                    if self.serializer.validate_save_data(data, 'market'):
+                        file_info['round_number'] = data.get('round_number', 0)
+                        file_info['has_metadata'] = '_metadata' in data
+                        if file_info['has_metadata']:
+                            file_info['saved_at'] = self.serializer.parse_datetime(data['_metadata'].get('saved_at'))
+                except:
+                    pass  # Skip files that can't be read
+
+                market_files.append(file_info)
 
         return market_files
 
@@ -116,17 +128,12 @@ class MarketPersistence:
         snapshots = []
 
         for save_info in all_saves:
-            filename = save_info['filename']
-            if 'round_' in filename:
-                try:
-                    # Extract round number from filename
-                    round_part = filename.split('round_')[-1]
-                    round_num = int(round_part)
-                    if round_num >= start_round and (end_round is None or round_num <= end_round):
-                        save_info['round_number'] = round_num
-                        snapshots.append(save_info)
-                except (ValueError, IndexError):
-                    continue
+            match = _SNAPSHOT_ROUND.search(save_info['filename'])
+            if match:
+                round_num = int(match.group(1))
+                if round_num >= start_round and (end_round is None or round_num <= end_round):
+                    save_info['round_number'] = round_num
+                    snapshots.append(save_info)
 
         # Sort by round number
         snapshots.sort(key=lambda x: x.get('round_number', 0))
@@ -154,35 +161,28 @@ class MarketPersistence:
         Returns:
             Path to the exported CSV file
         """
-        import csv
-
         filepath = Path(self.serializer.base_path) / f"{filename}.csv"
 
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header
-            writer.writerow(['Category', 'Metric', 'Value'])
-
-            # Write market state
-            state = market.get_market_state()
-            writer.writerow(['Market State', 'Demand Level', state.demand_level])
-            writer.writerow(['Market State', 'Price Index', state.price_index])
-            writer.writerow(['Market State', 'Competition Intensity', state.competition_intensity])
-
-            # Write economic indicators
-            for indicator, value in state.economic_indicators.items():
-                writer.writerow(['Economic', indicator.replace('_', ' ').title(), value])
-
-            # Write trend factors
-            for factor, value in state.trend_factors.items():
-                writer.writerow(['Trends', factor.title(), value])
-
-            # Write competitor summary
-            competitors = market.get_competitor_prices()
-            writer.writerow(['Competitors', 'Count', len(competitors)])
-            for i, price in enumerate(competitors):
-                writer.writerow(['Competitors', f'Competitor {i+1} Price', price])
+        state = market.get_market_state()
+        competitors = market.get_competitor_prices()
+        rows = [
+            CSV_EXPORT_HEADER,
+            # Market state
+            ('Market State', 'Demand Level', state.demand_level),
+            ('Market State', 'Price Index', state.price_index),
+            ('Market State', 'Competition Intensity', state.competition_intensity),
+        ]
+        # Economic indicators
+        rows.extend(('Economic', indicator.replace('_', ' ').title(), value)
+                    for indicator, value in state.economic_indicators.items())
+        # Trend factors
+        rows.extend(('Trends', factor.title(), value) for factor, value in state.trend_factors.items())
+        # Competitor summary
+        rows.append(('Competitors', 'Count', len(competitors)))
+        rows.extend(('Competitors', f'Competitor {i+1} Price', price) for i, price in enumerate(competitors))
+
+        with open(filepath, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            csv.writer(csvfile).writerows(rows)
 
         return str(filepath)
 
@@ -232,15 +232,8 @@ class MarketPersistence:
         Returns:
             List of scenario names
         """
-        json_files = self.serializer.list_save_files('json')
-        scenarios = []
-
-        for filename in json_files:
-            if filename.startswith('scenario_'):
-                scenario_name = filename.replace('scenario_', '')
-                scenarios.append(scenario_name)
-
-        return scenarios
+        prefix = 'scenario_'
+        return [filename[len(prefix):] for filename in self.serializer.list_save_files('json', prefix)]
 
     def get_market_history(self, max_rounds: int = 10) -> List[Dict[str, Any]]:
         """Get historical market data for recent rounds.
@@ -249,20 +242,21 @@ class MarketPersistence:
             max_rounds: Maximum number of recent rounds to include
 
         Returns:
-            List of market data dictionaries
+            List of market data dictionaries; nested values are shared with
+            the serializer's load cache and must not be modified
         """
         snapshots = self.find_market_snapshots()
         recent_snapshots = snapshots[-max_rounds:] if len(snapshots) > max_rounds else snapshots
 
+        filenames = [snapshot['filename'] for snapshot in recent_snapshots]
+        loaded = self.serializer.load_many_cached(filenames)
         history = []
-        for snapshot in recent_snapshots:
-            try:
-                market_data = self.serializer.deserialize_from_json(snapshot['filename'])
-                market_data.pop('_metadata', None)  # Remove metadata
-                history.append(market_data)
-            except:
-                continue  # Skip corrupted files
-
+        for filename, market_data in zip(filenames, loaded):
+            if not isinstance(market_data, dict):
+                logger.warning("Skipping unreadable market snapshot %s", filename)
+                continue
+            history.append({key: value for key, value in market_data.items()
+                            if key != '_metadata'})
         return history
 
     def compare_market_states(self, round1: int, round2: int) -> Dict[str, Any]:
@@ -276,25 +270,23 @@ class MarketPersistence:
             Dictionary containing comparison data
         """
         try:
-            market1_data = self.serializer.deserialize_from_json(f"market_round_{round1}")
-            market2_data = self.serializer.deserialize_from_json(f"market_round_{round2}")
+            state1 = self.serializer.load_cached(f"market_round_{round1}")['state']
+            state2 = self.serializer.load_cached(f"market_round_{round2}")['state']
         except FileNotFoundError:
             return {'error': 'One or both market saves not found'}
 
         comparison = {
             'round1': round1,
             'round2': round2,
-            'demand_change': market2_data['state']['demand_level'] - market1_data['state']['demand_level'],
-            'price_index_change': market2_data['state']['price_index'] - market1_data['state']['price_index'],
-            'competition_change': market2_data['state']['competition_intensity'] - market1_data['state']['competition_intensity']
+            'demand_change': state2['demand_level'] - state1['demand_level'],
+            'price_index_change': state2['price_index'] - state1['price_index'],
+            'competition_change': state2['competition_intensity'] - state1['competition_intensity']
         }
 
         # Compare economic indicators
-        econ_changes = {}
-        for indicator in market1_data['state']['economic_indicators']:
-            if indicator in market2_data['state']['economic_indicators']:
-                econ_changes[indicator] = market2_data['state']['economic_indicators'][indicator] - market1_data['state']['economic_indicators'][indicator]
-
-        comparison['economic_changes'] = econ_changes
+        econ1 = state1['economic_indicators']
+        econ2 = state2['economic_indicators']
+        comparison['economic_changes'] = {indicator: econ2[indicator] - value
+                                          for indicator, value in econ1.items() if indicator in econ2}
 
         return comparison
\ No newline at end of file
@@ -1,21 +1,121 @@
-from typing import Dict, Any, Optional, List
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 import os
-from .data_serializer import DataSerializer
+from .data_serializer import DataSerializer, METADATA_SIDECAR_EXTENSION, WRITE_BUFFER_SIZE, epoch_millis
 from .company_persistence import CompanyPersistence
 from .market_persistence import MarketPersistence
 from ..core.simulation_engine import SimulationEngine
 from ..core.simulation_state import SimulationState
 
+# Header row of the per-round simulation CSV export
+SIMULATION_CSV_HEADER = ('Round', 'Revenue', 'Costs', 'Profit', 'Market Share',
+                         'Customer Satisfaction', 'Efficiency')
+
+# Filename prefix of each save type, as classified by _get_save_type
+SAVE_TYPE_PREFIXES = {
+    'quick_save': 'quicksave_',
+    'auto_save': 'autosave_',
+    'snapshot': 'simulation_snapshot_',
+    'manual_save': 'simulation_'
+}
+
+# Filename prefixes of every simulation save
+SIMULATION_SAVE_PREFIXES = ('simulation_', 'quicksave_', 'autosave_')
+
+# Key under which a differential save stores its changes
+DELTA_KEY = '_delta'
+
+
+def _diff_payload(old: Dict[str, Any], new: Dict[str, Any], path: Tuple[str, ...] = (),
+                  ops: Optional[List[list]] = None) -> List[list]:
+    """Describe how to turn one save payload into another.
+
+    Nested dictionaries are compared key by key. Lists that only grew at the
+    end, such as histories, are recorded as an extension with the new items.
+
+    Returns:
+        Operations ``['set', path, value]``, ``['extend', path, items]`` and
+        ``['del', path]``, for _apply_delta
+    """
+    if ops is None:
+        ops = []
+    for key, value in new.items():
+        key_path = path + (key,)
+        if key not in old:
+            ops.append(['set', key_path, value])
+            continue
+        previous = old[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            _diff_payload(previous, value, key_path, ops)
+        elif (isinstance(value, list) and isinstance(previous, list)
+              and len(value) > len(previous) and value[:len(previous)] == previous):
+            ops.append(['extend', key_path, value[len(previous):]])
+        elif value != previous:
+            ops.append(['set', key_path, value])
+    for key in old.keys() - new.keys():
+        ops.append(['del', path + (key,)])
+    return ops
+
+
+def _apply_delta(data: Dict[str, Any], ops: List[list]) -> Dict[str, Any]:
+    """Apply operations from _diff_payload to a payload in place."""
+    for op, key_path, *value in ops:
+        target = data
+        for key in key_path[:-1]:
+            target = target[key]
+        if op == 'set':
+            target[key_path[-1]] = value[0]
+        elif op == 'extend':
+            target[key_path[-1]].extend(value[0])
+        else:
+            target.pop(key_path[-1], None)
+    return data
+
+
+def _history_csv_row(history_item: Dict[str, Any]) -> tuple:
+    """Build the export CSV row for one recorded simulation state."""
+    company = history_item.get('player_company', {})
+    financial = company.get('financial_data', {})
+    operations = company.get('operations_data', {})
+    return (
+        history_item.get('round_number', 0),
+        financial.get('revenue', 0),
+        financial.get('costs', 0),
+        financial.get('profit', 0),
+        company.get('market_data', {}).get('market_share', 0),
+        operations.get('customer_satisfaction', 0),
+        operations.get('efficiency', 0)
+    )
+
 
 class SimulationPersistence:
     """Handles saving and loading of complete simulation states."""
 
-    def __init__(self, serializer: Optional[DataSerializer] = None):
+    def __init__(self, serializer: Optional[DataSerializer] = None, max_delta_chain: int = 0):
+        """Create the simulation persistence handler.
+
+        Args:
+            serializer: Serializer for the save directory
+            max_delta_chain: Number of quick/auto saves written as differences
+                from the previous one before the next full save (0 always
+                writes full saves). A differential save needs every save it
+                was built on, so keep those when deleting saves by hand;
+                cleanup_old_saves does this automatically.
+        """
         self.serializer = serializer or DataSerializer()
-        self.company_persistence = CompanyPersistence(serializer)
-        self.market_persistence = MarketPersistence(serializer)
+        self.company_persistence = CompanyPersistence(self.serializer)
+        self.market_persistence = MarketPersistence(self.serializer)
+        self.max_delta_chain = max_delta_chain
+        # Per save type: filenames of the current delta chain (full save
+        # first), and the payload and saved_at of its newest save as they read
+        # back from disk. Quick saves and auto saves keep separate chains so
+        # cleaning up one type never deletes a base the other type needs.
+        self._delta_chains: Dict[str, List[str]] = {}
+        self._last_payloads: Dict[str, Dict[str, Any]] = {}
+        self._last_saved_at: Dict[str, Any] = {}
 
     def save_simulation(self, simulation_engine: SimulationEngine, filename: str) -> str:
         """Save a complete simulation state.
@@ -27,41 +127,70 @@ class SimulationPersistence:
         Returns:
             Path to the saved file
         """
-        # Get current simulation state
+        return self._write_save(self._build_save_payload(simulation_engine), filename)
+
+    def _build_save_payload(self, simulation_engine: SimulationEngine) -> Dict[str, Any]:
+        """Assemble the data written by every simulation save variant.
+
+        Raises:
+            ValueError: If there is no active simulation
+        """
         current_state = simulation_engine.get_current_state()
         if not current_state:
             raise ValueError("No active simulation to save")
 
-        # Build comprehensive save data
-        save_data = {
-            'simulation_config': {
-                'max_rounds': simulation_engine.config.max_rounds,
-                'num_competitors': simulation_engine.config.num_competitors,
-                'initial_market_demand': simulation_engine.config.initial_market_demand,
-                'market_volatility': simulation_engine.config.market_volatility,
-                'event_frequency': simulation_engine.config.event_frequency
+        round_manager = simulation_engine.round_manager
+        event_manager = simulation_engine.event_manager
+
+        # Metadata first so readers find it early
+        return {
+            '_metadata': {
+                'saved_at': epoch_millis(),
+                'version': '1.0',
+                'type': 'simulation',
+                'round_number': current_state.round_number,
+                'company_name': current_state.player_company.name
             },
+            'simulation_config': simulation_engine.config.to_dict(),
             'current_state': current_state.to_dict(),
             'round_manager': {
-                'current_round': simulation_engine.round_manager.get_current_round(),
-                'max_rounds': simulation_engine.round_manager.max_rounds,
-                'is_simulation_over': simulation_engine.round_manager.is_simulation_over()
+                'current_round': round_manager.get_current_round(),
+                'max_rounds': round_manager.max_rounds,
+                'is_simulation_over': round_manager.is_simulation_over()
             },
             'event_manager': {
-                'active_events': simulation_engine.event_manager.get_active_events(),
-                'event_history': simulation_engine.event_manager.get_event_history()
+                'active_events': event_manager.get_active_events(),
+                'event_history': event_manager.get_event_history(include_timestamps=True)
             },
-            'simulation_history': simulation_engine.simulation_history,
-            '_metadata': {
-                'saved_at': datetime.now(),
-                'version': '1.0',
-                'type': 'simulation',
-                'round_number': current_state.round_number,
-                'company_name': current_state.player_company.name
-            }
+            **simulation_engine.history_save_data()
         }
 
-        return self.serializer.serialize_to_json(save_data, filename)
+    def flush(self) -> int:
+        """Make every save written since the last flush durable.
+
+        Saves are not fsynced one by one; call this once per batch, for
+        example after each round's auto-save.
+
+        Returns:
+            Number of files synced
+        """
+        return self.serializer.sync()
+
+    def _write_save(self, save_data: Dict[str, Any], filename: str) -> str:
+        """Write a save payload and its metadata sidecar."""
+        self._drop_delta_chains(filename)
+        filepath = self.serializer.serialize_to_json(save_data, filename)
+        self.serializer.save_metadata_sidecar(filename, save_data['_metadata'])
+        return filepath
+
+    def _drop_delta_chains(self, filename: str) -> None:
+        """Start a new delta chain for every save type whose chain uses a save."""
+        for save_type, chain in list(self._delta_chains.items()):
+            if filename in chain:
+                # Overwriting a save that later differential saves build on
+                del self._delta_chains[save_type]
+                self._last_payloads.pop(save_type, None)
+                self._last_saved_at.pop(save_type, None)
 
     def load_simulation(self, filename: str) -> SimulationEngine:
         """Load a complete simulation state.
@@ -76,7 +205,7 @@ class SimulationPersistence:
             FileNotFoundError: If file doesn't exist
             ValueError: If data is invalid
         """
-        save_data = self.serializer.deserialize_from_json(filename)
+        save_data = self._load_save_data(filename)
 
         # Validate data
         if not self.serializer.validate_save_data(save_data, 'simulation'):
@@ -92,21 +221,19 @@ class SimulationPersistence:
 
         # Restore round manager
         round_data = save_data.get('round_manager', {})
-        simulation_engine.round_manager.current_round = round_data.get('current_round', 0)
+        simulation_engine.round_manager.reset_to(round_data.get('current_round', 0))
 
         # Restore event manager
         event_data = save_data.get('event_manager', {})
-        if 'active_events' in event_data:
-            simulation_engine.event_manager.active_events = event_data['active_events']
-        if 'event_history' in event_data:
-            simulation_engine.event_manager.event_history = event_data['event_history']
+        simulation_engine.event_manager.reset_to(event_data.get('active_events', []),
+                                                 event_data.get('event_history', []))
 
         # Restore simulation state
         state_data = save_data.get('current_state')
         simulation_engine.current_state = SimulationState.from_dict(state_data)
 
         # Restore simulation history
-        simulation_engine.simulation_history = save_data.get('simulation_history', [])
+        simulation_engine.restore_history(save_data)
 
         return simulation_engine
 
@@ -119,12 +246,12 @@ class SimulationPersistence:
         Returns:
             Path to the saved snapshot
         """
-        current_state = simulation_engine.get_current_state()
-        if not current_state:
+        if not simulation_engine.get_current_state():
             raise ValueError("No active simulation to snapshot")
 
-        filename = f"simulation_snapshot_round_{current_state.round_number}"
-        return self.save_simulation(simulation_engine, filename)
+        save_data = self._build_save_payload(simulation_engine)
+        filename = f"simulation_snapshot_round_{save_data['_metadata']['round_number']}"
+        return self._write_save(save_data, filename)
 
     def quick_save(self, simulation_engine: SimulationEngine) -> str:
         """Perform a quick save with automatic naming.
@@ -137,7 +264,7 @@ class SimulationPersistence:
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"quicksave_{timestamp}"
-        return self.save_simulation(simulation_engine, filename)
+        return self._save_incremental(simulation_engine, filename, 'quick_save')
 
     def auto_save(self, simulation_engine: SimulationEngine, interval: int = 5) -> Optional[str]:
         """Perform an auto-save if the current round is a multiple of the interval.
@@ -152,35 +279,103 @@ class SimulationPersistence:
         current_round = simulation_engine.round_manager.get_current_round()
         if current_round > 0 and current_round % interval == 0:
             filename = f"autosave_round_{current_round}"
-            return self.save_simulation(simulation_engine, filename)
+            return self._save_incremental(simulation_engine, filename, 'auto_save')
         return None
 
+    def _save_incremental(self, simulation_engine: SimulationEngine, filename: str,
+                          save_type: str) -> str:
+        """Save a simulation, as a difference from the previous save when possible.
+
+        Args:
+            simulation_engine: SimulationEngine instance
+            filename: Output filename (without extension)
+            save_type: Save type whose delta chain the save extends
+
+        Returns:
+            Path to the saved file
+        """
+        if self.max_delta_chain <= 0:
+            return self.save_simulation(simulation_engine, filename)
+
+        save_data = self._build_save_payload(simulation_engine)
+        payload = self.serializer.json_round_trip(save_data)
+        metadata = payload.pop('_metadata')
+
+        chain = self._delta_chains.get(save_type)
+        last_payload = self._last_payloads.get(save_type)
+        if (last_payload is None or not chain or len(chain) > self.max_delta_chain
+                or filename in chain):
+            filepath = self._write_save(save_data, filename)
+            self._delta_chains[save_type] = [filename]
+        else:
+            # The base's saved_at identifies the exact save the delta was
+            # built on; another game may later overwrite the same filename
+            metadata['delta_base'] = chain[-1]
+            metadata['delta_base_saved_at'] = self._last_saved_at.get(save_type)
+            delta = {'_metadata': metadata,
+                     DELTA_KEY: _diff_payload(last_payload, payload)}
+            filepath = self.serializer.serialize_to_json(delta, filename)
+            self.serializer.save_metadata_sidecar(filename, metadata)
+            chain.append(filename)
+
+        self._last_payloads[save_type] = payload
+        self._last_saved_at[save_type] = metadata['saved_at']
+        return filepath
+
+    def _load_save_data(self, filename: str) -> Dict[str, Any]:
+        """Load a simulation save, replaying differential saves onto their base.
+
+        Raises:
+            ValueError: If a base save was overwritten after the differential
+                save built on it was written
+        """
+        chain = [self.serializer.deserialize_from_json(filename)]
+        while isinstance(chain[-1], dict) and DELTA_KEY in chain[-1]:
+            delta_metadata = chain[-1]['_metadata']
+            base = delta_metadata['delta_base']
+            chain.append(self.serializer.deserialize_from_json(base))
+            base_saved_at = chain[-1].get('_metadata', {}).get('saved_at')
+            if base_saved_at != delta_metadata.get('delta_base_saved_at'):
+                raise ValueError(f"Save {base} was overwritten after "
+                                 f"{filename} was built on it")
+
+        save_data = chain.pop()
+        while chain:
+            delta = chain.pop()
+            _apply_delta(save_data, delta[DELTA_KEY])
+            save_data['_metadata'] = delta['_metadata']
+        return save_data
+
     def list_simulation_saves(self) -> List[Dict[str, Any]]:
         """List all saved simulation files with metadata.
 
         Returns:
             List of dictionaries containing file information
         """
-        json_files = self.serializer.list_save_files('json')
         simulation_files = []
-
-        for filename in json_files:
-            if filename.startswith(('simulation_', 'quicksave_', 'autosave_')):
-                file_info = self.serializer.get_file_info(filename, 'json')
-                if file_info:
-                    # Try to get basic info from the file
-                    try:
-                        data = self.serializer.deserialize_from_json(filename)
-                        if self.serializer.validate_save_data(data, 'simulation'):
-                            metadata = data.get('_metadata', {})
-                            file_info['round_number'] = metadata.get('round_number', 0)
-                            file_info['company_name'] = metadata.get('company_name', 'Unknown')
-                            file_info['saved_at'] = metadata.get('saved_at')
-                            file_info['save_type'] = self._get_save_type(filename)
-                    except:
-                        pass  # Skip files that can't be read
-
-                    simulation_files.append(file_info)
+        serializer = self.serializer
+
+        for entry in serializer.scan_save_files('json', SIMULATION_SAVE_PREFIXES):
+            file_info = serializer.get_file_info(entry, 'json')
+            if file_info:
+                filename = file_info['filename']
+                # Try to get basic info from the metadata sidecar, then the file
+                try:
+                    metadata = serializer.load_metadata_sidecar(entry)
+                    if metadata is None or metadata.get('type') != 'simulation':
+                        data = serializer.peek_header(entry)
+                        metadata = (data.get('_metadata', {})
+                                    if serializer.validate_save_data(data, 'simulation')
+                                    or DELTA_KEY in data else None)
+                    if metadata is not None:
+                        file_info['round_number'] = metadata.get('round_number', 0)
+                        file_info['company_name'] = metadata.get('company_name', 'Unknown')
+                        file_info['saved_at'] = serializer.parse_datetime(metadata.get('saved_at'))
+                        file_info['save_type'] = self._get_save_type(filename)
+                except:
+                    pass  # Skip files that can't be read
+
+                simulation_files.append(file_info)
 
         return simulation_files
 
@@ -198,12 +393,21 @@ class SimulationPersistence:
     def delete_simulation_save(self, filename: str) -> bool:
         """Delete a simulation save file.
 
+        A save that a differential save is built on is kept, as
+        cleanup_old_saves does; delete the differential saves first.
+
         Args:
             filename: Filename to delete (without extension)
 
         Returns:
             True if deleted successfully
         """
+        for entry in self.serializer.scan_save_files('json', SIMULATION_SAVE_PREFIXES):
+            metadata = self.serializer.load_metadata_sidecar(entry)
+            if metadata and metadata.get('delta_base') == filename:
+                return False
+        self._drop_delta_chains(filename)
+        self.serializer.delete_save_file(filename, METADATA_SIDECAR_EXTENSION)
         return self.serializer.delete_save_file(filename, 'json')
 
     def export_simulation_to_csv(self, simulation_engine: SimulationEngine, filename: str) -> str:
@@ -216,32 +420,13 @@ class SimulationPersistence:
         Returns:
             Path to the exported CSV file
         """
-        import csv
-
         filepath = Path(self.serializer.base_path) / f"{filename}.csv"
 
-        with open(filepath, 'w', newline='') as csvfile:
+        with open(filepath, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
-
-            # Write header
-            writer.writerow(['Round', 'Revenue', 'Costs', 'Profit', 'Market Share', 'Customer Satisfaction', 'Efficiency'])
-
-            # Write historical data
-            for history_item in simulation_engine.simulation_history:
-                company = history_item.get('player_company', {})
-                financial = company.get('financial_data', {})
-                market = company.get('market_data', {})
-                operations = company.get('operations_data', {})
-
-                writer.writerow([
-                    history_item.get('round_number', 0),
-                    financial.get('revenue', 0),
-                    financial.get('costs', 0),
-                    financial.get('profit', 0),
-                    market.get('market_share', 0),
-                    operations.get('customer_satisfaction', 0),
-                    operations.get('efficiency', 0)
-                ])
+            writer.writerow(SIMULATION_CSV_HEADER)
+            # Rows are streamed so file-backed history is never held in memory whole
+            writer.writerows(map(_history_csv_row, simulation_engine.iter_history()))
 
         return str(filepath)
 
@@ -274,36 +459,27 @@ class SimulationPersistence:
         if not current_state:
             raise ValueError("No active simulation to save")
 
-        saved_files = {}
-
-        # Save company
-        company_file = self.company_persistence.save_company(
-            current_state.player_company,
-            f"{base_filename}_company"
-        )
-        saved_files['company'] = company_file
-
-        # Save market
-        market_file = self.market_persistence.save_market(
-            current_state.market,
-            f"{base_filename}_market"
-        )
-        saved_files['market'] = market_file
-
-        # Save competitors
         competitors_data = {
             'competitors': current_state.competitors,
             '_metadata': {
-                'saved_at': datetime.now(),
+                'saved_at': epoch_millis(),
                 'version': '1.0',
                 'type': 'competitors',
                 'round_number': current_state.round_number
             }
         }
-        competitors_file = self.serializer.serialize_to_json(competitors_data, f"{base_filename}_competitors")
-        saved_files['competitors'] = competitors_file
 
-        return saved_files
+        # The components are independent files, so encode and write them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'company': executor.submit(self.company_persistence.save_company,
+                                           current_state.player_company, f"{base_filename}_company"),
+                'market': executor.submit(self.market_persistence.save_market,
+                                          current_state.market, f"{base_filename}_market"),
+                'competitors': executor.submit(self.serializer.serialize_to_json,
+                                               competitors_data, f"{base_filename}_competitors")
+            }
+            return {component: future.result() for component, future in futures.items()}
 
     def load_game_components_separately(self, base_filename: str) -> Dict[str, Any]:
         """Load different components of the simulation separately.
@@ -314,29 +490,26 @@ class SimulationPersistence:
         Returns:
             Dictionary containing loaded components
         """
-        components = {}
-
-        try:
-            # Load company
-            components['company'] = self.company_persistence.load_company(f"{base_filename}_company")
-        except FileNotFoundError:
-            pass
-
-        try:
-            # Load market
-            components['market'] = self.market_persistence.load_market(f"{base_filename}_market")
-        except FileNotFoundError:
-            pass
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'company': executor.submit(self.company_persistence.load_company, f"{base_filename}_company"),
+                'market': executor.submit(self.market_persistence.load_market, f"{base_filename}_market"),
+                'competitors': executor.submit(self._load_competitors, f"{base_filename}_competitors")
+            }
 
-        try:
-            # Load competitors
-            competitors_data = self.serializer.deserialize_from_json(f"{base_filename}_competitors")
-            components['competitors'] = competitors_data.get('competitors', [])
-        except FileNotFoundError:
-            pass
+        components = {}
+        for component, future in futures.items():
+            try:
+                components[component] = future.result()
+            except FileNotFoundError:
+                pass  # Component was not saved
 
         return components
 
+    def _load_competitors(self, filename: str) -> List[Dict[str, Any]]:
+        """Load the competitor list written by save_game_components_separately."""
+        return self.serializer.deserialize_from_json(filename).get('competitors', [])
+
     def get_save_file_summary(self, filename: str) -> Dict[str, Any]:
         """Get a summary of what's in a save file without loading the full data.
 
@@ -347,7 +520,7 @@ class SimulationPersistence:
             Dictionary with save file summary
         """
         try:
-            data = self.serializer.deserialize_from_json(filename)
+            data = self._load_save_data(filename)
             metadata = data.get('_metadata', {})
 
             summary = {
@@ -355,7 +528,7 @@ class SimulationPersistence:
                 'save_type': self._get_save_type(filename),
                 'round_number': metadata.get('round_number', 0),
                 'company_name': metadata.get('company_name', 'Unknown'),
-                'saved_at': metadata.get('saved_at'),
+                'saved_at': self.serializer.parse_datetime(metadata.get('saved_at')),
                 'version': metadata.get('version', 'Unknown'),
                 'has_company_data': 'player_company' in data.get('current_state', {}),
                 'has_market_data': 'market' in data.get('current_state', {}),
@@ -382,19 +555,56 @@ class SimulationPersistence:
         Returns:
             Number of files deleted
         """
-        saves = self.list_simulation_saves()
-        type_saves = [s for s in saves if s.get('save_type') == save_type]
-
-        if len(type_saves) <= keep_recent:
+        if save_type not in SAVE_TYPE_PREFIXES:
             return 0
 
-        # Sort by save time (newest first)
-        type_saves.sort(key=lambda x: x.get('saved_at', datetime.min), reverse=True)
+        # Only the directory is scanned; save age comes from the file mtime
+        # (saves are replaced atomically, so it is the time of the last save).
+        # Saves of every type are collected because a differential save may be
+        # built on a save of another type.
+        saved_at = {}
+        entries = {}
+        other_saves = set()
+        for entry in self.serializer.scan_save_files('json', SIMULATION_SAVE_PREFIXES):
+            file_info = self.serializer.get_file_info(entry, 'json')
+            if not file_info:
+                continue
+            filename = file_info['filename']
+            if self._get_save_type(filename) != save_type:
+                other_saves.add(filename)
+                continue
+            # get_file_info reuses the entry's cached stat
+            mtime = entry.stat().st_mtime_ns
+            saved_at[filename] = max(mtime, saved_at.get(filename, 0))
+            entries.setdefault(filename, []).append(entry)
+
+        if len(saved_at) <= keep_recent:
+            return 0
 
-        # Delete old saves
+        # Sort by save time (newest first); saves written within the filesystem's
+        # timestamp resolution fall back to name order, where a longer round
+        # or timestamp suffix is the later save
+        type_saves = sorted(saved_at, reverse=True,
+                            key=lambda name: (saved_at[name], len(name), name))
+
+        # Keep older saves that any remaining differential save is built on
+        required = set()
+        pending = type_saves[:keep_recent] + list(other_saves)
+        while pending:
+            metadata = self.serializer.load_metadata_sidecar(pending.pop())
+            base = metadata.get('delta_base') if metadata else None
+            if base and base not in required:
+                required.add(base)
+                pending.append(base)
+
+        # Delete old saves by their scanned entries, along with their metadata sidecars
         deleted_count = 0
-        for save in type_saves[keep_recent:]:
-            if self.delete_simulation_save(save['filename']):
+        for filename in type_saves[keep_recent:]:
+            if filename in required:
+                continue
+            self.serializer.delete_save_file(filename, METADATA_SIDECAR_EXTENSION)
+            deleted = [self.serializer.delete_save_file(entry, 'json') for entry in entries[filename]]
+            if any(deleted):
                 deleted_count += 1
 
-        return deleted_count
\ No newline at end of file
+        return deleted_count
@@ -1,12 +1,25 @@
+import copy
 import json
+import logging
 import os
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 from ..core.market import Market
 from ..core.company import Company
+from ..core.simulation_engine import SimulationConfig
+from ..core._compat import json_default, json_dumps_bytes, json_loads
 from ..persistence.data_serializer import DataSerializer
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _split_key_path(key: str) -> Tuple[str, ...]:
+    """Split a dotted customization key into its path segments."""
+    return tuple(key.split('.'))
+
 
 class ScenarioLoader:
     """Loads and manages market scenarios for the business simulation."""
@@ -15,6 +28,10 @@ class ScenarioLoader:
         self.scenarios_dir = Path(scenarios_dir)
         self.scenarios_dir.mkdir(parents=True, exist_ok=True)
         self.serializer = DataSerializer(str(self.scenarios_dir))
+        # Parsed scenarios keyed by path, tagged with the (mtime_ns, size) they were read at
+        self._scenario_cache: Dict[Path, Tuple[int, int, Any]] = {}
+        # SimulationConfig is frozen, so equal config sections share one instance
+        self._config_cache: Dict[frozenset, SimulationConfig] = {}
 
     def load_scenario(self, scenario_name: str) -> Dict[str, Any]:
         """Load a complete scenario by name.
@@ -29,19 +46,66 @@ class ScenarioLoader:
             FileNotFoundError: If scenario doesn't exist
             ValueError: If scenario data is invalid
         """
-        scenario_file = self.scenarios_dir / f"{scenario_name}.json"
+        scenario_data = self.read_scenario(scenario_name)
+
+        # Callers own the result, so hand out a copy of the cached parse
+        return copy.deepcopy(scenario_data)
+
+    def read_scenario(self, scenario_name: str) -> Dict[str, Any]:
+        """Load and validate a scenario, returning the shared cached parse.
+
+        The result must not be mutated; use load_scenario for a private copy.
 
-        if not scenario_file.exists():
-            raise FileNotFoundError(f"Scenario '{scenario_name}' not found")
+        Args:
+            scenario_name: Name of the scenario to read
+
+        Returns:
+            Cached scenario data, shared with other callers
+
+        Raises:
+            FileNotFoundError: If scenario doesn't exist
+            ValueError: If scenario data is invalid
+        """
+        scenario_file = self.scenarios_dir / f"{scenario_name}.json"
 
-        with open(scenario_file, 'r', encoding='utf-8') as f:
-            scenario_data = json.load(f)
+        try:
+            scenario_data = self._load_scenario_file(scenario_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Scenario '{scenario_name}' not found") from None
 
         # Validate scenario structure
         self._validate_scenario(scenario_data)
 
         return scenario_data
 
+    def _load_scenario_file(self, path: Path) -> Any:
+        """Parse a scenario file, reusing the cached result while it is unchanged on disk.
+
+        Args:
+            path: Path of the scenario file
+
+        Returns:
+            Parsed JSON data, shared with the cache
+        """
+        st = path.stat()
+        cached = self._scenario_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        with open(path, 'rb') as f:
+            scenario_data = json_loads(f.read())
+
+        self._scenario_cache[path] = (st.st_mtime_ns, st.st_size, scenario_data)
+        return scenario_data
+
+    def invalidate(self, scenario_name: str):
+        """Drop the cached parse of a scenario after its file was written elsewhere.
+
+        Args:
+            scenario_name: Name of the scenario
+        """
+        self._scenario_cache.pop(self.scenarios_dir / f"{scenario_name}.json", None)
+
     def list_available_scenarios(self) -> List[Dict[str, Any]]:
         """List all available scenarios with metadata.
 
@@ -52,8 +116,7 @@ class ScenarioLoader:
 
         for scenario_file in self.scenarios_dir.glob("*.json"):
             try:
-                with open(scenario_file, 'r', encoding='utf-8') as f:
-                    scenario_data = json.load(f)
+                scenario_data = self._load_scenario_file(scenario_file)
 
                 if self._is_valid_scenario(scenario_data):
                     scenario_info = {
@@ -62,14 +125,14 @@ class ScenarioLoader:
                         'description': scenario_data.get('description', ''),
                         'difficulty': scenario_data.get('difficulty', 'normal'),
                         'estimated_duration': scenario_data.get('estimated_duration', 10),
-                        'tags': scenario_data.get('tags', []),
+                        'tags': list(scenario_data.get('tags', [])),
                         'created_at': scenario_data.get('created_at'),
                         'version': scenario_data.get('version', '1.0')
                     }
                     scenarios.append(scenario_info)
 
-            except (json.JSONDecodeError, KeyError):
-                continue  # Skip invalid scenario files
+            except (json.JSONDecodeError, KeyError, FileNotFoundError):
+                continue  # Skip invalid or vanished scenario files
 
         return scenarios
 
@@ -83,8 +146,8 @@ class ScenarioLoader:
             Scenario information dictionary, or None if not found
         """
         try:
-            scenario_data = self.load_scenario(scenario_name)
-            return {
+            scenario_data = self.read_scenario(scenario_name)
+            return copy.deepcopy({
                 'name': scenario_name,
                 'title': scenario_data.get('title', scenario_name),
                 'description': scenario_data.get('description', ''),
@@ -98,7 +161,7 @@ class ScenarioLoader:
                 'starting_conditions': scenario_data.get('starting_conditions', {}),
                 'created_at': scenario_data.get('created_at'),
                 'version': scenario_data.get('version', '1.0')
-            }
+            })
         except (FileNotFoundError, ValueError):
             return None
 
@@ -118,6 +181,7 @@ class ScenarioLoader:
         current_state = simulation_engine.get_current_state()
         if not current_state:
             raise ValueError("No active simulation to create scenario from")
+        market_state = current_state.market.state
 
         scenario_data = {
             'title': title or scenario_name,
@@ -129,11 +193,11 @@ class ScenarioLoader:
             'created_at': datetime.now().isoformat(),
 
             'market_conditions': {
-                'demand_level': current_state.market.state.demand_level,
-                'price_index': current_state.market.state.price_index,
-                'competition_intensity': current_state.market.state.competition_intensity,
-                'economic_indicators': current_state.market.state.economic_indicators,
-                'trend_factors': current_state.market.state.trend_factors
+                'demand_level': market_state.demand_level,
+                'price_index': market_state.price_index,
+                'competition_intensity': market_state.competition_intensity,
+                'economic_indicators': dict(market_state.economic_indicators),
+                'trend_factors': dict(market_state.trend_factors)
             },
 
             'starting_conditions': {
@@ -142,18 +206,13 @@ class ScenarioLoader:
                 'round_number': current_state.round_number
             },
 
-            'simulation_config': {
-                'max_rounds': simulation_engine.config.max_rounds,
-                'num_competitors': simulation_engine.config.num_competitors,
-                'initial_market_demand': simulation_engine.config.initial_market_demand,
-                'market_volatility': simulation_engine.config.market_volatility,
-                'event_frequency': simulation_engine.config.event_frequency
-            }
+            'simulation_config': simulation_engine.config.to_dict()
         }
 
         scenario_file = self.scenarios_dir / f"{scenario_name}.json"
-        with open(scenario_file, 'w', encoding='utf-8') as f:
-            json.dump(scenario_data, f, indent=2, default=str)
+        with open(scenario_file, 'wb') as f:
+            f.write(json_dumps_bytes(scenario_data, indent=True, default=json_default))
+        self.invalidate(scenario_name)
 
         return str(scenario_file)
 
@@ -170,37 +229,66 @@ class ScenarioLoader:
         try:
             scenario_data = self.load_scenario(scenario_name)
 
+            state = simulation_engine.current_state
+
             # Update market conditions
             market_conditions = scenario_data.get('market_conditions', {})
             if market_conditions:
-                simulation_engine.current_state.market.state.demand_level = market_conditions.get('demand_level', 1000.0)
-                simulation_engine.current_state.market.state.price_index = market_conditions.get('price_index', 1.0)
-                simulation_engine.current_state.market.state.competition_intensity = market_conditions.get('competition_intensity', 0.5)
-                simulation_engine.current_state.market.state.economic_indicators = market_conditions.get('economic_indicators', {})
-                simulation_engine.current_state.market.state.trend_factors = market_conditions.get('trend_factors', {})
+                self.apply_market_conditions(state.market.state, market_conditions)
 
             # Update starting conditions if applicable
             starting_conditions = scenario_data.get('starting_conditions', {})
             if starting_conditions:
                 if 'company' in starting_conditions:
-                    company_data = starting_conditions['company']
-                    simulation_engine.current_state.player_company = Company.from_dict(company_data)
+                    state.player_company = Company.from_dict(starting_conditions['company'])
 
                 if 'competitors' in starting_conditions:
-                    simulation_engine.current_state.competitors = starting_conditions['competitors']
+                    state.competitors = starting_conditions['competitors']
 
             # Update simulation config
             sim_config = scenario_data.get('simulation_config', {})
             if sim_config:
-                from ..core.simulation_engine import SimulationConfig
-                simulation_engine.config = SimulationConfig(**sim_config)
+                simulation_engine.config = self.simulation_config(sim_config)
 
             return True
 
-        except Exception as e:
-            print(f"Error applying scenario: {e}")
+        except Exception:
+            logger.exception("Error applying scenario %s", scenario_name)
             return False
 
+    def simulation_config(self, sim_config: Dict[str, Any]) -> SimulationConfig:
+        """Build the SimulationConfig for a scenario's simulation_config section.
+
+        Args:
+            sim_config: The scenario's simulation_config section
+
+        Returns:
+            SimulationConfig, shared between scenarios with identical sections
+        """
+        try:
+            key = frozenset(sim_config.items())
+        except TypeError:
+            return SimulationConfig(**sim_config)
+
+        config = self._config_cache.get(key)
+        if config is None:
+            config = self._config_cache[key] = SimulationConfig(**sim_config)
+        return config
+
+    def apply_market_conditions(self, market_state, market_conditions: Dict[str, Any]):
+        """Copy scenario market conditions onto a market state.
+
+        Args:
+            market_state: MarketState to update
+            market_conditions: The scenario's market_conditions section
+        """
+        get = market_conditions.get
+        market_state.demand_level = get('demand_level', 1000.0)
+        market_state.price_index = get('price_index', 1.0)
+        market_state.competition_intensity = get('competition_intensity', 0.5)
+        market_state.economic_indicators = get('economic_indicators', {})
+        market_state.trend_factors = get('trend_factors', {})
+
     def delete_scenario(self, scenario_name: str) -> bool:
         """Delete a scenario file.
 
@@ -212,6 +300,7 @@ class ScenarioLoader:
         """
         scenario_file = self.scenarios_dir / f"{scenario_name}.json"
 
+        self.invalidate(scenario_name)
         if scenario_file.exists():
             scenario_file.unlink()
             return True
@@ -234,7 +323,7 @@ class ScenarioLoader:
         }
 
         try:
-            scenario_data = self.load_scenario(scenario_name)
+            scenario_data = self.read_scenario(scenario_name)
 
             # Check required fields
             required_fields = ['market_conditions', 'starting_conditions']
@@ -257,9 +346,6 @@ class ScenarioLoader:
             if not isinstance(starting_conditions, dict):
                 validation_result['errors'].append("starting_conditions must be a dictionary")
 
-            # Check for valid JSON structure
-            json.dumps(scenario_data, default=str)  # This will raise an exception if not serializable
-
             validation_result['is_valid'] = len(validation_result['errors']) == 0
 
         except FileNotFoundError:
@@ -315,7 +401,8 @@ class ScenarioLoader:
         Args:
             template_name: Name of the template to use
             scenario_name: Name for the new scenario
-            customizations: Dictionary of custom values to override
+            customizations: Dictionary of custom values to override, keyed by
+                field name, dotted path or tuple of path segments
 
         Returns:
             Path to the created scenario file
@@ -325,8 +412,8 @@ class ScenarioLoader:
         if not template_file.exists():
             raise FileNotFoundError(f"Template '{template_name}' not found")
 
-        with open(template_file, 'r', encoding='utf-8') as f:
-            scenario_data = json.load(f)
+        # Customizations mutate the data, so work on a copy of the cached template
+        scenario_data = copy.deepcopy(self._load_scenario_file(template_file))
 
         # Apply customizations
         if customizations:
@@ -339,22 +426,21 @@ class ScenarioLoader:
 
         # Save new scenario
         scenario_file = self.scenarios_dir / f"{scenario_name}.json"
-        with open(scenario_file, 'w', encoding='utf-8') as f:
-            json.dump(scenario_data, f, indent=2, default=str)
+        with open(scenario_file, 'wb') as f:
+            f.write(json_dumps_bytes(scenario_data, indent=True, default=json_default))
+        self.invalidate(scenario_name)
 
         return str(scenario_file)
 
-    def _apply_customizations(self, scenario_data: Dict[str, Any], customizations: Dict[str, Any]):
-        """Apply customizations to scenario data."""
+    def _apply_customizations(self, scenario_data: Dict[str, Any], customizations: Dict[Any, Any]):
+        """Apply customizations to scenario data.
+
+        Keys are top-level fields, dotted paths such as
+        "market_conditions.demand_level", or tuples of path segments.
+        """
         for key, value in customizations.items():
-            if '.' in key:
-                # Handle nested keys like "market_conditions.demand_level"
-                keys = key.split('.')
-                current = scenario_data
-                for k in keys[:-1]:
-                    if k not in current:
-                        current[k] = {}
-                    current = current[k]
-                current[keys[-1]] = value
-            else:
-                scenario_data[key] = value
\ No newline at end of file
+            keys = key if isinstance(key, tuple) else _split_key_path(key)
+            current = scenario_data
+            for k in keys[:-1]:
+                current = current.setdefault(k, {})
+            current[keys[-1]] = value
@@ -1,18 +1,92 @@
-from typing import Dict, Any, Optional, List
+import logging
+import os
+import shutil
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Any, Optional, List
 from datetime import datetime
 from .scenario_loader import ScenarioLoader
 from ..core.simulation_engine import SimulationEngine
 from ..core.market import Market
 from ..core.company import Company
+from ..core._compat import DATACLASS_SLOTS, json_default, json_dumps_bytes, json_loads
+
+logger = logging.getLogger(__name__)
+
+# Loaders shared by every manager of the same directory, so their caches are reused
+_LOADERS: Dict[str, ScenarioLoader] = {}
+
+
+def _shared_loader(scenarios_dir: str) -> ScenarioLoader:
+    """Return the shared ScenarioLoader for a scenarios directory."""
+    key = os.path.abspath(scenarios_dir)
+    loader = _LOADERS.get(key)
+    if loader is None:
+        loader = _LOADERS[key] = ScenarioLoader(scenarios_dir)
+    else:
+        loader.scenarios_dir.mkdir(parents=True, exist_ok=True)
+    return loader
+
+
+def _copy_infos(scenarios) -> List[Dict[str, Any]]:
+    """Copy scenario information dictionaries so callers cannot edit the index."""
+    return [dict(scenario, tags=list(scenario.get('tags', [])))
+            for scenario in scenarios]
+
+
+# Scenario difficulty recommended for each player experience level
+_EXPERIENCE_DIFFICULTY = {
+    "beginner": "easy",
+    "intermediate": "medium",
+    "advanced": "hard"
+}
+
+# Timestamp key used for each history action in get_scenario_history()
+_HISTORY_TIME_KEYS = {
+    'loaded': 'loaded_at',
+    'applied_to_simulation': 'applied_at',
+    'switched_during_simulation': 'switched_at',
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class HistoryEntry:
+    """A single scenario load, apply or switch recorded by the ScenarioManager."""
+    scenario_name: str
+    action: str
+    timestamp: datetime
+    preserved_company: Optional[bool] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the entry to the dictionary shape returned by get_scenario_history."""
+        entry = {
+            'scenario_name': self.scenario_name,
+            _HISTORY_TIME_KEYS.get(self.action, 'timestamp'): self.timestamp,
+            'action': self.action
+        }
+        if self.preserved_company is not None:
+            entry['preserved_company'] = self.preserved_company
+        return entry
 
 
 class ScenarioManager:
     """Manages scenario loading and switching for the simulation."""
 
-    def __init__(self, scenarios_dir: str = "data/scenarios"):
-        self.loader = ScenarioLoader(scenarios_dir)
+    def __init__(self, scenarios_dir: str = "data/scenarios", history_limit: int = 1024):
+        """Create a scenario manager.
+
+        Args:
+            scenarios_dir: Directory holding the scenario files
+            history_limit: Number of recent scenario history entries kept (0 keeps all)
+        """
+        self.loader = _shared_loader(scenarios_dir)
         self.current_scenario: Optional[str] = None
-        self.scenario_history: List[Dict[str, Any]] = []
+        self.scenario_history: Deque[HistoryEntry] = deque(maxlen=history_limit or None)
+        self._meta_index: Optional[List[Dict[str, Any]]] = None
+        self._meta_index_key: Optional[tuple] = None
+        self._by_difficulty: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        self._recommendations: Dict[str, str] = {}
 
     def load_scenario(self, scenario_name: str) -> Dict[str, Any]:
         """Load a scenario by name.
@@ -31,11 +105,7 @@ class ScenarioManager:
         self.current_scenario = scenario_name
 
         # Record in history
-        self.scenario_history.append({
-            'scenario_name': scenario_name,
-            'loaded_at': datetime.now(),
-            'action': 'loaded'
-        })
+        self.scenario_history.append(HistoryEntry(scenario_name, 'loaded', datetime.now()))
 
         return scenario_data
 
@@ -55,16 +125,13 @@ class ScenarioManager:
 
             if success:
                 self.current_scenario = scenario_name
-                self.scenario_history.append({
-                    'scenario_name': scenario_name,
-                    'applied_at': datetime.now(),
-                    'action': 'applied_to_simulation'
-                })
+                self.scenario_history.append(
+                    HistoryEntry(scenario_name, 'applied_to_simulation', datetime.now()))
 
             return success
 
-        except Exception as e:
-            print(f"Error applying scenario: {e}")
+        except Exception:
+            logger.exception("Error applying scenario %s", scenario_name)
             return False
 
     def create_new_simulation_from_scenario(self, scenario_name: str) -> SimulationEngine:
@@ -84,8 +151,7 @@ class ScenarioManager:
 
         # Extract simulation config
         sim_config_data = scenario_data.get('simulation_config', {})
-        from ..core.simulation_engine import SimulationConfig
-        config = SimulationConfig(**sim_config_data)
+        config = self.loader.simulation_config(sim_config_data)
 
         # Create simulation engine
         simulation_engine = SimulationEngine(config)
@@ -112,47 +178,39 @@ class ScenarioManager:
             # Load new scenario
             new_scenario_data = self.load_scenario(new_scenario_name)
 
-            # Store current company state if preserving
-            company_backup = None
-            if preserve_company and simulation_engine.current_state:
-                company_backup = simulation_engine.current_state.player_company
-
-            # Apply new scenario market conditions
-            market_conditions = new_scenario_data.get('market_conditions', {})
-            if market_conditions and simulation_engine.current_state:
-                simulation_engine.current_state.market.state.demand_level = market_conditions.get('demand_level', 1000.0)
-                simulation_engine.current_state.market.state.price_index = market_conditions.get('price_index', 1.0)
-                simulation_engine.current_state.market.state.competition_intensity = market_conditions.get('competition_intensity', 0.5)
-                simulation_engine.current_state.market.state.economic_indicators = market_conditions.get('economic_indicators', {})
-                simulation_engine.current_state.market.state.trend_factors = market_conditions.get('trend_factors', {})
-
-            # Update competitors if specified in scenario
-            starting_conditions = new_scenario_data.get('starting_conditions', {})
-            if 'competitors' in starting_conditions and simulation_engine.current_state:
-                simulation_engine.current_state.competitors = starting_conditions['competitors']
-
-            # Restore company if preserving
-            if preserve_company and company_backup and simulation_engine.current_state:
-                simulation_engine.current_state.player_company = company_backup
+            state = simulation_engine.current_state
+            if state:
+                # Keep a reference to the current company; nothing below copies it
+                saved_company = state.player_company if preserve_company else None
+
+                # Apply new scenario market conditions
+                market_conditions = new_scenario_data.get('market_conditions', {})
+                if market_conditions:
+                    self.loader.apply_market_conditions(state.market.state,
+                                                        market_conditions)
+
+                # Update competitors if specified in scenario
+                starting_conditions = new_scenario_data.get('starting_conditions', {})
+                if 'competitors' in starting_conditions:
+                    state.competitors = starting_conditions['competitors']
+
+                # Restore company if preserving and it was replaced
+                if saved_company is not None and state.player_company is not saved_company:
+                    state.player_company = saved_company
 
             # Update simulation config
             sim_config = new_scenario_data.get('simulation_config', {})
             if sim_config:
-                from ..core.simulation_engine import SimulationConfig
-                simulation_engine.config = SimulationConfig(**sim_config)
+                simulation_engine.config = self.loader.simulation_config(sim_config)
 
             self.current_scenario = new_scenario_name
-            self.scenario_history.append({
-                'scenario_name': new_scenario_name,
-                'switched_at': datetime.now(),
-                'action': 'switched_during_simulation',
-                'preserved_company': preserve_company
-            })
+            self.scenario_history.append(HistoryEntry(
+                new_scenario_name, 'switched_during_simulation', datetime.now(), preserve_company))
 
             return True
 
-        except Exception as e:
-            print(f"Error switching scenario: {e}")
+        except Exception:
+            logger.exception("Error switching to scenario %s", new_scenario_name)
             return False
 
     def create_scenario_from_template(self, template_name: str, scenario_name: str,
@@ -167,6 +225,7 @@ class ScenarioManager:
         Returns:
             Path to the created scenario file
         """
+        self._meta_index = None
         return self.loader.create_scenario_from_template(template_name, scenario_name, customizations)
 
     def create_scenario_from_current_state(self, simulation_engine: SimulationEngine,
@@ -183,6 +242,7 @@ class ScenarioManager:
         Returns:
             Path to the created scenario file
         """
+        self._meta_index = None
         return self.loader.create_scenario_from_simulation(
             simulation_engine, scenario_name, title, description
         )
@@ -193,7 +253,47 @@ class ScenarioManager:
         Returns:
             List of scenario information dictionaries
         """
-        return self.loader.list_available_scenarios()
+        return _copy_infos(self._scenario_index())
+
+    def _scenario_index(self) -> List[Dict[str, Any]]:
+        """Return the scenario metadata index, rebuilt whenever a scenario file changed.
+
+        Returns:
+            List of scenario information dictionaries, shared with the index
+        """
+        index_key = self._scenario_files_key()
+        if self._meta_index is None or index_key != self._meta_index_key:
+            scenarios = self.loader.list_available_scenarios()
+            by_difficulty: Dict[str, List[Dict[str, Any]]] = {}
+            by_tag: Dict[str, List[Dict[str, Any]]] = {}
+            for scenario in scenarios:
+                by_difficulty.setdefault(scenario.get('difficulty'), []).append(scenario)
+                for tag in dict.fromkeys(scenario.get('tags', [])):
+                    by_tag.setdefault(tag, []).append(scenario)
+
+            self._meta_index = scenarios
+            self._meta_index_key = index_key
+            self._by_difficulty = by_difficulty
+            self._by_tag = by_tag
+            # One recommendation per difficulty, picked by name so it does not depend on listing order
+            self._recommendations = {difficulty: min(s['name'] for s in group)
+                                     for difficulty, group in by_difficulty.items()}
+        return self._meta_index
+
+    def _scenario_files_key(self) -> tuple:
+        """Fingerprint the scenario files by name, modification time and size.
+
+        Returns:
+            Sorted tuple of (name, st_mtime_ns, st_size) entries
+        """
+        key = []
+        for scenario_file in self.loader.scenarios_dir.glob("*.json"):
+            try:
+                st = scenario_file.stat()
+            except FileNotFoundError:
+                continue
+            key.append((scenario_file.name, st.st_mtime_ns, st.st_size))
+        return tuple(sorted(key))
 
     def get_scenario_info(self, scenario_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a scenario.
@@ -223,7 +323,7 @@ class ScenarioManager:
         Returns:
             List of scenario history entries
         """
-        return self.scenario_history.copy()
+        return [entry.to_dict() for entry in self.scenario_history]
 
     def get_current_scenario(self) -> Optional[str]:
         """Get the name of the currently active scenario.
@@ -246,8 +346,8 @@ class ScenarioManager:
         Returns:
             List of scenarios matching the difficulty
         """
-        all_scenarios = self.get_available_scenarios()
-        return [s for s in all_scenarios if s.get('difficulty') == difficulty]
+        self._scenario_index()
+        return _copy_infos(self._by_difficulty.get(difficulty, ()))
 
     def get_scenarios_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """Get scenarios filtered by tag.
@@ -258,8 +358,8 @@ class ScenarioManager:
         Returns:
             List of scenarios with the specified tag
         """
-        all_scenarios = self.get_available_scenarios()
-        return [s for s in all_scenarios if tag in s.get('tags', [])]
+        self._scenario_index()
+        return _copy_infos(self._by_tag.get(tag, ()))
 
     def recommend_scenario(self, player_experience: str = "beginner") -> Optional[str]:
         """Recommend a scenario based on player experience level.
@@ -270,20 +370,9 @@ class ScenarioManager:
         Returns:
             Recommended scenario name, or None if no recommendation
         """
-        experience_map = {
-            "beginner": "easy",
-            "intermediate": "medium",
-            "advanced": "hard"
-        }
-
-        difficulty = experience_map.get(player_experience, "medium")
-        scenarios = self.get_scenarios_by_difficulty(difficulty)
-
-        if scenarios:
-            # Return the first scenario (could be made more sophisticated)
-            return scenarios[0]['name']
-
-        return None
+        difficulty = _EXPERIENCE_DIFFICULTY.get(player_experience, "medium")
+        self._scenario_index()
+        return self._recommendations.get(difficulty)
 
     def _initialize_simulation_from_scenario(self, simulation_engine: SimulationEngine,
                                            scenario_data: Dict[str, Any]):
@@ -296,44 +385,50 @@ class ScenarioManager:
         # Initialize simulation
         simulation_engine.initialize_simulation()
 
+        state = simulation_engine.current_state
+
         # Apply market conditions
         market_conditions = scenario_data.get('market_conditions', {})
         if market_conditions:
-            simulation_engine.current_state.market.state.demand_level = market_conditions.get('demand_level', 1000.0)
-            simulation_engine.current_state.market.state.price_index = market_conditions.get('price_index', 1.0)
-            simulation_engine.current_state.market.state.competition_intensity = market_conditions.get('competition_intensity', 0.5)
-            simulation_engine.current_state.market.state.economic_indicators = market_conditions.get('economic_indicators', {})
-            simulation_engine.current_state.market.state.trend_factors = market_conditions.get('trend_factors', {})
+            self.loader.apply_market_conditions(state.market.state, market_conditions)
 
         # Apply starting conditions
         starting_conditions = scenario_data.get('starting_conditions', {})
 
         if 'company' in starting_conditions:
-            company_data = starting_conditions['company']
-            simulation_engine.current_state.player_company = Company.from_dict(company_data)
+            state.player_company = Company.from_dict(starting_conditions['company'])
 
         if 'competitors' in starting_conditions:
-            simulation_engine.current_state.competitors = starting_conditions['competitors']
+            state.competitors = starting_conditions['competitors']
 
         if 'round_number' in starting_conditions:
-            simulation_engine.current_state.round_number = starting_conditions['round_number']
-            simulation_engine.round_manager.current_round = starting_conditions['round_number']
+            round_number = starting_conditions['round_number']
+            state.round_number = round_number
+            simulation_engine.round_manager.current_round = round_number
 
-    def export_scenario(self, scenario_name: str, export_path: str) -> bool:
+    def export_scenario(self, scenario_name: str, export_path: str, normalize: bool = False) -> bool:
         """Export a scenario to a different location.
 
+        The scenario file is copied as is; it is not loaded, so the current
+        scenario and the scenario history are left unchanged.
+
         Args:
             scenario_name: Name of the scenario to export
             export_path: Path to export to
+            normalize: Re-serialize the scenario with two-space indentation
+                instead of copying the file
 
         Returns:
             True if export was successful
         """
         try:
-            scenario_data = self.load_scenario(scenario_name)
-            import json
-            with open(export_path, 'w') as f:
-                json.dump(scenario_data, f, indent=2, default=str)
+            # Raises for missing or invalid scenarios, reusing the loader's cached parse
+            scenario_data = self.loader.read_scenario(scenario_name)
+            if normalize:
+                with open(export_path, 'wb') as f:
+                    f.write(json_dumps_bytes(scenario_data, indent=True, default=json_default))
+            else:
+                shutil.copyfile(self.loader.scenarios_dir / f"{scenario_name}.json", export_path)
             return True
         except Exception:
             return False
@@ -349,17 +444,17 @@ class ScenarioManager:
             True if import was successful
         """
         try:
-            import json
-            with open(import_path, 'r') as f:
-                scenario_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                scenario_data = json_loads(f.read())
 
             # Validate the imported data
             self.loader._validate_scenario(scenario_data)
 
-            # Save as new scenario
-            scenario_file = self.loader.scenarios_dir / f"{scenario_name}.json"
-            with open(scenario_file, 'w') as f:
-                json.dump(scenario_data, f, indent=2, default=str)
+            # Save as new scenario; the serializer writes a temporary file and
+            # renames it over the target, so a failed import never leaves a partial scenario
+            self.loader.serializer.serialize_to_json(scenario_data, scenario_name, indent=2)
+            self.loader.invalidate(scenario_name)
+            self._meta_index = None
 
             return True
         except Exception:
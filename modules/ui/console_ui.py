@@ -10,6 +10,33 @@ from datetime import datetime
 from ..core.simulation_engine import SimulationEngine, SimulationConfig
 from ..core.simulation_state import SimulationState
 
+# ANSI escape sequence that homes the cursor and clears the screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+def _enable_ansi_escapes() -> bool:
+    """Make sure the console interprets ANSI escape sequences.
+
+    POSIX terminals always do. On Windows, virtual terminal processing is
+    switched on for the console's output handle.
+
+    Returns:
+        True if ANSI escape sequences will be rendered
+    """
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
 
 class ConsoleUI:
     """Main console UI class for the business simulation."""
@@ -18,6 +45,8 @@ class ConsoleUI:
         self.engine: Optional[SimulationEngine] = None
         self.current_state: Optional[SimulationState] = None
         self.running = False
+        # Clear by running cls/clear when asked to, or when the console cannot render ANSI escapes
+        self._legacy_clear = bool(os.environ.get('UCS_LEGACY_CLEAR')) or not _enable_ansi_escapes()
 
     def start(self):
         """Start the console UI application."""
@@ -34,7 +63,11 @@ class ConsoleUI:
 
     def _clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._legacy_clear:
+            os.system('cls' if os.name == 'nt' else 'clear')
+        else:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
 
     def _show_welcome(self):
         """Display welcome message."""
@@ -184,7 +217,6 @@ class ConsoleUI:
     def _simulation_loop(self):
         """Main simulation loop for playing rounds."""
         while self.running and self.current_state and not self.engine.round_manager.is_game_over():
-            self._clear_screen()
             self._show_dashboard()
 
             # Check if simulation is over
@@ -217,67 +249,90 @@ class ConsoleUI:
         if self.engine and self.engine.round_manager.is_simulation_over():
             self._show_simulation_over()
 
+    def _write_screen(self, lines: List[str], clear: bool = False):
+        """Write a block of output lines to the console in a single write.
+
+        Args:
+            lines: Lines to write
+            clear: Clear the screen first, as part of the same write when possible
+        """
+        text = "\n".join(lines) + "\n"
+        if clear:
+            if self._legacy_clear:
+                self._clear_screen()
+            else:
+                text = CLEAR_SCREEN + text
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
     def _show_dashboard(self):
-        """Display the company dashboard."""
+        """Clear the screen and display the company dashboard."""
         if not self.current_state:
             return
 
-        company = self.current_state.player_company
-        market = self.current_state.market
-
-        print("=" * 60)
-        print(f"COMPANY DASHBOARD - Round {self.current_state.round_number}")
-        print("=" * 60)
-
-        # Company Overview
-        print(f"Company: {company.name}")
-        print(f"Round: {self.current_state.round_number}")
-        print()
-
-        # Financial Status
-        print("FINANCIAL STATUS")
-        print("-" * 20)
-        print(".2f")
-        print(".2f")
-        print(".2f")
-        print(".2f")
-        print()
-
-        # Operational Status
-        print("OPERATIONAL STATUS")
-        print("-" * 20)
-        print(".1f")
-        print(".1%")
-        print(".1%")
-        print(".1%")
-        print()
-
-        # Market Position
-        print("MARKET POSITION")
-        print("-" * 20)
-        print(".1%")
-        print(".0f")
-        print(".1f")
-        print()
-
-        # Market Conditions
-        market_summary = market.get_market_summary()
-        print("MARKET CONDITIONS")
-        print("-" * 20)
-        print(".0f")
-        print(".2f")
-        print(".1%")
-        print(f"Active Events: {len(market_summary.get('active_events', []))}")
-        print()
+        state = self.current_state
+        company = state.player_company
+        fd = company.financial_data
+        od = company.operations_data
+        md = company.market_data
+        market_summary = state.market.get_market_summary()
+
+        lines = [
+            "=" * 60,
+            f"COMPANY DASHBOARD - Round {state.round_number}",
+            "=" * 60,
+
+            # Company Overview
+            f"Company: {company.name}",
+            f"Round: {state.round_number}",
+            "",
+
+            # Financial Status
+            "FINANCIAL STATUS",
+            "-" * 20,
+            f"Revenue: ${fd.revenue:,.2f}",
+            f"Costs: ${fd.costs:,.2f}",
+            f"Profit: ${fd.profit:,.2f}",
+            f"Cash: ${fd.cash:,.2f}",
+            "",
+
+            # Operational Status
+            "OPERATIONAL STATUS",
+            "-" * 20,
+            f"Capacity: {od.capacity:,.1f}",
+            f"Efficiency: {od.efficiency:.1%}",
+            f"Quality: {od.quality:.1%}",
+            f"Customer Satisfaction: {od.customer_satisfaction:.1%}",
+            "",
+
+            # Market Position
+            "MARKET POSITION",
+            "-" * 20,
+            f"Market Share: {md.market_share:.1%}",
+            f"Brand Value: {md.brand_value:,.0f}",
+            f"Competitive Position: {md.competitive_position:.1f}",
+            "",
+
+            # Market Conditions
+            "MARKET CONDITIONS",
+            "-" * 20,
+            f"Demand Level: {market_summary['demand_level']:,.0f}",
+            f"Price Index: {market_summary['price_index']:.2f}",
+            f"Competition Intensity: {market_summary['competition_intensity']:.1%}",
+            f"Active Events: {len(market_summary.get('active_events', []))}",
+            "",
+        ]
 
         # Competitors
         competitors = market_summary.get('competitors', [])
         if competitors:
-            print("TOP COMPETITORS")
-            print("-" * 20)
+            lines.append("TOP COMPETITORS")
+            lines.append("-" * 20)
             for comp in competitors[:3]:  # Show top 3
-                print(".1%")
-            print()
+                lines.append(f"{comp['name']}: {comp['market_share']:.1%} market share")
+            lines.append("")
+
+        self._write_screen(lines, clear=True)
 
     def _get_player_decisions(self) -> Optional[Dict[str, Any]]:
         """Get player decisions for the current round."""
@@ -399,80 +454,74 @@ class ConsoleUI:
 
     def _show_round_summary(self, round_results: Dict[str, Any]):
         """Display round summary and results."""
-        self._clear_screen()
-        print("=" * 60)
-        print(f"ROUND {round_results['round_number']} SUMMARY")
-        print("=" * 60)
-
         round_data = round_results.get('round_results', {})
-
-        # Financial Results
-        print("FINANCIAL RESULTS")
-        print("-" * 20)
-        print(".2f")
-        print(".2f")
-        print(".2f")
-        print()
-
-        # Market Results
-        print("MARKET RESULTS")
-        print("-" * 20)
-        print(".1%")
-        print(".1%")
-        print()
+        get = round_data.get
+        profit = get('profit', 0.0)
+        market_share = get('market_share', 0.0)
+
+        lines = [
+            "=" * 60,
+            f"ROUND {round_results['round_number']} SUMMARY",
+            "=" * 60,
+
+            # Financial Results
+            "FINANCIAL RESULTS",
+            "-" * 20,
+            f"Revenue: ${get('revenue', 0.0):,.2f}",
+            f"Costs: ${get('costs', 0.0):,.2f}",
+            f"Profit: ${profit:,.2f}",
+            "",
+
+            # Market Results
+            "MARKET RESULTS",
+            "-" * 20,
+            f"Market Share: {market_share:.1%}",
+            f"Customer Satisfaction: {get('customer_satisfaction', 0.0):.1%}",
+            "",
+        ]
 
         # Events
         triggered_events = round_results.get('triggered_events', [])
         if triggered_events:
-            print("EVENTS THIS ROUND")
-            print("-" * 20)
+            lines.append("EVENTS THIS ROUND")
+            lines.append("-" * 20)
             for event in triggered_events:
-                print(f"- {event.get('description', 'Unknown event')}")
-            print()
+                lines.append(f"- {event.get('description', 'Unknown event')}")
+            lines.append("")
 
         # Performance Summary
-        print("PERFORMANCE SUMMARY")
-        print("-" * 20)
-        if round_data.get('profit', 0) > 0:
-            print("✓ Profitable round")
+        lines.append("PERFORMANCE SUMMARY")
+        lines.append("-" * 20)
+        if profit > 0:
+            lines.append("✓ Profitable round")
         else:
-            print("✗ Loss-making round")
+            lines.append("✗ Loss-making round")
 
-        if round_data.get('market_share', 0) > 0.15:  # Assuming 15% is baseline
-            print("✓ Gaining market share")
-        elif round_data.get('market_share', 0) < 0.15:
-            print("✗ Losing market share")
+        if market_share > 0.15:  # Assuming 15% is baseline
+            lines.append("✓ Gaining market share")
+        elif market_share < 0.15:
+            lines.append("✗ Losing market share")
         else:
-            print("→ Market share stable")
+            lines.append("→ Market share stable")
 
-        print()
+        lines.append("")
+        self._write_screen(lines, clear=True)
 
     def _show_simulation_over(self):
         """Display simulation over screen."""
-        self._clear_screen()
-        print("=" * 60)
-        print("SIMULATION OVER")
-        print("=" * 60)
+        lines = [
+            "=" * 60,
+            "SIMULATION OVER",
+            "=" * 60,
+        ]
 
-        if self.current_state:
-            company = self.current_state.player_company
-            print(f"Final Round: {self.current_state.round_number}")
-            print(f"Company: {company.name}")
-            print()
-            print("FINAL FINANCIAL POSITION")
-            print("-" * 30)
-            print(".2f")
-            print(".2f")
-            print(".2f")
-            print()
-            print("FINAL MARKET POSITION")
-            print("-" * 30)
-            print(".1%")
-            print(".1%")
-            print()
+        state = self.current_state
+        if state:
+            company = state.player_company
+            fd = company.financial_data
 
             # Simple performance rating
-            profit = company.financial_data.profit
+            profit = fd.profit
             market_share = company.market_data.market_share
 
             if profit > 50000 and market_share > 0.25:
@@ -484,11 +533,28 @@ class ConsoleUI:
             else:
                 rating = "POOR - Significant losses"
 
-            print(f"PERFORMANCE RATING: {rating}")
-
-        print("\nThank you for using UseCaseSimulator!")
+            lines += [
+                f"Final Round: {state.round_number}",
+                f"Company: {company.name}",
+                "",
+                "FINAL FINANCIAL POSITION",
+                "-" * 30,
+                f"Revenue: ${fd.revenue:,.2f}",
+                f"Profit: ${profit:,.2f}",
+                f"Cash: ${fd.cash:,.2f}",
+                "",
+                "FINAL MARKET POSITION",
+                "-" * 30,
+                f"Market Share: {market_share:.1%}",
+                f"Customer Satisfaction: {company.operations_data.customer_satisfaction:.1%}",
+                "",
+                f"PERFORMANCE RATING: {rating}",
+            ]
+
+        lines.append("\nThank you for using UseCaseSimulator!")
+        self._write_screen(lines, clear=True)
         input("\nPress Enter to return to main menu...")
 
         # Reset simulation state
         self.current_state = None
-        self.engine = None
\ No newline at end of file
+        self.engine = None
@@ -4,6 +4,7 @@ Use Case Simulator - Web UI Launcher
 Run this script to start the web-based interface.
 """
 
+import argparse
 import sys
 import os
 
@@ -12,8 +13,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from web_ui.app import create_app
 
+
 def main():
     """Main entry point for the web application."""
+    parser = argparse.ArgumentParser(description="Start the Use Case Simulator web UI.")
+    parser.add_argument('--dev', action='store_true',
+                        help="run Flask's debug server with the auto-reloader")
+    args = parser.parse_args()
+
     print("Starting Use Case Simulator Web UI...")
     print("=" * 50)
     print("A business simulation game for learning strategic decision making")
@@ -33,16 +40,24 @@ def main():
     print("  - Open browser to http://localhost:5000")
     print()
 
-    # Start the development server
-    import os
-    os.environ['FLASK_ENV'] = 'development'
-    app.run(
-        host='127.0.0.1',
-        port=5000,
-        debug=False,
-        use_reloader=False,
-        threaded=False
-    )
+    if args.dev:
+        # Start the development server
+        os.environ['FLASK_ENV'] = 'development'
+        app.run(host='127.0.0.1', port=5000, debug=True, use_reloader=True)
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+
+    if serve is not None:
+        # Serve requests concurrently from a pool of worker threads
+        serve(app, host='127.0.0.1', port=5000, threads=max(4, os.cpu_count() or 1),
+              channel_timeout=30)
+    else:
+        app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False, threaded=True)
+
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
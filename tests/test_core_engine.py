@@ -1,14 +1,17 @@
 import unittest
 import sys
 import os
+from datetime import datetime
+
+import numpy as np
 
 # Add modules to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from modules.core.simulation_engine import SimulationEngine, SimulationConfig
 from modules.core.simulation_state import SimulationState
-from modules.core.round_manager import RoundManager
-from modules.core.event_manager import EventManager, Event, EventType
+from modules.core.round_manager import RoundManager, marketing_impacts, pricing_impacts
+from modules.core.event_manager import EventManager, Event, EventType, IMPACT_METRICS
 
 
 class TestSimulationEngine(unittest.TestCase):
@@ -165,6 +168,53 @@ class TestRoundManager(unittest.TestCase):
         self.assertIn('investment', result['results'])
         self.assertIn('marketing', result['results'])
 
+    def test_decision_impacts_are_clamped(self):
+        """Test pricing and marketing impacts stay within their caps."""
+        result = self.manager.process_decisions({
+            'pricing': {'price': 400},
+            'investment': {'amount': 50.0},
+            'marketing': {'budget': 25000.0}
+        })['results']
+
+        self.assertEqual(result['pricing']['impact'], 1.5)
+        self.assertAlmostEqual(result['investment']['impact'], 5.0)
+        self.assertEqual(result['marketing']['impact'], 0.5)
+
+    def test_batch_results_match_scalar(self):
+        """Test batched round results agree with the per-decision calculation."""
+        prices = [80.0, 100.0, 140.0]
+        budgets = [0.0, 2500.0, 4000.0]
+
+        batch = self.manager.calculate_round_results_batch(
+            pricing_impacts(np.array(prices)),
+            marketing_impacts(np.array(budgets))
+        )
+
+        for i, (price, budget) in enumerate(zip(prices, budgets)):
+            decisions = self.manager.process_decisions({
+                'pricing': {'price': price},
+                'marketing': {'budget': budget}
+            })
+            expected = self.manager.calculate_round_results(None, decisions)
+            self.assertAlmostEqual(batch['revenue'][i], expected['revenue'])
+            self.assertAlmostEqual(batch['profit'][i], expected['profit'])
+
+    def test_unknown_decision_type(self):
+        """Test unrecognised decisions are flagged rather than dropped."""
+        result = self.manager.process_decisions({'hiring': {'num_employees': 5}})
+
+        self.assertEqual(result['decisions_processed'], 1)
+        self.assertEqual(result['results']['hiring'], {'status': 'unknown_decision_type'})
+
+    def test_reset_to(self):
+        """Test restoring a saved round position."""
+        self.manager.reset_to(2, max_rounds=6)
+        self.assertEqual(self.manager.get_current_round(), 2)
+        self.assertEqual(self.manager.max_rounds, 6)
+
+        self.manager.reset_to(1)
+        self.assertEqual(self.manager.max_rounds, 6)
+
     def test_reset(self):
         """Test manager reset."""
         self.manager.advance_round()
@@ -252,6 +302,70 @@ class TestEventManager(unittest.TestCase):
         for metric, expected_impact in expected_impacts.items():
             self.assertAlmostEqual(impacts[metric], expected_impact, places=5)
 
+    def test_event_impact_vector(self):
+        """Test the impact vector matches the per-metric impacts it covers."""
+        self.manager.trigger_event(self.manager.event_definitions['market_crash'], 1)
+        self.manager.trigger_event(self.manager.event_definitions['economic_boom'], 1)
+
+        impacts = self.manager.get_active_event_impacts()
+        vector = self.manager.get_active_impact_vector()
+
+        self.assertIsInstance(vector, tuple)
+        self.assertEqual(len(vector), len(IMPACT_METRICS))
+        for metric, value in zip(IMPACT_METRICS, vector):
+            self.assertAlmostEqual(value, impacts.get(metric, 0.0), places=10)
+
+    def test_impact_vector_tracks_expiry_and_external_changes(self):
+        """Test the running impact total follows expirations and direct list edits."""
+        crash = self.manager.event_definitions['market_crash']      # 2 rounds
+        regulation = self.manager.event_definitions['regulatory_change']  # 1 round
+        self.manager.trigger_event(crash, 1)
+        self.manager.trigger_event(regulation, 1)
+
+        self.manager.process_active_events()  # Regulation expires
+        vector = self.manager.get_active_impact_vector()
+        self.assertAlmostEqual(vector[IMPACT_METRICS.index('costs')], 0.0)
+        self.assertAlmostEqual(vector[IMPACT_METRICS.index('revenue')], -0.3)
+
+        self.manager.active_events.append({'event': regulation.to_dict(), 'remaining_duration': 1})
+        vector = self.manager.get_active_impact_vector()
+        self.assertAlmostEqual(vector[IMPACT_METRICS.index('costs')], 0.15)
+
+        self.manager.process_active_events()
+        self.assertFalse(any(self.manager.get_active_impact_vector()))
+
+    def test_event_history_timestamps(self):
+        """Test history keeps a sequence number and stamps wall time only on request."""
+        self.manager.trigger_event(self.manager.event_definitions['market_crash'], 1)
+        self.manager.trigger_event(self.manager.event_definitions['economic_boom'], 2)
+
+        history = self.manager.get_event_history()
+        self.assertEqual([entry['seq'] for entry in history], [1, 2])
+        self.assertNotIn('timestamp', history[0])
+
+        stamped = self.manager.get_event_history(include_timestamps=True)
+        self.assertNotIn('clock_ns', stamped[0])
+        self.assertLessEqual(datetime.fromisoformat(stamped[0]['timestamp']),
+                             datetime.fromisoformat(stamped[1]['timestamp']))
+
+    def test_reset_to_restores_in_place(self):
+        """Test restoring saved events keeps the lists and continues numbering."""
+        crash = self.manager.event_definitions['market_crash']
+        self.manager.trigger_event(crash, 1)
+        self.manager.trigger_event(crash, 2)
+        saved_active = self.manager.get_active_events()
+        saved_history = self.manager.get_event_history(include_timestamps=True)
+
+        active_list = self.manager.active_events
+        self.manager.reset_to(saved_active, saved_history)
+
+        self.assertIs(self.manager.active_events, active_list)
+        self.assertEqual(len(self.manager.get_active_events()), 2)
+        self.assertAlmostEqual(self.manager.get_active_event_impacts()['revenue'], -0.6)
+
+        self.manager.trigger_event(crash, 3)
+        self.assertEqual(self.manager.get_event_history()[-1]['seq'], 3)
+
     def test_reset(self):
         """Test event manager reset."""
         self.manager.trigger_event(self.manager.event_definitions['market_crash'], 1)
@@ -3,6 +3,8 @@ Unit tests for the Market module.
 Tests market creation, demand calculation, pricing, competitor AI, and trend analysis.
 """
 
+import sys
+from collections.abc import Mapping
 import pytest
 from modules.core.market import (
     Market, MarketState, DemandCalculator, PricingEngine, CompetitorAI, TrendAnalyzer
@@ -18,7 +20,7 @@ class TestMarketState:
         assert state.demand_level == 1000.0
         assert state.price_index == 1.0
         assert state.competition_intensity == 0.5
-        assert isinstance(state.economic_indicators, dict)
+        assert isinstance(state.economic_indicators, Mapping)
         assert len(state.active_events) == 0
 
     def test_market_state_custom_values(self):
@@ -35,6 +37,35 @@ class TestMarketState:
         assert state.competition_intensity == 0.7
         assert state.economic_indicators['gdp_growth'] == 0.03
 
+    def test_market_state_flat_indicators(self):
+        """Test dict views read and write the flat indicator fields."""
+        state = MarketState(trend_factors={'seasonal': 0.1})
+        assert state.seasonal == 0.1
+        assert state.trend_factors == {'seasonal': 0.1, 'trend': 0.0, 'cyclical': 0.0}
+
+        state.economic_indicators = {'inflation': 0.05, 'unemployment': 0.1}
+        assert state.inflation == 0.05
+        assert state.gdp_growth == 0.02
+        assert 'unemployment' not in state.economic_indicators
+
+    def test_market_state_views_are_read_only(self):
+        """Test editing a view raises and assigning an empty dict resets the fields."""
+        state = MarketState(trend_factors={'seasonal': 0.1, 'trend': 0.2})
+        with pytest.raises(TypeError):
+            state.trend_factors['seasonal'] = 0.5
+        assert state.seasonal == 0.1
+
+        state.trend_factors = {}
+        assert state.trend_factors == {'seasonal': 0.0, 'trend': 0.0, 'cyclical': 0.0}
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_market_state_uses_slots(self):
+        """Test MarketState instances carry no per-instance __dict__."""
+        state = MarketState()
+        assert not hasattr(state, '__dict__')
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1.0
+
 
 class TestDemandCalculator:
     """Test DemandCalculator class."""
@@ -104,6 +135,19 @@ class TestPricingEngine:
         assert isinstance(price, float)
         assert len(engine.price_history) == 1
 
+    def test_calculate_optimal_price_accepts_array(self):
+        """Test array and list competitor prices give the same price."""
+        market_state = MarketState()
+        ai = CompetitorAI(num_competitors=3)
+
+        from_list = PricingEngine().calculate_optimal_price(market_state, ai.get_competitor_prices(), 70.0)
+        from_array = PricingEngine().calculate_optimal_price(market_state, ai.get_competitor_prices_array(), 70.0)
+        no_competitors = PricingEngine().calculate_optimal_price(market_state, [], 70.0)
+
+        assert from_array == pytest.approx(from_list)
+        assert isinstance(from_array, float)
+        assert no_competitors > 0
+
     def test_get_price_trend(self):
         """Test price trend calculation."""
         engine = PricingEngine()
@@ -143,6 +187,25 @@ class TestCompetitorAI:
         assert 'market_impacts' in actions
         assert len(actions['competitor_actions']) == 2
 
+    def test_apply_competitor_actions_clamps(self):
+        """Test quality and market share stay within bounds after actions."""
+        ai = CompetitorAI(num_competitors=2)
+        first, second = ai.competitors
+        first['quality'] = 0.98
+        second['market_share'] = 0.495
+
+        ai._apply_competitor_actions({
+            first['id']: {'price_change': -5.0, 'quality_change': 0.1, 'aggressive_move': -10.0},
+            second['id']: {'price_change': 2.0, 'quality_change': 0.0, 'aggressive_move': 1.0}
+        })
+
+        assert first['price'] == 95.0
+        assert first['quality'] == 1.0
+        assert first['market_share'] == 0.01
+        assert second['price'] == 102.0
+        assert second['market_share'] == 0.5
+        assert all(isinstance(c['market_share'], float) for c in ai.competitors)
+
     def test_get_competitor_prices(self):
         """Test getting competitor prices."""
         ai = CompetitorAI(num_competitors=3)
@@ -7,14 +7,32 @@ import pytest
 import os
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from modules.core.simulation_engine import SimulationEngine, SimulationConfig
 from modules.analytics.analytics_manager import AnalyticsManager
+from modules.persistence.data_serializer import DataSerializer
+from modules.persistence.company_persistence import CompanyPersistence
+from modules.persistence import simulation_persistence
+from modules.persistence.simulation_persistence import SimulationPersistence, DELTA_KEY
+from modules.scenarios import scenario_loader
+from modules.scenarios.scenario_loader import ScenarioLoader
+from modules.scenarios.scenario_manager import ScenarioManager
 
 
 class TestSimulationPersistence:
     """Test simulation save/load functionality."""
 
+    @pytest.fixture
+    def serializer(self, tmp_path):
+        """Serializer writing to a save directory of its own."""
+        return DataSerializer(str(tmp_path / "saves"))
+
+    @pytest.fixture
+    def persistence(self, serializer):
+        """SimulationPersistence on top of the serializer fixture."""
+        return SimulationPersistence(serializer)
+
     def test_save_simulation_success(self, sample_simulation_engine, tmp_path):
         """Test successful simulation save."""
         # Initialize simulation
@@ -123,10 +141,186 @@ class TestSimulationPersistence:
         assert save_dir.exists()
         assert (save_dir / "test_auto_create.json").exists()
 
+    def test_simulation_listing_reads_metadata_sidecar(self, serializer, persistence,
+                                                       sample_simulation_engine,
+                                                       monkeypatch):
+        """Test simulation listings use the metadata sidecar instead of the save."""
+        sample_simulation_engine.initialize_simulation()
+        persistence.save_simulation(sample_simulation_engine, "simulation_sidecar")
+
+        monkeypatch.setattr(serializer, 'peek_header',
+                            lambda *args: pytest.fail("full save parsed"))
+        saves = persistence.list_simulation_saves()
+
+        assert len(saves) == 1
+        company = sample_simulation_engine.get_current_state().player_company
+        assert saves[0]['company_name'] == company.name
+        assert isinstance(saves[0]['saved_at'], datetime)
+        saved = serializer.deserialize_from_json("simulation_sidecar")
+        assert next(iter(saved)) == '_metadata'
+
+        assert persistence.delete_simulation_save("simulation_sidecar")
+        assert list(serializer.base_path.iterdir()) == []
+
+    def test_cleanup_old_saves_uses_file_times_only(self, serializer, persistence):
+        """Test save cleanup keeps the newest saves without reading any of them."""
+        for i in range(4):
+            save_file = serializer.base_path / f"autosave_round_{i}.json"
+            save_file.write_text("not parsed")
+            os.utime(save_file, (1_000_000 + i, 1_000_000 + i))
+        (serializer.base_path / "autosave_round_0.meta").write_text("{}")
+        (serializer.base_path / "quicksave_1.json").write_text("not parsed")
+
+        assert persistence.cleanup_old_saves(keep_recent=2, save_type='auto_save') == 2
+        assert sorted(p.name for p in serializer.base_path.iterdir()) == [
+            "autosave_round_2.json", "autosave_round_3.json", "quicksave_1.json"]
+        assert persistence.cleanup_old_saves(keep_recent=0, save_type='unknown') == 0
+
+    def test_game_components_round_trip(self, persistence, sample_simulation_engine):
+        """Test component saves load back, skipping components that are missing."""
+        sample_simulation_engine.initialize_simulation()
+        state = sample_simulation_engine.get_current_state()
+
+        saved = persistence.save_game_components_separately(sample_simulation_engine,
+                                                            "parts")
+        assert list(saved) == ['company', 'market', 'competitors']
+        assert all(os.path.exists(path) for path in saved.values())
+
+        os.remove(saved['market'])
+        components = persistence.load_game_components_separately("parts")
+        assert list(components) == ['company', 'competitors']
+        assert components['company'].name == state.player_company.name
+        assert len(components['competitors']) == len(state.competitors)
+
+    def test_differential_auto_saves(self, tmp_path, serializer):
+        """Test chained auto saves store differences and load like full saves."""
+        persistence = SimulationPersistence(serializer, max_delta_chain=2)
+        # History streams to its own file, so saves only reference it
+        engine = SimulationEngine(history_path=str(tmp_path / "history.jsonl"))
+        engine.initialize_simulation()
+
+        for _ in range(4):
+            engine.run_round({})
+            persistence.auto_save(engine, 1)
+        persistence.save_simulation(engine, "simulation_full")
+
+        # Full save, two deltas, then a new full save
+        assert [DELTA_KEY in serializer.deserialize_from_json(f"autosave_round_{i}")
+                for i in range(1, 5)] == [False, True, True, False]
+        ops = serializer.deserialize_from_json("autosave_round_3")[DELTA_KEY]
+        assert ops and not any(path[0] == 'simulation_config' for _, path, *_ in ops)
+
+        full = persistence._load_save_data("simulation_full")
+        rebuilt = persistence._load_save_data("autosave_round_4")
+        delta = persistence._load_save_data("autosave_round_3")
+        assert delta['_metadata']['delta_base'] == "autosave_round_2"
+        assert delta['current_state']['round_number'] == 3
+        del full['_metadata'], rebuilt['_metadata']
+        assert rebuilt == full
+        assert delta['round_manager']['current_round'] == 3
+
+        # Cleanup keeps the saves a kept delta is built on
+        assert persistence.cleanup_old_saves(keep_recent=1, save_type='auto_save') == 3
+        engine.run_round({})
+        persistence.auto_save(engine, 1)
+        assert persistence.cleanup_old_saves(keep_recent=1, save_type='auto_save') == 0
+        loaded = persistence.load_simulation("autosave_round_5")
+        assert loaded.current_state.round_number == 5
+
+    def test_differential_saves_chain_per_save_type(self, tmp_path, serializer):
+        """Test cleaning up quick saves never removes the base of an auto save."""
+        persistence = SimulationPersistence(serializer, max_delta_chain=3)
+        engine = SimulationEngine(history_path=str(tmp_path / "history.jsonl"))
+        engine.initialize_simulation()
+
+        engine.run_round({})
+        persistence.auto_save(engine, 1)
+        engine.run_round({})
+        quick_path = persistence.quick_save(engine)
+        for _ in range(2):
+            engine.run_round({})
+            persistence.auto_save(engine, 1)
+
+        assert DELTA_KEY not in serializer.deserialize_from_json(Path(quick_path).stem)
+        delta = serializer.deserialize_from_json("autosave_round_3")
+        assert delta['_metadata']['delta_base'] == "autosave_round_1"
+
+        assert persistence.cleanup_old_saves(keep_recent=0, save_type='quick_save') == 1
+        loaded = persistence.load_simulation("autosave_round_4")
+        assert loaded.current_state.round_number == 4
+
+        # A save of another type built on an auto save keeps that auto save
+        base = serializer.deserialize_from_json("autosave_round_4")
+        metadata = dict(delta['_metadata'], delta_base="autosave_round_4",
+                        delta_base_saved_at=base['_metadata']['saved_at'])
+        serializer.serialize_to_json({'_metadata': metadata, DELTA_KEY: []},
+                                     "quicksave_legacy")
+        serializer.save_metadata_sidecar("quicksave_legacy", metadata)
+        assert persistence.cleanup_old_saves(keep_recent=0, save_type='auto_save') == 0
+        loaded = persistence.load_simulation("quicksave_legacy")
+        assert loaded.current_state.round_number == 4
+
+    def test_differential_save_rejects_overwritten_base(self, tmp_path, serializer,
+                                                         monkeypatch):
+        """Test a delta never loads onto a base another game overwrote."""
+        # Give every save a distinct saved_at, however fast the rounds run
+        clock = iter(range(1, 100))
+        monkeypatch.setattr(simulation_persistence, 'epoch_millis', lambda: next(clock))
+        persistence = SimulationPersistence(serializer, max_delta_chain=2)
+        engine = SimulationEngine(history_path=str(tmp_path / "history.jsonl"))
+        engine.initialize_simulation()
+        for _ in range(2):
+            engine.run_round({})
+            persistence.auto_save(engine, 1)
+
+        # A second game reuses the base's filename
+        other = SimulationEngine(history_path=str(tmp_path / "other.jsonl"))
+        other.initialize_simulation()
+        other.run_round({})
+        SimulationPersistence(serializer, max_delta_chain=2).auto_save(other, 1)
+
+        with pytest.raises(ValueError, match="autosave_round_1"):
+            persistence.load_simulation("autosave_round_2")
+
+    def test_delete_keeps_differential_save_base(self, tmp_path, serializer):
+        """Test deleting a save that a delta is built on is refused."""
+        persistence = SimulationPersistence(serializer, max_delta_chain=2)
+        engine = SimulationEngine(history_path=str(tmp_path / "history.jsonl"))
+        engine.initialize_simulation()
+        for _ in range(2):
+            engine.run_round({})
+            persistence.auto_save(engine, 1)
+
+        assert persistence.delete_simulation_save("autosave_round_1") is False
+        loaded = persistence.load_simulation("autosave_round_2")
+        assert loaded.current_state.round_number == 2
+
+        assert persistence.delete_simulation_save("autosave_round_2") is True
+        assert persistence.delete_simulation_save("autosave_round_1") is True
+        # The next auto save starts a new chain instead of a delta on a deleted save
+        engine.run_round({})
+        persistence.auto_save(engine, 1)
+        assert DELTA_KEY not in serializer.deserialize_from_json("autosave_round_3")
+
 
 class TestScenarioPersistence:
     """Test scenario save/load functionality."""
 
+    @pytest.fixture
+    def scenarios_dir(self, tmp_path):
+        """Scenario directory of its own for each test."""
+        return tmp_path / "scenarios"
+
+    @pytest.fixture
+    def loader(self, scenarios_dir):
+        """ScenarioLoader reading the scenarios_dir fixture."""
+        return ScenarioLoader(str(scenarios_dir))
+
+    @pytest.fixture
+    def manager(self, scenarios_dir):
+        """ScenarioManager of the scenarios_dir fixture."""
+        return ScenarioManager(str(scenarios_dir))
+
     def test_save_scenario_success(self, tmp_path):
         """Test successful scenario save."""
         from web_ui.routes.api import save_scenario
@@ -196,6 +390,200 @@ class TestScenarioPersistence:
 
         assert scenarios_dir.exists()
 
+    def test_scenario_loader_caches_until_file_changes(self, loader, scenarios_dir,
+                                                       monkeypatch):
+        """Test scenario files are parsed once and re-read after they change."""
+        scenario_file = scenarios_dir / "cached.json"
+        scenario_file.write_text(json.dumps(
+            {'title': 'First', 'tags': ['a'],
+             'market_conditions': {'demand_level': 900.0}}))
+
+        parses = []
+        real_loads = scenario_loader.json_loads
+        monkeypatch.setattr(scenario_loader, 'json_loads',
+                            lambda data: parses.append(1) or real_loads(data))
+
+        assert loader.list_available_scenarios()[0]['title'] == 'First'
+        info = loader.get_scenario_info("cached")
+        scenario = loader.load_scenario("cached")
+        assert len(parses) == 1
+
+        # Returned data is private to the caller
+        info['tags'].append('b')
+        scenario['market_conditions']['demand_level'] = 0.0
+        reloaded = loader.load_scenario("cached")
+        assert reloaded['market_conditions']['demand_level'] == 900.0
+        assert loader.get_scenario_info("cached")['tags'] == ['a']
+
+        scenario_file.write_text(json.dumps({'title': 'Second edition',
+                                             'market_conditions': {}}))
+        assert loader.get_scenario_info("cached")['title'] == 'Second edition'
+        assert len(parses) == 2
+
+    def test_scenario_loader_invalidate(self, loader, scenarios_dir):
+        """Test invalidate drops a cached parse the file check cannot detect."""
+        scenario_file = scenarios_dir / "rewritten.json"
+        scenario_file.write_text('{"market_conditions": {}, "title": "One"}')
+        assert loader.read_scenario("rewritten")['title'] == "One"
+
+        st = scenario_file.stat()
+        scenario_file.write_text('{"market_conditions": {}, "title": "Two"}')
+        os.utime(scenario_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert loader.read_scenario("rewritten")['title'] == "One"
+
+        loader.invalidate("rewritten")
+        assert loader.read_scenario("rewritten")['title'] == "Two"
+
+    def test_scenario_template_customization_paths(self, loader, scenarios_dir):
+        """Test template customizations accept dotted and tuple key paths."""
+        (scenarios_dir / "template_base.json").write_text(json.dumps(
+            {'market_conditions': {'demand_level': 1000.0}, 'tags': ['base']}))
+
+        loader.create_scenario_from_template("base", "custom", {
+            'market_conditions.demand_level': 1200.0,
+            ('market_conditions', 'economic_indicators', 'inflation'): 0.05,
+            'difficulty': 'hard'
+        })
+
+        scenario = loader.load_scenario("custom")
+        assert scenario['market_conditions'] == {
+            'demand_level': 1200.0, 'economic_indicators': {'inflation': 0.05}}
+        assert scenario['difficulty'] == 'hard'
+        assert scenario['tags'] == ['base', 'customized']
+        template = loader.load_scenario("template_base")
+        assert template['market_conditions'] == {'demand_level': 1000.0}
+
+    def test_scenario_export_copies_file(self, tmp_path, manager, scenarios_dir):
+        """Test exporting a scenario copies it without changing the current scenario."""
+        source = scenarios_dir / "exported.json"
+        source.write_text('{"market_conditions": {"demand_level": 900.0}}')
+
+        assert manager.export_scenario("exported", str(tmp_path / "copy.json"))
+        assert (tmp_path / "copy.json").read_text() == source.read_text()
+        assert manager.get_current_scenario() is None
+        assert manager.get_scenario_history() == []
+
+        assert manager.export_scenario("exported", str(tmp_path / "pretty.json"),
+                                       normalize=True)
+        pretty = json.loads((tmp_path / "pretty.json").read_text())
+        assert pretty == json.loads(source.read_text())
+        assert manager.import_scenario(str(tmp_path / "pretty.json"), "reimported")
+        assert manager.load_scenario("reimported") == json.loads(source.read_text())
+        assert not manager.import_scenario(str(tmp_path / "missing.json"), "reimported")
+        assert sorted(p.name for p in scenarios_dir.iterdir()) == ["exported.json",
+                                                                   "reimported.json"]
+        assert not manager.export_scenario("missing", str(tmp_path / "missing.json"))
+
+    def test_scenario_metadata_index_reused_until_import(self, tmp_path, manager,
+                                                         scenarios_dir, monkeypatch):
+        """Test scenario filters share one metadata scan until an import."""
+        (scenarios_dir / "starter.json").write_text(json.dumps(
+            {'market_conditions': {}, 'difficulty': 'easy', 'tags': ['intro']}))
+
+        scans = []
+        real_list = manager.loader.list_available_scenarios
+        monkeypatch.setattr(manager.loader, 'list_available_scenarios',
+                            lambda: scans.append(1) or real_list())
+
+        easy = manager.get_scenarios_by_difficulty('easy')
+        assert [s['name'] for s in easy] == ['starter']
+        assert [s['name'] for s in manager.get_scenarios_by_tag('intro')] == ['starter']
+        assert manager.get_scenarios_by_tag('missing') == []
+        assert manager.recommend_scenario('beginner') == 'starter'
+        assert manager.recommend_scenario('intermediate') is None
+        assert len(scans) == 1
+
+        imported = tmp_path / "hard.json"
+        imported.write_text(json.dumps({'market_conditions': {}, 'difficulty': 'hard'}))
+        assert manager.import_scenario(str(imported), "expert")
+        assert manager.recommend_scenario('advanced') == 'expert'
+        (scenarios_dir / "another.json").write_text(json.dumps(
+            {'market_conditions': {}, 'difficulty': 'hard'}))
+        assert manager.recommend_scenario('advanced') == 'another'
+        assert len(manager.get_available_scenarios()) == 3
+        assert len(scans) == 3
+
+    def test_scenario_metadata_index_tracks_file_edits(self, manager, scenarios_dir):
+        """Test in-place scenario edits refresh the index and callers get copies."""
+        scenario_file = scenarios_dir / "starter.json"
+        scenario_file.write_text(json.dumps(
+            {'market_conditions': {}, 'difficulty': 'easy', 'tags': ['intro']}))
+        assert manager.recommend_scenario('beginner') == 'starter'
+
+        listed = manager.get_available_scenarios()
+        listed[0]['title'] = 'Edited'
+        listed[0]['tags'].append('edited')
+        manager.get_scenarios_by_tag('intro')[0]['difficulty'] = 'hard'
+        assert manager.get_available_scenarios()[0]['title'] == 'starter'
+        assert manager.get_scenarios_by_difficulty('easy')[0]['tags'] == ['intro']
+
+        dir_stat = scenario_file.parent.stat()
+        scenario_file.write_text(json.dumps(
+            {'market_conditions': {}, 'difficulty': 'medium',
+             'tags': ['intro', 'rewritten']}))
+        os.utime(scenario_file.parent, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+        assert manager.recommend_scenario('beginner') is None
+        assert manager.recommend_scenario('intermediate') == 'starter'
+        rewritten = manager.get_scenarios_by_tag('rewritten')
+        assert [s['name'] for s in rewritten] == ['starter']
+
+    def test_scenario_market_conditions_applied(self, manager, scenarios_dir):
+        """Test new and switched simulations take the scenario's market conditions."""
+        (scenarios_dir / "boom.json").write_text(json.dumps(
+            {'market_conditions': {'demand_level': 1500.0, 'price_index': 1.2},
+             'simulation_config': {'max_rounds': 6}}))
+        (scenarios_dir / "bust.json").write_text(json.dumps(
+            {'market_conditions': {'demand_level': 600.0,
+                                   'trend_factors': {'seasonal': 0.9}},
+             'simulation_config': {'max_rounds': 6}}))
+
+        engine = manager.create_new_simulation_from_scenario("boom")
+        market_state = engine.current_state.market.state
+        assert (market_state.demand_level, market_state.price_index) == (1500.0, 1.2)
+
+        company = engine.current_state.player_company
+        assert manager.switch_scenario_during_simulation("bust", engine)
+        market_state = engine.current_state.market.state
+        assert (market_state.demand_level, market_state.price_index) == (600.0, 1.0)
+        assert market_state.trend_factors['seasonal'] == 0.9
+        assert engine.current_state.player_company is company
+        switch_entry = manager.get_scenario_history()[-1]
+        assert switch_entry['action'] == 'switched_during_simulation'
+        assert switch_entry['preserved_company'] is True
+        assert isinstance(switch_entry['switched_at'], datetime)
+        assert engine.config.max_rounds == 6
+        reloaded = manager.create_new_simulation_from_scenario("boom")
+        assert engine.config is reloaded.config
+
+    def test_scenario_switch_failure_is_logged(self, manager, caplog):
+        """Test a failed scenario switch is reported through logging."""
+        engine = SimulationEngine()
+        with caplog.at_level('ERROR', logger='modules.scenarios.scenario_manager'):
+            assert not manager.switch_scenario_during_simulation("missing", engine)
+        assert "Error switching to scenario missing" in caplog.text
+        assert manager.get_scenario_history() == []
+
+    def test_scenario_history_is_bounded(self, scenarios_dir):
+        """Test the scenario history keeps only the most recent entries."""
+        manager = ScenarioManager(str(scenarios_dir), history_limit=2)
+        for name in ("first", "second", "third"):
+            (scenarios_dir / f"{name}.json").write_text('{"market_conditions": {}}')
+            manager.load_scenario(name)
+
+        history = manager.get_scenario_history()
+        assert [entry['scenario_name'] for entry in history] == ["second", "third"]
+        assert set(history[-1]) == {'scenario_name', 'loaded_at', 'action'}
+        history.clear()
+        assert len(manager.get_scenario_history()) == 2
+
+    def test_scenario_managers_share_loader(self, tmp_path, manager, scenarios_dir):
+        """Test managers of the same directory share one loader and its caches."""
+        second = ScenarioManager(str(scenarios_dir / ".." / "scenarios"))
+
+        assert manager.loader is second.loader
+        assert ScenarioManager(str(tmp_path / "other")).loader is not manager.loader
+        assert second.get_scenario_history() == []
+
 
 class TestAnalyticsPersistence:
     """Test analytics data persistence."""
@@ -247,6 +635,263 @@ class TestAnalyticsPersistence:
         assert 'leaderboard_stats' in export_data
 
 
+class TestDataSerializer:
+    """Test DataSerializer and the component persistence helpers built on it."""
+
+    def test_json_compact_by_default(self, tmp_path, sample_company):
+        """Test saves are compact unless pretty output is requested."""
+        serializer = DataSerializer(str(tmp_path))
+        persistence = CompanyPersistence(serializer)
+
+        compact_path = persistence.save_company_snapshot(sample_company, 1)
+        pretty_path = persistence.save_company_snapshot(sample_company, 2, pretty=True)
+
+        compact_text = Path(compact_path).read_text()
+        assert '\n' not in compact_text
+        assert ', ' not in compact_text.replace(sample_company.name, '')
+        assert '\n  "id"' in Path(pretty_path).read_text()
+        assert persistence.load_company(f"company_{sample_company.id}_round_1").name == sample_company.name
+
+    def test_datetimes_parsed_only_on_request(self, tmp_path, sample_company):
+        """Test loads keep ISO strings unless metadata parsing is requested."""
+        serializer = DataSerializer(str(tmp_path))
+        CompanyPersistence(serializer).save_company(sample_company, "company_dt")
+
+        raw = serializer.deserialize_from_json("company_dt")
+        parsed = serializer.deserialize_from_json("company_dt", parse_datetimes=True)
+
+        assert isinstance(raw['_metadata']['saved_at'], int)
+        assert isinstance(parsed['_metadata']['saved_at'], datetime)
+        assert serializer.parse_datetime("2024-01-02T03:04:05") == datetime(2024, 1, 2, 3, 4, 5)
+        assert serializer.parse_datetime("2024-13-45T00:00:00") == "2024-13-45T00:00:00"
+        assert serializer.parse_datetime("Acme") == "Acme"
+
+    def test_listing_reuses_cached_headers(self, tmp_path, sample_company, monkeypatch):
+        """Test company listings parse each file once until it changes."""
+        serializer = DataSerializer(str(tmp_path))
+        persistence = CompanyPersistence(serializer)
+        persistence.save_company(sample_company, "company_cached")
+
+        calls = []
+        original = serializer.deserialize_from_json
+        monkeypatch.setattr(serializer, 'deserialize_from_json',
+                            lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+
+        first = persistence.list_company_saves()
+        second = persistence.list_company_saves()
+        assert len(calls) == 1
+        assert first[0]['company_name'] == second[0]['company_name'] == sample_company.name
+        assert isinstance(second[0]['saved_at'], datetime)
+
+        sample_company.name = "Renamed Company"
+        persistence.save_company(sample_company, "company_cached")
+        assert persistence.list_company_saves()[0]['company_name'] == "Renamed Company"
+        assert len(calls) == 2
+
+    def test_load_multiple_companies_keeps_order(self, tmp_path, sample_company,
+                                                 monkeypatch):
+        """Test companies load back in the order they were saved."""
+        from modules.core.company import Company
+        persistence = CompanyPersistence(DataSerializer(str(tmp_path)))
+        companies = [sample_company, Company("second", "Second Co"), Company("third", "Third Co")]
+        batches = []
+        write_many = persistence.serializer._write_many
+        monkeypatch.setattr(persistence.serializer, '_write_many',
+                            lambda pairs: batches.append(pairs) or write_many(pairs))
+        persistence.save_multiple_companies(companies, "companies_multi")
+        assert [path.name for path, _ in batches[0]] == ["companies_multi.json"]
+        # Records are streamed to the file, never joined into one payload
+        assert not isinstance(batches[0][0][1], bytes)
+
+        loaded = persistence.load_multiple_companies("companies_multi")
+
+        assert [c.id for c in loaded] == [c.id for c in companies]
+        assert loaded[0].financial_data.cash == sample_company.financial_data.cash
+
+    def test_find_company_snapshots_matches_exact_id(self, tmp_path, sample_company):
+        """Test snapshot lookup ignores other companies sharing an id prefix."""
+        from modules.core.company import Company
+        persistence = CompanyPersistence(DataSerializer(str(tmp_path)))
+        other = Company(f"{sample_company.id}0", "Other Co")
+        for round_number in (3, 1, 2):
+            persistence.save_company_snapshot(sample_company, round_number)
+        persistence.save_company_snapshot(other, 5)
+        persistence.save_company(sample_company)
+
+        snapshots = persistence.find_company_snapshots(sample_company.id)
+
+        assert [s['round_number'] for s in snapshots] == [1, 2, 3]
+        assert len(persistence.list_company_saves()) == 5
+
+    def test_load_cached_reuses_parse_until_file_changes(self, tmp_path):
+        """Test cached loads skip re-parsing until the file is rewritten."""
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_to_json({'round_number': 1}, "cached")
+
+        first = serializer.load_cached("cached")
+        assert serializer.load_cached("cached") is first
+        assert serializer.peek_header("cached") == {'round_number': 1}
+
+        serializer.serialize_to_json({'round_number': 2}, "cached")
+        assert serializer.load_cached("cached") == {'round_number': 2}
+
+        serializer.delete_save_file("cached")
+        with pytest.raises(FileNotFoundError):
+            serializer.load_cached("cached")
+
+    def test_compare_market_states(self, tmp_path, sample_market):
+        """Test market comparisons read both rounds' saved state."""
+        from modules.persistence.market_persistence import MarketPersistence
+        persistence = MarketPersistence(DataSerializer(str(tmp_path)))
+        persistence.save_market(sample_market, "market_round_1")
+        sample_market.state.demand_level += 250.0
+        persistence.save_market(sample_market, "market_round_2")
+
+        comparison = persistence.compare_market_states(1, 2)
+
+        assert comparison['demand_change'] == pytest.approx(250.0)
+        assert comparison['price_index_change'] == 0
+        assert set(comparison['economic_changes']) == set(sample_market.state.economic_indicators)
+        assert 'error' in persistence.compare_market_states(1, 3)
+
+    def test_market_history_logs_unreadable_snapshots(self, tmp_path, sample_market,
+                                                      caplog):
+        """Test market history skips corrupted snapshots and reports them."""
+        from modules.persistence.market_persistence import MarketPersistence
+        persistence = MarketPersistence(DataSerializer(str(tmp_path)))
+        persistence.save_market(sample_market, "market_round_1")
+        (tmp_path / "market_round_2.json").write_text("{not json")
+
+        logger_name = 'modules.persistence.market_persistence'
+        with caplog.at_level('WARNING', logger=logger_name):
+            history = persistence.get_market_history()
+        assert len(history) == 1
+        assert "market_round_2" in caplog.text
+
+    def test_serialize_records_to_json(self, tmp_path):
+        """Test record-at-a-time saves produce the same JSON document."""
+        serializer = DataSerializer(str(tmp_path))
+        records = [{'id': 1, 'tags': ['a']}, {'id': 2, 'tags': []}]
+
+        serializer.serialize_records_to_json('items', iter(records), {'_metadata': {'count': 2}}, "records")
+        serializer.serialize_records_to_json('items', [], {}, "empty")
+
+        assert serializer.deserialize_from_json("records") == {'items': records, '_metadata': {'count': 2}}
+        assert serializer.deserialize_from_json("empty") == {'items': []}
+
+    def test_scan_save_files_reuses_entry_stat(self, tmp_path):
+        """Test scanned entries feed get_file_info and peek_header directly."""
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_to_json({'round_number': 4}, "market_round_4")
+        serializer.serialize_to_json({}, "company_x")
+        (tmp_path / "market_notes.txt").write_text("not a save")
+
+        entries = serializer.scan_save_files('json', 'market_')
+
+        assert [entry.name for entry in entries] == ["market_round_4.json"]
+        assert serializer.list_save_files('json', 'market_') == ["market_round_4"]
+        info = serializer.get_file_info(entries[0])
+        assert info['filename'] == "market_round_4"
+        assert info == serializer.get_file_info("market_round_4")
+        assert serializer.peek_header(entries[0]) == {'round_number': 4}
+        assert serializer.get_file_info("missing") is None
+
+    def test_save_companies_bulk(self, tmp_path, sample_company):
+        """Test bulk company saves load back as individual company files."""
+        from modules.core.company import Company
+        persistence = CompanyPersistence(DataSerializer(str(tmp_path)))
+        companies = [sample_company, Company("second", "Second Co")]
+
+        paths = persistence.save_companies_bulk(companies, "company_bulk")
+
+        assert set(paths) == {sample_company.id, "second"}
+        loaded = persistence.load_company(f"company_bulk_{sample_company.id}")
+        assert loaded.name == sample_company.name
+        assert Path(paths["second"]).name == "company_bulk_second.json"
+
+    def test_backup_is_independent_copy(self, tmp_path):
+        """Test backups keep their content when the original is rewritten."""
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_to_json({'round_number': 1}, "market_round_1")
+
+        backup_path = Path(serializer.create_backup("market_round_1"))
+        serializer.serialize_to_json({'round_number': 2}, "market_round_1")
+
+        assert json.loads(backup_path.read_text()) == {'round_number': 1}
+
+    def test_parallel_reads_keep_order_and_skip_bad_files(self, tmp_path):
+        """Test batched reads return results in order with None for bad files."""
+        serializer = DataSerializer(str(tmp_path))
+        for round_number in range(1, 6):
+            serializer.serialize_to_json({'round_number': round_number}, f"market_round_{round_number}")
+        (tmp_path / "market_round_3.json").write_text("{not json")
+        names = [f"market_round_{n}" for n in range(1, 7)]
+
+        loaded = serializer.load_many_cached(names)
+        headers = serializer.peek_headers(serializer.scan_save_files('json', 'market_'))
+
+        assert loaded == [{'round_number': 1}, {'round_number': 2}, None,
+                          {'round_number': 4}, {'round_number': 5}, None]
+        assert sum(header is None for header in headers) == 1
+
+    def test_compressed_snapshot_round_trip(self, tmp_path, sample_company):
+        """Test compressed snapshots replace plain saves and load transparently."""
+        serializer = DataSerializer(str(tmp_path))
+        persistence = CompanyPersistence(serializer)
+        persistence.save_company_snapshot(sample_company, 1)
+
+        path = persistence.save_company_snapshot(sample_company, 1, compress=True)
+
+        assert path.endswith(('.json.zst', '.json.gz'))
+        assert not (tmp_path / f"company_{sample_company.id}_round_1.json").exists()
+        assert persistence.load_company(f"company_{sample_company.id}_round_1").name == sample_company.name
+        snapshots = persistence.find_company_snapshots(sample_company.id)
+        assert [s['round_number'] for s in snapshots] == [1]
+        assert snapshots[0]['company_name'] == sample_company.name
+        assert serializer.delete_save_file(f"company_{sample_company.id}_round_1")
+        assert not Path(path).exists()
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        """Test a save that fails mid-write leaves the old save untouched."""
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_records_to_json('items', [1, 2], {}, "atomic")
+
+        def failing_records():
+            yield 3
+            raise RuntimeError("encoder failure")
+
+        with pytest.raises(RuntimeError):
+            serializer.serialize_records_to_json('items', failing_records(), {}, "atomic")
+
+        assert serializer.deserialize_from_json("atomic") == {'items': [1, 2]}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["atomic.json"]
+
+    def test_sync_flushes_each_written_file_once(self, tmp_path):
+        """Test sync covers every save written since the previous sync."""
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_to_json({'round': 1}, "batched")
+        serializer.serialize_to_json({'round': 2}, "batched")
+        serializer.save_metadata_sidecar("batched", {'round': 2})
+        serializer.serialize_to_json({}, "removed")
+        serializer.delete_save_file("removed")
+
+        assert serializer.sync() == 2
+        assert serializer.sync() == 0
+        assert serializer.deserialize_from_json("batched") == {'round': 2}
+
+    def test_large_saves_parse_from_memory_map(self, tmp_path, monkeypatch):
+        """Test saves over the mmap threshold load the same as small ones."""
+        from modules.persistence import data_serializer
+        if data_serializer.orjson is None:
+            pytest.skip("memory-mapped parsing needs orjson")
+        serializer = DataSerializer(str(tmp_path))
+        serializer.serialize_to_json({'rows': list(range(100))}, "large")
+        monkeypatch.setattr(data_serializer, 'MMAP_READ_THRESHOLD', 1)
+        monkeypatch.setattr(serializer, '_read_json_bytes', lambda path: pytest.fail("save was read"))
+
+        assert serializer.deserialize_from_json("large") == {'rows': list(range(100))}
+
+
 class TestFileSystemOperations:
     """Test file system operations for persistence."""
 
@@ -3,8 +3,12 @@ Unit tests for the Simulation Engine module.
 Tests simulation initialization, round processing, saving/loading, and state management.
 """
 
+import dataclasses
+import json
+import numpy as np
 import pytest
 import os
+import sys
 import tempfile
 from modules.core.simulation_engine import SimulationEngine, SimulationConfig
 from modules.core.simulation_state import SimulationState
@@ -37,6 +41,22 @@ class TestSimulationConfig:
         assert config.market_volatility == 0.2
         assert config.event_frequency == 0.5
 
+    def test_simulation_config_is_immutable(self):
+        """Test SimulationConfig cannot be modified in place."""
+        config = SimulationConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_rounds = 20
+
+        updated = dataclasses.replace(config, max_rounds=20)
+        assert updated.max_rounds == 20
+        assert config.max_rounds == 10
+
+    def test_simulation_config_to_dict_round_trip(self):
+        """Test SimulationConfig serializes to a dict it can be rebuilt from."""
+        config = SimulationConfig(max_rounds=7, market_volatility=0.2)
+        assert SimulationConfig(**config.to_dict()) == config
+        assert config.to_dict() == dataclasses.asdict(config)
+
 
 class TestSimulationEngine:
     """Test SimulationEngine class."""
@@ -125,6 +145,28 @@ class TestSimulationEngine:
         # Check that decisions were processed (decisions are stored in company decision history)
         assert len(sample_simulation_engine.current_state.player_company.decision_manager.decision_history) > 0
 
+    def test_run_sweep_matches_run_round_arithmetic(self, sample_simulation_engine):
+        """Test sweep profits agree with the round manager's per-decision results."""
+        prices = np.array([[80.0, 120.0], [100.0, 200.0]])
+        budgets = np.array([[0.0, 2500.0], [4000.0, 20000.0]])
+
+        profits = sample_simulation_engine.run_sweep(prices, budgets)
+
+        round_manager = sample_simulation_engine.round_manager
+        for (i, r), price in np.ndenumerate(prices):
+            decisions = round_manager.process_decisions({
+                'pricing': {'price': price},
+                'marketing': {'budget': budgets[i, r]}
+            })
+            expected = round_manager.calculate_round_results(None, decisions)['profit']
+            assert profits[i, r] == pytest.approx(expected)
+
+    def test_run_sweep_rejects_too_many_rounds(self, sample_simulation_engine):
+        """Test sweeps cannot run past the configured round limit."""
+        too_long = np.full((1, sample_simulation_engine.config.max_rounds + 1), 100.0)
+        with pytest.raises(ValueError):
+            sample_simulation_engine.run_sweep(too_long, np.zeros_like(too_long))
+
     def test_get_current_state(self, sample_simulation_engine):
         """Test getting current simulation state."""
         # No state initially
@@ -137,6 +179,91 @@ class TestSimulationEngine:
         assert state is not None
         assert isinstance(state, SimulationState)
 
+    def test_state_to_dict_reflects_direct_changes(self, sample_simulation_engine):
+        """Test to_dict picks up in-place state changes without any invalidation."""
+        state = sample_simulation_engine.initialize_simulation()
+
+        first = state.to_dict()
+        first['kpis']['profit'] = None  # Callers get their own containers
+        assert state.to_dict()['kpis'] != first['kpis']
+
+        state.player_company.name = 'Renamed Company'
+        state.kpis['profit'] = 123.0
+        assert state.to_dict()['player_company']['name'] == 'Renamed Company'
+        assert state.to_dict()['kpis']['profit'] == 123.0
+
+    def test_run_round_result_is_shallow_copy_of_history(self, sample_simulation_engine):
+        """Test replacing entries of the returned game state leaves history intact."""
+        sample_simulation_engine.initialize_simulation()
+        game_state = sample_simulation_engine.run_round({})['game_state']
+        recorded = sample_simulation_engine.simulation_history[-1]
+        assert game_state is not recorded
+        assert game_state['player_company'] is recorded['player_company']
+
+        game_state['player_company'] = {'name': 'Edited'}
+        game_state['kpis'] = {}
+
+        assert recorded['player_company']['name'] != 'Edited'
+        assert recorded['kpis']
+
+    def test_competitor_snapshot_shared_until_changed(self, sample_simulation_engine):
+        """Test history entries share one competitor snapshot that is detached from the live list."""
+        sample_simulation_engine.initialize_simulation()
+        sample_simulation_engine.run_round({})
+        first, second = list(sample_simulation_engine.simulation_history)[:2]
+        assert first['competitors'] is second['competitors']
+
+        state = sample_simulation_engine.current_state
+        state.competitors[0]['market_share'] = 0.3
+        assert first['competitors'][0]['market_share'] != 0.3
+
+        # Replacing the list takes a new snapshot
+        state.competitors = [dict(state.competitors[0], market_share=0.4)]
+        assert state.to_dict()['competitors'] == [state.competitors[0]]
+        assert first['competitors'][0]['market_share'] != 0.4
+
+    def test_state_events_from_triggered_events(self, sample_simulation_engine,
+                                                monkeypatch):
+        """Test a round's triggered-event records provide the state's events."""
+        state = sample_simulation_engine.initialize_simulation()
+        event_manager = sample_simulation_engine.event_manager
+        crash = event_manager.event_definitions['market_crash']
+        monkeypatch.setattr(event_manager, 'generate_random_events',
+                            lambda round_number: [crash])
+
+        triggered = sample_simulation_engine.run_round({})['triggered_events']
+        assert state.events == [record['event'] for record in triggered]
+        assert state.events[0]['id'] == 'market_crash'
+        assert state.to_dict()['events'] == state.events
+
+        state.events = []
+        assert state.events == []
+
+    def test_state_events_is_a_dataclass_field(self, sample_simulation_engine):
+        """Test events takes part in fields, replace, equality and repr."""
+        state = sample_simulation_engine.initialize_simulation()
+        crash = {'id': 'market_crash', 'impact': {'revenue': -0.3}}
+        assert 'events' in [f.name for f in dataclasses.fields(SimulationState)]
+
+        replaced = dataclasses.replace(state, events=[crash])
+        assert replaced.events == [crash]
+        assert replaced != state
+        assert "market_crash" in repr(replaced)
+
+        state.events = [crash]
+        assert replaced == state
+        assert dataclasses.replace(state).events == [crash]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_state_uses_slots(self, sample_simulation_engine):
+        """Test SimulationState snapshots carry no per-instance __dict__."""
+        state = sample_simulation_engine.initialize_simulation()
+        assert not hasattr(state, '__dict__')
+
+        restored = SimulationState.from_dict(state.to_dict())
+        assert restored.round_number == state.round_number
+        assert restored.player_company.name == state.player_company.name
+
     def test_save_simulation(self, sample_simulation_engine, tmp_path):
         """Test saving simulation."""
         # Initialize and run a round
@@ -153,6 +280,17 @@ class TestSimulationEngine:
         save_file = tmp_path / "data" / "saves" / f"{save_name}.json"
         assert save_file.exists()
 
+    def test_state_dict_is_json_native(self, sample_simulation_engine):
+        """Test serialized state needs no fallback encoder for its values."""
+        sample_simulation_engine.initialize_simulation()
+        sample_simulation_engine.current_state.player_company.make_decision('marketing_campaign', {'budget': 5000.0})
+        sample_simulation_engine.run_round({'pricing': {'price': 110.0}})
+
+        company = sample_simulation_engine.current_state.player_company
+        assert company.performance_history and company.decision_manager.decision_history
+
+        json.dumps(sample_simulation_engine.current_state.to_dict())
+
     def test_save_simulation_no_state(self, sample_simulation_engine):
         """Test saving simulation without active state."""
         success = sample_simulation_engine.save_simulation("test_save")
@@ -262,6 +400,16 @@ class TestSimulationEngine:
         assert round_results['market_share'] == 0.17  # 0.15 + 0.02
         assert round_results['customer_satisfaction'] == 0.8  # Unchanged
 
+    def test_apply_event_impacts_generic_metric(self, sample_simulation_engine):
+        """Test metrics outside the fixed schema get a percentage impact."""
+        round_results = {'revenue': 1000.0, 'units_sold': 200.0, 'summary': 'Round 1 completed'}
+
+        sample_simulation_engine._apply_event_impacts(round_results, {'units_sold': 0.5, 'demand': 0.25})
+
+        assert round_results['units_sold'] == 300.0
+        assert round_results['revenue'] == 1000.0
+        assert 'market_share' not in round_results
+
     def test_apply_round_results_to_company(self, sample_simulation_engine):
         """Test applying round results to company state."""
         sample_simulation_engine.initialize_simulation()
@@ -351,6 +499,109 @@ class TestSimulationIntegration:
         assert loaded_state.player_company.name == original_state.player_company.name
         assert loaded_state.market.state.demand_level == original_state.market.state.demand_level
 
+    def test_run_round_follows_reload(self, sample_simulation_engine):
+        """Test rounds resume from the loaded position in an engine that already ran."""
+        engine = sample_simulation_engine
+        engine.initialize_simulation()
+        engine.run_round({})
+        assert 'run_round' not in vars(engine)
+
+        save_name = "specialized_round_test"
+        try:
+            assert engine.save_simulation(save_name)
+            engine.run_round({})
+            round_manager = engine.round_manager
+            engine.load_simulation(save_name)
+
+            assert engine.round_manager is round_manager
+            round_manager.is_simulation_over = lambda: True
+            result = engine.run_round({})
+            assert result['round_number'] == 2
+            assert result['is_simulation_over']
+            assert engine.round_manager.get_current_round() == 2
+        finally:
+            if os.path.exists(f'data/saves/{save_name}.json'):
+                os.remove(f'data/saves/{save_name}.json')
+
+    def test_streamed_history_save_load_cycle(self, tmp_path):
+        """Test history streamed to disk keeps only a window in memory and survives a reload."""
+        history_file = tmp_path / "history.jsonl"
+        engine = SimulationEngine(history_path=str(history_file), history_window=2)
+        engine.initialize_simulation()
+        for _ in range(3):
+            engine.run_round({})
+
+        assert len(engine.simulation_history) == 2
+        assert [entry['round_number'] for entry in engine.iter_history()] == [0, 1, 2, 3]
+
+        save_name = "streamed_history_test"
+        later_save = "streamed_history_later_test"
+        try:
+            assert engine.save_simulation(save_name)
+            engine.run_round({})  # Recorded after the save, kept for the later save
+            assert engine.save_simulation(later_save)
+            engine.close_history()
+            original_log = history_file.read_bytes()
+
+            new_engine = SimulationEngine(history_window=2)
+            new_engine.load_simulation(save_name)
+            rounds = [entry['round_number'] for entry in new_engine.iter_history()]
+            assert rounds == [0, 1, 2, 3]
+            assert history_file.read_bytes() == original_log
+
+            new_engine.run_round({})
+            new_engine.close_history()
+
+            # The continued run forks into a new file; the shared log is untouched
+            assert new_engine.history_path == str(tmp_path / "history.1.jsonl")
+            assert history_file.read_bytes() == original_log
+            assert [entry['round_number'] for entry in new_engine.iter_history()] == [0, 1, 2, 3, 4]
+            assert new_engine.get_simulation_summary()['simulation_history_length'] == 5
+
+            later_engine = SimulationEngine()
+            later_engine.load_simulation(later_save)
+            rounds = [entry['round_number'] for entry in later_engine.iter_history()]
+            assert rounds == [0, 1, 2, 3, 4]
+            later_engine.close_history()
+        finally:
+            for name in (save_name, later_save):
+                if os.path.exists(f'data/saves/{name}.json'):
+                    os.remove(f'data/saves/{name}.json')
+
+    def test_new_simulation_keeps_previous_history_file(self, tmp_path):
+        """Test a new game never truncates history an earlier save references."""
+        history_file = tmp_path / "history.jsonl"
+        engine = SimulationEngine(history_path=str(history_file))
+        engine.initialize_simulation()
+        engine.run_round({})
+        saved = engine.history_save_data()
+        original_log = history_file.read_bytes()
+
+        engine.initialize_simulation()
+        engine.close_history()
+        assert engine.history_path == str(tmp_path / "history.1.jsonl")
+        assert history_file.read_bytes() == original_log
+        assert [entry['round_number'] for entry in engine.iter_history()] == [0]
+
+        engine.restore_history(saved)
+        engine.close_history()
+        assert [entry['round_number'] for entry in engine.iter_history()] == [0, 1]
+
+    def test_streamed_history_missing_file(self, tmp_path):
+        """Test loading a save whose history file is gone starts an empty history."""
+        history_file = tmp_path / "history.jsonl"
+        engine = SimulationEngine(history_path=str(history_file))
+        engine.initialize_simulation()
+        engine.close_history()
+        history_file.unlink()
+
+        engine.restore_history({'history_path': str(history_file),
+                                'history_entries': 3})
+        assert engine.get_simulation_summary()['simulation_history_length'] == 0
+        engine.run_round({})
+        engine.close_history()
+        assert [entry['round_number'] for entry in engine.iter_history()] == [1]
+
     def test_event_processing(self, sample_simulation_engine):
         """Test event processing during simulation."""
         sample_simulation_engine.initialize_simulation()
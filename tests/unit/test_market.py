@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 import pytest
 from modules.core.market import (
     Market, MarketState, DemandCalculator, PricingEngine,
@@ -14,8 +15,8 @@ class TestMarketState:
         assert state.demand_level == 1000.0
         assert state.price_index == 1.0
         assert state.competition_intensity == 0.5
-        assert isinstance(state.economic_indicators, dict)
-        assert isinstance(state.trend_factors, dict)
+        assert isinstance(state.economic_indicators, Mapping)
+        assert isinstance(state.trend_factors, Mapping)
 
     def test_market_state_custom_values(self):
         """Test creating MarketState with custom values."""
@@ -33,8 +34,13 @@ class TestMarketState:
         assert state.demand_level == 1200.0
         assert state.price_index == 1.1
         assert state.competition_intensity == 0.7
-        assert state.economic_indicators == economic_indicators
-        assert state.trend_factors == trend_factors
+        assert state.gdp_growth == 0.03
+        assert state.inflation == 0.02
+        assert state.seasonal == 0.1
+        assert state.trend == 0.05
+        # Indicators not supplied keep their defaults
+        assert state.economic_indicators == {**economic_indicators, 'interest_rate': 0.05}
+        assert state.trend_factors == {**trend_factors, 'cyclical': 0.0}
 
 
 class TestDemandCalculator: